@@ -0,0 +1,94 @@
+"""
+Measure the import time of the CLI with ``python -X importtime``.
+
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --max-ms 300
+
+Exits with 1 if a heavy dependency is imported at startup, or if the
+import takes longer than ``--max-ms``.
+"""
+import argparse
+import re
+import subprocess
+import sys
+import typing as t
+
+# Only needed for fetching data, exporting reports and AI analysis
+HEAVY_MODULES = (
+    "aiohttp",
+    "jinja2",
+    "numpy",
+    "openai",
+    "pyecharts",
+    "requests",
+    "rich.progress",
+    "urllib3",
+)
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| *(\S+)$")
+
+
+class ImportTime(t.NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure_import_times(module: str) -> t.List[ImportTime]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = []
+    for line in process.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, name = match.groups()
+            import_times.append(ImportTime(name, int(self_us), int(cumulative_us)))
+    return import_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="opendigger_pycli.cli")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    def get_total_us(import_times: t.List[ImportTime]) -> int:
+        return next(
+            item.cumulative_us for item in import_times if item.name == args.module
+        )
+
+    # The fastest run has the least noise from the rest of the system
+    import_times = min(
+        (measure_import_times(args.module) for _ in range(args.repeat)),
+        key=get_total_us,
+    )
+    total_us = get_total_us(import_times)
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms")
+    print(f"slowest of {len(import_times)} modules by cumulative time:")
+    for item in sorted(import_times, key=lambda item: -item.cumulative_us)[: args.top]:
+        print(
+            f"{item.cumulative_us / 1000:8.1f} ms {item.self_us / 1000:8.1f} ms "
+            f"{item.name}"
+        )
+
+    imported = {item.name for item in import_times}
+    heavy_imported = [name for name in HEAVY_MODULES if name in imported]
+    failed = False
+    if heavy_imported:
+        print(f"heavy modules imported at startup: {', '.join(heavy_imported)}")
+        failed = True
+    if args.max_ms is not None and total_us / 1000 > args.max_ms:
+        print(f"import time is over {args.max_ms} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare the JSON decoders on OpenDigger payloads.
+
+Recorded payloads are JSON files, e.g. a mirror created by
+``opendigger mirror sync -r X-lab2017/open-digger -y 2023 -d mirror``:
+
+    python benchmarks/bench_json_decode.py mirror/
+
+Without paths, a generated network payload is used.
+"""
+import argparse
+import json
+import random
+import timeit
+import typing as t
+from pathlib import Path
+
+from opendigger_pycli.utils.json_decoder import JSON_DECODERS
+
+
+def generate_network_payload(node_count: int = 5000, edge_count: int = 50000) -> bytes:
+    """A payload shaped like developer_network.json"""
+    rng = random.Random(0)
+    nodes = [
+        [f"developer-{i}", round(rng.uniform(0, 100), 2)] for i in range(node_count)
+    ]
+    edges = [
+        [
+            f"developer-{rng.randrange(node_count)}",
+            f"developer-{rng.randrange(node_count)}",
+            round(rng.uniform(0, 10), 2),
+        ]
+        for _ in range(edge_count)
+    ]
+    return json.dumps({"nodes": nodes, "edges": edges}).encode()
+
+
+def load_payloads(paths: t.List[Path]) -> t.Dict[str, bytes]:
+    payloads = {}
+    for path in paths:
+        files = sorted(path.rglob("*.json")) if path.is_dir() else [path]
+        for file in files:
+            payloads[str(file)] = file.read_bytes()
+    return payloads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", type=Path, help="JSON files or dirs")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = (
+        load_payloads(args.paths)
+        if args.paths
+        else {"generated developer_network": generate_network_payload()}
+    )
+    total_size = sum(len(body) for body in payloads.values())
+    print(f"{len(payloads)} payloads, {total_size / 1024 / 1024:.1f} MiB")
+
+    timings = {}
+    for name, import_decoder in JSON_DECODERS.items():
+        try:
+            loads = import_decoder()
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+        timings[name] = min(
+            timeit.repeat(
+                lambda: [loads(body) for body in payloads.values()],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+
+    for name, seconds in timings.items():
+        print(
+            f"{name:>8}: {seconds * 1000:8.1f} ms, "
+            f"{total_size / seconds / 1024 / 1024:7.1f} MiB/s, "
+            f"{timings['json'] / seconds:4.1f}x json"
+        )
+
+
+if __name__ == "__main__":
+    main()
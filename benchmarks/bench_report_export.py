@@ -0,0 +1,90 @@
+"""
+Render HTML reports for many generated repos and track memory and time.
+
+    python benchmarks/bench_report_export.py --repos 500
+
+Memory held after each report and the time per report should stay flat
+as the number of rendered reports grows.
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+import typing as t
+
+from opendigger_pycli.datatypes import (
+    ActivityData,
+    AttentionData,
+    BaseData,
+    ClosedIssueData,
+    NewIssueData,
+    OpenRankData,
+    StarData,
+)
+from opendigger_pycli.exporters import chart_exporter
+from opendigger_pycli.exporters.chart_exporter import ChartReportExporter
+
+INDICATOR_DATACLASSES = [
+    ActivityData,
+    AttentionData,
+    ClosedIssueData,
+    NewIssueData,
+    OpenRankData,
+    StarData,
+]
+
+
+def generate_repo_indicators(rng: random.Random, years: int) -> t.List[t.Any]:
+    return [
+        dataclass(
+            value=[
+                BaseData(year=year, month=month, value=round(rng.uniform(0, 100), 2))
+                for year in range(2023 - years + 1, 2024)
+                for month in range(1, 13)
+            ]
+        )
+        for dataclass in INDICATOR_DATACLASSES
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repos", type=int, default=500)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--every", type=int, default=50, help="print every N repos")
+    args = parser.parse_args()
+
+    # The AI analysis waits on the OpenAI API, it is not part of rendering
+    setattr(chart_exporter, "analyze_indicators_data", lambda indicator_data: {})
+
+    rng = random.Random(0)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    timings: t.List[float] = []
+    print(f"{'repos':>6} {'held MiB':>9} {'ms/report':>10}")
+    for index in range(1, args.repos + 1):
+        indicators = generate_repo_indicators(rng, args.years)
+        started_at = time.perf_counter()
+        exporter = ChartReportExporter()
+        for indicator_data in indicators:
+            exporter.add_indicator_data(indicator_data)
+        html = exporter.export(f"Repo org/repo-{index} Indicator Report")
+        timings.append(time.perf_counter() - started_at)
+        del exporter, indicators, html
+
+        if index % args.every == 0 or index == 1:
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0] - baseline
+            recent = timings[-args.every :]
+            print(
+                f"{index:>6} {held / 1024 / 1024:9.2f} "
+                f"{sum(recent) / len(recent) * 1000:10.1f}"
+            )
+
+    _, peak = tracemalloc.get_traced_memory()
+    print(f"peak: {(peak - baseline) / 1024 / 1024:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,10 @@ from .base import query_cmd as query
 from .commands.config_cmd import config
 from .commands.display_cmd import display
 from .commands.export_cmd import export
+from .commands.mirror_cmd import mirror
 
 opendigger.add_command(config)
+opendigger.add_command(mirror)
 
 query.add_command(display)
 query.add_command(export)
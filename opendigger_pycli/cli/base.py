@@ -1,22 +1,34 @@
+import contextlib
 import typing as t
 
 import click
-from click_plugins import with_plugins
-from pkg_resources import iter_entry_points  # type: ignore
 
+from opendigger_pycli.config.utils import get_query_concurrency
 from opendigger_pycli.console import CONSOLE
 from opendigger_pycli.console.print_base_info import (
     print_indicator_info,
     print_repo_info,
     print_user_info,
 )
-from opendigger_pycli.results.query import RepoQueryResult, UserQueryResult
+from opendigger_pycli.dataloaders.cache import configure_response_cache
+from opendigger_pycli.dataloaders.sources import configure_data_source
+from opendigger_pycli.dataloaders.utils import (
+    configure_columnar_series,
+    configure_network_options,
+)
+from opendigger_pycli.results.query import (
+    RepoQueryResult,
+    UserQueryResult,
+    report_nodata_indicators,
+)
+from opendigger_pycli.results.scheduler import schedule_query_results
 from opendigger_pycli.utils.decorators import (
     pass_filtered_dataloaders,
     process_commands,
 )
 
 from .custom_types import (
+    DATA_SOURCE_TYPE,
     FILTERED_METRIC_QUERY_TYPE,
     GH_REPO_NAME_TYPE,
     GH_USERNAME_TYPE,
@@ -24,6 +36,7 @@ from .custom_types import (
     INDICATOR_QUERY_TYPE,
 )
 from .env import Environment
+from .plugins import PluginGroup
 from .utils import (
     add_indicator_type,
     add_introducer,
@@ -34,6 +47,7 @@ from .utils import (
 if t.TYPE_CHECKING:
     from click import Group
 
+    from opendigger_pycli.dataloaders.sources import DataSource
     from opendigger_pycli.datatypes import DataloaderProto, IndicatorQuery
 
 
@@ -52,13 +66,42 @@ pass_environment = click.make_pass_decorator(Environment, ensure=True)
     type=click.Choice(["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
     help="Enables verbose mode.",
 )
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="Do not read or write the local cache of OpenDigger data.",
+)
+@click.option(
+    "--refresh",
+    "refresh",
+    is_flag=True,
+    default=False,
+    help="Revalidate cached OpenDigger data with the server.",
+)
+@click.option(
+    "--data-source",
+    "data_source",
+    type=DATA_SOURCE_TYPE,
+    help="Load OpenDigger data from a URL, a mirror directory or a zip archive "
+    "of a mirror instead of the configured data source.",
+    metavar="<URL|DIR|ZIP>",
+)
 @pass_environment
 def opendigger(
     env: Environment,
     log_level: t.Literal["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    no_cache: bool,
+    refresh: bool,
+    data_source: t.Optional["DataSource"],
 ) -> None:
     """Open Digger CLI"""
     env.set_log_level(log_level)
+    configure_response_cache(enabled=False if no_cache else None, refresh=refresh)
+    configure_data_source(data_source)
+    configure_network_options(None)
+    configure_columnar_series(None)
 
 
 opendigger_cmd = t.cast("Group", opendigger)
@@ -137,8 +180,8 @@ def repo(env: Environment, repos: t.List[t.Tuple[str, str]]) -> None:
     env.vlog("Set params to env")
 
 
-@with_plugins(iter_entry_points("opendigger_pycli.plugins"))  # type: ignore
 @click.group(  # type: ignore
+    cls=PluginGroup,
     chain=True,
     help="Query indicators",
     invoke_without_command=True,
@@ -328,39 +371,58 @@ def process_query_results(
         raise click.UsageError("Your query cannot query any indicators.")
 
     mode = env.mode  # This is assigned in the repo command
-    results: t.Union[t.List[UserQueryResult], t.List[RepoQueryResult]]
+    results: t.Union[
+        t.Generator[UserQueryResult, None, None],
+        t.Generator[RepoQueryResult, None, None],
+    ]
     if mode == "user":
         usernames = t.cast(t.List[str], env.params)
         # build result
         env.vlog("Fetching user indicators data...")
-        results = [
-            UserQueryResult(
+        results = schedule_query_results(
+            usernames,
+            lambda username, progress: UserQueryResult(
                 username=username,
                 dataloaders=dataloaders,
                 indicator_queries=selected_indicator_queries,
                 uniform_query=uniform_query,
-            )
-            for username in usernames
-        ]
+                progress=progress,
+            ),
+            max_workers=get_query_concurrency(),
+            description="Querying users",
+        )
     else:
         # repo mode
         repos = t.cast(t.List[t.Tuple[str, str]], env.params)
         # build result
         env.vlog("Fetching repo indicators data...")
-        results = [
-            RepoQueryResult(
+        results = schedule_query_results(
+            repos,
+            lambda repo, progress: RepoQueryResult(
                 repo=repo,
                 dataloaders=dataloaders,
                 indicator_queries=selected_indicator_queries,
                 uniform_query=uniform_query,
-            )
-            for repo in repos
-        ]
-
-    env.vlog("End fetching indicators data...")
-    env.dlog("Query Results:", results)
-
-    return process_commands(processors, results)
+                progress=progress,
+            ),
+            max_workers=get_query_concurrency(),
+            description="Querying repos",
+        )
+
+    def log_results(
+        results: t.Iterable[t.Union[UserQueryResult, RepoQueryResult]]
+    ) -> t.Iterator[t.Union[UserQueryResult, RepoQueryResult]]:
+        for result in results:
+            env.dlog("Query Result:", result)
+            report_nodata_indicators(result)
+            yield result
+        env.vlog("End fetching indicators data...")
+
+    # Query results are streamed to the processors as soon as they are finished.
+    # If a processor fails, the pending queries are cancelled and the progress
+    # is stopped right away instead of when the generator is collected.
+    with contextlib.closing(results):
+        return process_commands(processors, log_results(results))
 
 
 user.add_command(query_cmd)
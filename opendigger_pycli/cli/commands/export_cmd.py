@@ -4,10 +4,18 @@ from pathlib import Path
 import click
 
 from opendigger_pycli.exporters import (
+    CAN_COMPRESS_EXPORT_FORMATS,
     CAN_SPLIT_EXPORT_FORMATS,
+    COLUMNAR_EXPORT_FORMATS,
     SURPPORTED_EXPORT_FORMAT_TYPE,
     SURPPORTED_EXPORT_FORMATS,
 )
+from opendigger_pycli.exporters.columnar_exporter import import_pyarrow
+from opendigger_pycli.exporters.json_writer import (
+    COMPRESSION_TYPE,
+    COMPRESSIONS,
+    check_compression,
+)
 from opendigger_pycli.results.export import ExportResult
 from opendigger_pycli.utils.decorators import processor
 
@@ -42,6 +50,22 @@ if t.TYPE_CHECKING:
     is_flag=True,
     help="Save indicators in separate files, ONLY For JSON format",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes rendering reports in parallel, ONLY For report format",
+)
+@click.option(
+    "--compress",
+    "compression",
+    type=click.Choice(COMPRESSIONS),
+    default=None,
+    help="Compress exported files while they are written, ONLY For JSON and NDJSON format",
+)
 @processor
 @pass_environment
 def export(
@@ -50,9 +74,26 @@ def export(
     format: SURPPORTED_EXPORT_FORMAT_TYPE,
     save_dir: Path,
     is_split: bool,
+    jobs: int,
+    compression: t.Optional[COMPRESSION_TYPE],
 ):
     if is_split and format not in CAN_SPLIT_EXPORT_FORMATS:
         raise click.BadParameter(f"This format {format} does not support split")
+    if compression is not None:
+        if format not in CAN_COMPRESS_EXPORT_FORMATS:
+            raise click.BadParameter(
+                f"This format {format} does not support compression"
+            )
+        try:
+            check_compression(compression)
+        except ImportError as e:
+            raise click.BadParameter(str(e))
+    if format in COLUMNAR_EXPORT_FORMATS:
+        try:
+            import_pyarrow()
+        except ImportError as e:
+            raise click.BadParameter(str(e))
 
-    ExportResult(results, format, save_dir, is_split).export()
-    yield from results
+    yield from ExportResult(
+        results, format, save_dir, is_split, jobs, compression
+    ).iter_export()
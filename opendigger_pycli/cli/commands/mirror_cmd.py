@@ -0,0 +1,96 @@
+import typing as t
+from pathlib import Path
+
+import click
+
+from opendigger_pycli.config.utils import get_fetch_concurrency
+from opendigger_pycli.console import CONSOLE
+from opendigger_pycli.dataloaders.mirror import get_mirror_load_jobs, sync_mirror
+
+from ..base import pass_environment
+from ..custom_types import GH_REMOTE_REPO_NAME_TYPE, GH_REMOTE_USERNAME_TYPE
+
+if t.TYPE_CHECKING:
+    from ..base import Environment
+
+
+@click.group("mirror")
+def mirror() -> None:
+    """
+    Manage local mirrors of OpenDigger data,
+    use `opendigger --data-source DIR ...` to query a mirror offline.
+    """
+
+
+@mirror.command("sync")  # type: ignore
+@click.option(
+    "--repo",
+    "-r",
+    "repos",
+    type=GH_REMOTE_REPO_NAME_TYPE,
+    multiple=True,
+    help="GitHub repository, e.g. X-lab2017/open-digger",
+    metavar="<org>/<repo>",
+)
+@click.option(
+    "--username",
+    "-u",
+    "usernames",
+    type=GH_REMOTE_USERNAME_TYPE,
+    multiple=True,
+    help="GitHub username",
+)
+@click.option(
+    "--year",
+    "-y",
+    "years",
+    type=click.IntRange(min=2015),
+    multiple=True,
+    help="Also sync the monthly indicators (e.g. project_openrank_detail) of the year",
+)
+@click.option(
+    "--dest",
+    "-d",
+    "dest",
+    type=click.Path(resolve_path=True, path_type=Path, file_okay=False),
+    required=True,
+    help="The directory of the mirror",
+)
+@pass_environment
+def sync(
+    env: "Environment",
+    repos: t.List[t.Tuple[str, str]],
+    usernames: t.List[str],
+    years: t.List[int],
+    dest: Path,
+) -> None:
+    """Download all indicators of repos and users into a local mirror"""
+    repos = list(set(repos))
+    usernames = list(set(usernames))
+    if not repos and not usernames:
+        env.elog("You must specify the repository or the username.")
+        raise click.UsageError("You must specify the repository or the username.")
+
+    dates = [(year, month) for year in sorted(set(years)) for month in range(1, 13)]
+    load_jobs = get_mirror_load_jobs(repos, usernames, dates)
+    env.dlog(f"Syncing {len(load_jobs)} indicators into {dest}")
+
+    from rich.progress import Progress
+
+    with Progress() as progress:
+        task_id = progress.add_task(
+            f"Syncing mirror: [green]{dest}", total=len(load_jobs)
+        )
+        results = sync_mirror(
+            dest,
+            load_jobs,
+            get_fetch_concurrency(),
+            lambda *_: progress.advance(task_id),
+        )
+
+    failed_count = sum(1 for result in results if not result.is_success)
+    CONSOLE.print(
+        f"[green]Synced {len(results) - failed_count} indicators into {dest}[/]"
+    )
+    if failed_count:
+        CONSOLE.print(f"[yellow]{failed_count} indicators have no data[/]")
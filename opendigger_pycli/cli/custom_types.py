@@ -8,6 +8,7 @@ from opendigger_pycli.dataloaders import (
     ProjectOpenRankNetworkRepoDataloader,
     RepoNetworkRepoDataloader,
 )
+from opendigger_pycli.dataloaders.sources import get_data_source, parse_data_source
 from opendigger_pycli.utils.checkers import exist_gh_repo, exist_gh_user
 
 from .parsers import QueryParser
@@ -15,6 +16,7 @@ from .parsers import QueryParser
 if t.TYPE_CHECKING:
     from click.core import Context, Parameter
 
+    from opendigger_pycli.dataloaders.sources import DataSource
     from opendigger_pycli.datatypes import IndicatorQuery
 
 
@@ -28,6 +30,10 @@ class GhRepoNameType(click.ParamType):
 
     name: str = "gh_repo_name"
 
+    def __init__(self, use_data_source: bool = True) -> None:
+        # 为False时总是在GitHub上检查仓库是否存在，如mirror sync
+        self.use_data_source = use_data_source
+
     def convert(
         self,
         value: str,
@@ -51,8 +57,13 @@ class GhRepoNameType(click.ParamType):
         try:
             # 尝试根据"/"分割字符串为组织名和仓库名
             org_name, repo_name = value.split("/")
+            # 使用本地数据源时，检查数据源中是否有该仓库的数据
+            data_source = get_data_source()
+            if self.use_data_source and data_source.is_local:
+                if not data_source.contains(f"{org_name}/{repo_name}"):
+                    self.fail(f"{value} repo does not exist in {data_source}")
             # 检查指定的GitHub仓库是否存在
-            if not exist_gh_repo(org_name, repo_name):
+            elif not exist_gh_repo(org_name, repo_name):
                 self.fail(
                     f"{value} repo does not exist, "
                     f"please check https://www.github.com/{org_name}/{repo_name}"
@@ -67,13 +78,20 @@ class GhRepoNameType(click.ParamType):
 class GhUserNameType(click.ParamType):
     name: str = "gh_username"
 
+    def __init__(self, use_data_source: bool = True) -> None:
+        self.use_data_source = use_data_source
+
     def convert(
         self,
         value: str,
         param: t.Optional["Parameter"],
         ctx: t.Optional["Context"],
     ) -> str:
-        if not exist_gh_user(value):
+        data_source = get_data_source()
+        if self.use_data_source and data_source.is_local:
+            if not data_source.contains(value):
+                self.fail(f"{value} user does not exist in {data_source}")
+        elif not exist_gh_user(value):
             self.fail(
                 f"{value} user does not exist, "
                 f"please check https://www.github.com/{value}"
@@ -212,9 +230,30 @@ class IndicatorQueryType(click.ParamType):
         return query
 
 
+class DataSourceType(click.ParamType):
+    name = "data_source"
+
+    def convert(
+        self,
+        value: t.Union[str, "DataSource"],
+        param: t.Optional["Parameter"],
+        ctx: t.Optional["Context"],
+    ) -> "DataSource":
+        if not isinstance(value, str):
+            return value
+        try:
+            return parse_data_source(value)
+        except (ValueError, OSError) as e:
+            self.fail(str(e))
+
+
 GH_REPO_NAME_TYPE = GhRepoNameType()
 GH_USERNAME_TYPE = GhUserNameType()
+# Checked on GitHub even when a local mirror is the data source
+GH_REMOTE_REPO_NAME_TYPE = GhRepoNameType(use_data_source=False)
+GH_REMOTE_USERNAME_TYPE = GhUserNameType(use_data_source=False)
 
 FILTERED_METRIC_QUERY_TYPE = FilteredMetricQueryType()
 IGNORED_METRIC_NAME_TYPE = IgnoredIndicatorNameType()
 INDICATOR_QUERY_TYPE = IndicatorQueryType()
+DATA_SOURCE_TYPE = DataSourceType()
@@ -1,6 +1,7 @@
 import typing as t
 
 from opendigger_pycli.datatypes import IndicatorQuery
+from opendigger_pycli.datatypes.query import MAX_QUERY_YEAR, MIN_QUERY_YEAR
 
 
 class QueryParser:
@@ -34,7 +35,7 @@ class QueryParser:
                 end = int(end_str)
                 if start > end:
                     return None
-                if start < 1970 or end > 2100:
+                if start < MIN_QUERY_YEAR or end > MAX_QUERY_YEAR:
                     return None
                 return set(range(start, end + 1))
             except ValueError:
@@ -42,7 +43,7 @@ class QueryParser:
         else:
             try:
                 year = int(item)
-                if year < 1970 or year > 2100:
+                if year < MIN_QUERY_YEAR or year > MAX_QUERY_YEAR:
                     return None
                 return {year}
             except ValueError:
@@ -61,11 +62,11 @@ class QueryParser:
             end_month = int(end_month_str)
             if start_year > end_year:
                 return None
-            if start_year < 1970 or end_year > 2100:
+            if start_year < MIN_QUERY_YEAR or end_year > MAX_QUERY_YEAR:
                 return None
             if start_month > end_month and not start_year < end_year:
                 return None
-            if start_month < 1 or end_month > 12:
+            if not (1 <= start_month <= 12 and 1 <= end_month <= 12):
                 return None
 
             result = set()
@@ -88,7 +89,7 @@ class QueryParser:
                 year_str, month_str = item.split("-", 1)
                 year = int(year_str)
                 month = int(month_str)
-                if year < 1970 or year > 2100:
+                if year < MIN_QUERY_YEAR or year > MAX_QUERY_YEAR:
                     return None
                 if month < 1 or month > 12:
                     return None
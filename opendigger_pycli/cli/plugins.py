@@ -0,0 +1,158 @@
+import json
+import os
+import sys
+import tempfile
+import traceback
+import typing as t
+from importlib import metadata
+from pathlib import Path
+
+import click
+
+PLUGIN_ENTRY_POINT_GROUP = "opendigger_pycli.plugins"
+INDEX_VERSION = 1
+
+
+def get_plugin_index_path() -> Path:
+    return Path(click.get_app_dir("opendigger-pycli")) / "plugins.json"
+
+
+def get_search_path_fingerprint() -> t.List[t.List[t.Any]]:
+    """
+    The mtime of every entry of ``sys.path``. Installing or removing a
+    distribution adds or removes its ``*.dist-info`` directory, which
+    changes the mtime of the site-packages directory it is installed in.
+    """
+    fingerprint: t.List[t.List[t.Any]] = []
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        fingerprint.append([path, mtime])
+    return fingerprint
+
+
+def discover_entry_points(group: str) -> t.Dict[str, str]:
+    """Scan the installed distributions for the entry points of ``group``"""
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        group_entry_points = entry_points.select(group=group)
+    else:  # Python < 3.10
+        group_entry_points = entry_points.get(group, [])  # type: ignore
+
+    discovered: t.Dict[str, str] = {}
+    for entry_point in group_entry_points:
+        # Like sys.path, the first distribution providing a name wins
+        discovered.setdefault(entry_point.name, entry_point.value)
+    return discovered
+
+
+def _read_plugin_index(index_path: Path) -> t.Dict[str, t.Any]:
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    return index
+
+
+def _write_plugin_index(index_path: Path, index: t.Dict[str, t.Any]) -> None:
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(index_path.parent), prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(index, file)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # The index is only a cache, the entry points are discovered again
+        pass
+
+
+def load_entry_point_index(
+    group: str, index_path: t.Optional[Path] = None
+) -> t.Dict[str, str]:
+    """
+    The entry points of ``group`` as ``{name: "module:attr"}``. They are
+    cached on disk until the mtime of any ``sys.path`` entry changes, so
+    the installed distributions are only scanned after (un)installs.
+    """
+    index_path = get_plugin_index_path() if index_path is None else index_path
+    fingerprint = get_search_path_fingerprint()
+    index = _read_plugin_index(index_path)
+    if index.get("fingerprint") != fingerprint:
+        index = {"version": INDEX_VERSION, "fingerprint": fingerprint, "groups": {}}
+
+    groups = index["groups"]
+    if group not in groups:
+        groups[group] = discover_entry_points(group)
+        _write_plugin_index(index_path, index)
+    return dict(groups[group])
+
+
+class BrokenPluginCommand(click.Command):
+    """
+    Replaces a plugin which can not be loaded, the traceback is shown
+    when it is invoked instead of crashing the whole CLI.
+    """
+
+    def __init__(self, name: str, error: t.Optional[str] = None) -> None:
+        super().__init__(name)
+        self.help = (
+            "\nWarning: entry point could not be loaded. Contact "
+            "its author for help.\n\n\b\n" + (error or traceback.format_exc())
+        )
+        self.short_help = f"Warning: could not load plugin {name}."
+
+    def invoke(self, ctx: click.Context) -> None:
+        click.echo(self.help, color=ctx.color)
+        ctx.exit(1)
+
+
+def load_plugin_command(name: str, value: str, group: str) -> click.Command:
+    try:
+        command = metadata.EntryPoint(name=name, value=value, group=group).load()
+    except Exception:
+        return BrokenPluginCommand(name)
+    if not isinstance(command, click.Command):
+        return BrokenPluginCommand(name, f"{value} is not a click command")
+    return command
+
+
+class PluginGroup(click.Group):
+    """
+    A group whose subcommands also come from the entry points of
+    ``plugin_group``, a plugin is only imported when it is invoked
+    (or its help is shown). Commands added to the group take precedence.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        plugin_group: str = PLUGIN_ENTRY_POINT_GROUP,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.plugin_group = plugin_group
+        self._plugin_entry_points: t.Optional[t.Dict[str, str]] = None
+
+    @property
+    def plugin_entry_points(self) -> t.Dict[str, str]:
+        if self._plugin_entry_points is None:
+            self._plugin_entry_points = load_entry_point_index(self.plugin_group)
+        return self._plugin_entry_points
+
+    def list_commands(self, ctx: click.Context) -> t.List[str]:
+        return sorted({*super().list_commands(ctx), *self.plugin_entry_points})
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> t.Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.plugin_entry_points:
+            command = load_plugin_command(
+                cmd_name, self.plugin_entry_points[cmd_name], self.plugin_group
+            )
+            self.add_command(command, cmd_name)
+        return command
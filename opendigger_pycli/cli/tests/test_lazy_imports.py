@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "jinja2",
+    "openai",
+    "pyecharts",
+    "requests",
+    "rich.progress",
+    "urllib3",
+]
+
+
+@pytest.mark.parametrize(
+    "module", ["opendigger_pycli.cli", "opendigger_pycli.__main__"]
+)
+def test_cli_does_not_import_heavy_modules(module):
+    """
+    重量级依赖只在导出报告、请求数据或AI分析时导入
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == []
@@ -0,0 +1,119 @@
+import json
+import threading
+import typing as t
+
+from click.testing import CliRunner
+from rich import get_console
+
+from opendigger_pycli.cli import opendigger
+from opendigger_pycli.dataloaders.sources import HttpDataSource
+from opendigger_pycli.results import query
+
+
+def write_mirror(tmp_path):
+    mirror = tmp_path / "mirror"
+    for repo in ("o/r", "o/s"):
+        (mirror / repo).mkdir(parents=True)
+        (mirror / repo / "openrank.json").write_text(json.dumps({"2023-01": 1.5}))
+    # o/s has no activity data
+    (mirror / "o/r" / "activity.json").write_text(json.dumps({"2023-01": 2.0}))
+    return mirror
+
+
+class RecordingIssueCreator:
+    reported: t.List[t.Tuple[str, t.List[str], threading.Thread]] = []
+
+    def __init__(self, title, nodata_indicator_names) -> None:
+        self.title = title
+        self.nodata_indicator_names = nodata_indicator_names
+
+    def run(self) -> None:
+        self.reported.append(
+            (self.title, self.nodata_indicator_names, threading.current_thread())
+        )
+
+
+def query_two_repos(mirror):
+    return CliRunner().invoke(
+        opendigger,
+        [
+            "--data-source",
+            str(mirror),
+            "repo",
+            "-r",
+            "o/r",
+            "-r",
+            "o/s",
+            "query",
+            "-o",
+            "-s",
+            "openrank",
+            "-s",
+            "activity",
+            "display",
+            "-f",
+            "table",
+        ],
+    )
+
+
+def test_nodata_indicators_are_reported_by_the_consumer(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setattr(query, "has_github_pat", lambda: True)
+    monkeypatch.setattr(query, "NodataIssueCreator", RecordingIssueCreator)
+    monkeypatch.setattr(RecordingIssueCreator, "reported", [])
+    # Issues are only created when the data comes from OpenDigger
+    monkeypatch.setattr(query, "get_data_source", lambda: HttpDataSource())
+
+    result = query_two_repos(write_mirror(tmp_path))
+
+    assert result.exit_code == 0, result.output
+    assert "Repo: o/s, Indicator Names: ['activity'], No Data" in result.output
+    assert RecordingIssueCreator.reported == [
+        ("Repo: o/s", ["activity"], threading.main_thread()),
+    ]
+
+
+def test_nodata_indicators_of_a_mirror_are_not_reported(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setattr(query, "has_github_pat", lambda: True)
+    monkeypatch.setattr(query, "NodataIssueCreator", RecordingIssueCreator)
+    monkeypatch.setattr(RecordingIssueCreator, "reported", [])
+
+    result = query_two_repos(write_mirror(tmp_path))
+
+    assert result.exit_code == 0, result.output
+    assert "Repo: o/s, Indicator Names: ['activity'], No Data" in result.output
+    assert RecordingIssueCreator.reported == []
+
+
+def test_failed_processor_stops_the_query_progress(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    save_path = tmp_path / "out"
+    save_path.mkdir()
+    # The export can not create the directory of the repo
+    (save_path / "repo-o-r").write_text("")
+
+    result = CliRunner().invoke(
+        opendigger,
+        [
+            "--data-source",
+            str(write_mirror(tmp_path)),
+            "repo",
+            "-r",
+            "o/r",
+            "query",
+            "-o",
+            "-s",
+            "openrank",
+            "export",
+            "-f",
+            "json",
+            "-s",
+            str(save_path),
+        ],
+    )
+
+    assert isinstance(result.exception, FileExistsError)
+    # The progress of the query results is stopped when the export fails
+    assert get_console()._live is None
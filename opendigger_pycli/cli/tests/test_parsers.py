@@ -0,0 +1,31 @@
+import pytest
+
+from opendigger_pycli.cli.parsers import QueryParser
+from opendigger_pycli.datatypes import IndicatorQuery
+
+
+@pytest.mark.parametrize(
+    "indicator_query",
+    [
+        "1969",
+        "2101",
+        "2000~2101",
+        "0",
+        "13",
+        "2023-13",
+        "2020-13~2021-01",
+        "2020-0~2020-3",
+    ],
+)
+def test_query_out_of_range_is_rejected(indicator_query):
+    assert QueryParser().try_parse_indicator_query(indicator_query) is None
+
+
+def test_query_in_range():
+    assert QueryParser().try_parse_indicator_query(
+        "1970,12,2100-11~2100-12"
+    ) == IndicatorQuery(
+        months=frozenset({12}),
+        years=frozenset({1970}),
+        year_months=frozenset({(2100, 11), (2100, 12)}),
+    )
@@ -0,0 +1,95 @@
+import os
+import sys
+
+import click
+from click.testing import CliRunner
+
+from opendigger_pycli.cli import plugins
+from opendigger_pycli.cli.plugins import PluginGroup, load_entry_point_index
+
+GROUP = "opendigger_pycli.plugins"
+
+
+def install_plugin(site_dir, module_name="demo_plugin", body=None):
+    """在临时目录中安装一个只有入口点的插件"""
+    (site_dir / f"{module_name}.py").write_text(
+        body
+        or (
+            "import click\n"
+            "@click.command('demo')\n"
+            "def demo():\n"
+            "    click.echo('demo plugin')\n"
+        )
+    )
+    dist_info = site_dir / f"{module_name}-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Name: {module_name}\nVersion: 0.1\n")
+    (dist_info / "entry_points.txt").write_text(
+        f"[{GROUP}]\ndemo = {module_name}:demo\n"
+    )
+
+
+def test_entry_point_index_is_cached(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    install_plugin(site_dir)
+    monkeypatch.syspath_prepend(str(site_dir))
+    index_path = tmp_path / "plugins.json"
+
+    assert load_entry_point_index(GROUP, index_path) == {"demo": "demo_plugin:demo"}
+    assert index_path.exists()
+
+    # 缓存有效时不再扫描已安装的包
+    def fail(group):
+        raise AssertionError("entry points are scanned again")
+
+    monkeypatch.setattr(plugins, "discover_entry_points", fail)
+    assert load_entry_point_index(GROUP, index_path) == {"demo": "demo_plugin:demo"}
+
+    # 目录修改时间变化后重新扫描
+    stat = os.stat(site_dir)
+    os.utime(site_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    monkeypatch.undo()
+    monkeypatch.syspath_prepend(str(site_dir))
+    monkeypatch.setattr(plugins, "discover_entry_points", lambda group: {})
+    assert load_entry_point_index(GROUP, index_path) == {}
+
+
+def test_plugin_group_loads_plugins_lazily(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    install_plugin(site_dir, "lazy_demo_plugin")
+    monkeypatch.syspath_prepend(str(site_dir))
+    monkeypatch.setattr(
+        plugins, "get_plugin_index_path", lambda: tmp_path / "plugins.json"
+    )
+
+    @click.group(cls=PluginGroup)
+    def cli():
+        pass
+
+    assert "demo" in cli.list_commands(click.Context(cli))
+    assert "lazy_demo_plugin" not in sys.modules
+
+    result = CliRunner().invoke(cli, ["demo"])
+    assert result.exit_code == 0
+    assert result.output == "demo plugin\n"
+    assert "lazy_demo_plugin" in sys.modules
+
+
+def test_broken_plugin(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    install_plugin(site_dir, "broken_demo_plugin", body="raise ImportError('boom')\n")
+    monkeypatch.syspath_prepend(str(site_dir))
+    monkeypatch.setattr(
+        plugins, "get_plugin_index_path", lambda: tmp_path / "plugins.json"
+    )
+
+    @click.group(cls=PluginGroup)
+    def cli():
+        pass
+
+    result = CliRunner().invoke(cli, ["demo"])
+    assert result.exit_code == 1
+    assert "ImportError: boom" in result.output
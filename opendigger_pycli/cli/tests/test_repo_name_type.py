@@ -1,6 +1,9 @@
+import click
+import pytest
 from click.testing import CliRunner
 
-from opendigger_pycli.cli import opendigger
+from opendigger_pycli.cli import custom_types, opendigger
+from opendigger_pycli.dataloaders.sources import LocalDataSource, configure_data_source
 
 
 def test_repo_name_type():
@@ -35,5 +38,30 @@ def test_repo_name_type():
     # 验证使用不存在仓库名称的命令执行结果
     assert result.exit_code == 2
 
+def test_remote_repo_name_type_ignores_local_mirror(tmp_path, monkeypatch):
+    """
+    mirror sync的仓库和用户总是在GitHub上检查，即使数据源是本地镜像。
+    """
+    checked = []
+    monkeypatch.setattr(
+        custom_types,
+        "exist_gh_repo",
+        lambda org_name, repo_name: checked.append((org_name, repo_name)) or True,
+    )
+    monkeypatch.setattr(custom_types, "exist_gh_user", lambda username: False)
+    configure_data_source(LocalDataSource(tmp_path))
+    try:
+        with pytest.raises(click.BadParameter):
+            custom_types.GH_REPO_NAME_TYPE.convert("o/new", None, None)
+        assert custom_types.GH_REMOTE_REPO_NAME_TYPE.convert(
+            "o/new", None, None
+        ) == ("o", "new")
+        with pytest.raises(click.BadParameter):
+            custom_types.GH_REMOTE_USERNAME_TYPE.convert("nobody", None, None)
+    finally:
+        configure_data_source(None)
+    assert checked == [("o", "new")]
+
+
 if __name__ == '__main__':
     test_repo_name_type()
@@ -7,7 +7,16 @@ import click
 from rich import box
 from rich.table import Table
 
-from opendigger_pycli.datatypes import ALL_CONFIGS, AppKeyConfig, UserInfoConfig
+from opendigger_pycli.datatypes import (
+    ALL_CONFIGS,
+    AppKeyConfig,
+    CacheConfig,
+    DataSourceConfig,
+    GraphConfig,
+    NetworkConfig,
+    SeriesConfig,
+    UserInfoConfig,
+)
 
 if t.TYPE_CHECKING:
     from rich.console import Console, ConsoleOptions, RenderResult
@@ -16,6 +25,11 @@ if t.TYPE_CHECKING:
 class OpenDiggerCliConfig:
     app_keys: AppKeyConfig
     user_info: UserInfoConfig
+    network: NetworkConfig
+    cache: CacheConfig
+    data_source: DataSourceConfig
+    graph: GraphConfig
+    series: SeriesConfig
 
     def __init__(self):
         self.__load_config()
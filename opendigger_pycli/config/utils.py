@@ -1,6 +1,14 @@
 from __future__ import annotations
 import typing as t
 
+from opendigger_pycli.datatypes.config import (
+    CacheConfig,
+    DataSourceConfig,
+    GraphConfig,
+    NetworkConfig,
+    SeriesConfig,
+)
+
 from .config import OpenDiggerCliConfig
 
 if t.TYPE_CHECKING:
@@ -25,3 +33,107 @@ def get_openai_api_key_from_config() -> str:
 
 def has_openai_api_key() -> bool:
     return get_openai_api_key_from_config() != "None"
+
+
+def get_network_config() -> NetworkConfig:
+    return OpenDiggerCliConfig().network
+
+
+def parse_positive_int(value: str, default: int) -> int:
+    try:
+        number = int(str(value).strip().strip('"'))
+    except ValueError:
+        return default
+    return number if number > 0 else default
+
+
+def parse_non_negative_float(value: str, default: float) -> float:
+    try:
+        number = float(str(value).strip().strip('"'))
+    except ValueError:
+        return default
+    return number if number >= 0 else default
+
+
+def parse_bool(value: str, default: bool) -> bool:
+    value = str(value).strip().strip('"').lower()
+    if value in ("true", "yes", "on", "1"):
+        return True
+    if value in ("false", "no", "off", "0"):
+        return False
+    return default
+
+
+def get_fetch_concurrency() -> int:
+    return parse_positive_int(
+        get_network_config().concurrency, int(NetworkConfig.concurrency)
+    )
+
+
+def get_query_concurrency() -> int:
+    return parse_positive_int(
+        get_network_config().query_concurrency, int(NetworkConfig.query_concurrency)
+    )
+
+
+def get_max_in_flight_requests() -> int:
+    return parse_positive_int(
+        get_network_config().max_in_flight, int(NetworkConfig.max_in_flight)
+    )
+
+
+def get_max_requests_per_host() -> int:
+    return parse_positive_int(
+        get_network_config().max_per_host, int(NetworkConfig.max_per_host)
+    )
+
+
+def get_http_timeouts() -> t.Tuple[float, float]:
+    network_config = get_network_config()
+    return (
+        parse_non_negative_float(
+            network_config.connect_timeout, float(NetworkConfig.connect_timeout)
+        ),
+        parse_non_negative_float(
+            network_config.read_timeout, float(NetworkConfig.read_timeout)
+        ),
+    )
+
+
+def get_retry_settings() -> t.Tuple[int, float]:
+    network_config = get_network_config()
+    try:
+        max_retries = max(int(str(network_config.max_retries).strip('"')), 0)
+    except ValueError:
+        max_retries = int(NetworkConfig.max_retries)
+    return max_retries, parse_non_negative_float(
+        network_config.backoff_factor, float(NetworkConfig.backoff_factor)
+    )
+
+
+def get_cache_config() -> CacheConfig:
+    return OpenDiggerCliConfig().cache
+
+
+def get_data_source_config() -> DataSourceConfig:
+    return OpenDiggerCliConfig().data_source
+
+
+def get_graph_config() -> GraphConfig:
+    return OpenDiggerCliConfig().graph
+
+
+def get_series_config() -> SeriesConfig:
+    return OpenDiggerCliConfig().series
+
+
+def parse_optional_positive_int(value: str) -> t.Optional[int]:
+    number = parse_positive_int(value, 0)
+    return number if number > 0 else None
+
+
+def parse_optional_float(value: str) -> t.Optional[float]:
+    try:
+        return float(str(value).strip().strip('"'))
+    except ValueError:
+        return None
@@ -46,6 +46,4 @@ def print_time_duration_related_indicator_json(
 
 
 def print_base_network_data_json(network_data: "BaseNetworkData", *args, **kwargs):
-    from dataclasses import asdict
-
-    CONSOLE.print(asdict(network_data))
+    CONSOLE.print(network_data.to_dict())
@@ -59,8 +59,8 @@ def print_base_network_data_table(network_data: "BaseNetworkData", *args, **kwar
     table.add_column("nodes", overflow="fold")
     table.add_column("edges", overflow="fold")
     table.add_row(
-        pretty_repr(network_data.nodes, indent_size=2),
-        pretty_repr(network_data.edges, indent_size=2),
+        pretty_repr(list(network_data.nodes), indent_size=2),
+        pretty_repr(list(network_data.edges), indent_size=2),
     )
     print_table(table)
     CONSOLE.print()
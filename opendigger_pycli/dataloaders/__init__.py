@@ -1,3 +1,4 @@
+from .aio import aload, arun_dataloaders, run_dataloaders
 from .base import DATALOADERS, filter_dataloader
 from .indices import (
     ActivityRepoDataloader,
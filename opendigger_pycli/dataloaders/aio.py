@@ -0,0 +1,78 @@
+import asyncio
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from opendigger_pycli.datatypes import AsyncDataloaderProto
+
+from .base import run_load_in_executor
+from .memo import request_memo_scope
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import DataloaderProto, DataloaderResult
+
+LoadJob = t.Tuple["DataloaderProto", t.Tuple[t.Any, ...]]
+
+
+async def aload(dataloader: "DataloaderProto", *args: t.Any) -> "DataloaderResult":
+    """
+    Await a dataloader, third-party dataloaders which only implement
+    ``load()`` are run in the default executor of the running loop.
+    """
+    if isinstance(dataloader, AsyncDataloaderProto):
+        return await dataloader.aload(*args)
+    return await run_load_in_executor(dataloader.load, *args)
+
+
+async def arun_dataloaders(
+    load_jobs: t.Iterable[LoadJob],
+    concurrency: int,
+    on_loaded: t.Optional[t.Callable[[int, "DataloaderResult"], None]] = None,
+) -> t.List["DataloaderResult"]:
+    """
+    Run many dataloaders on the running event loop,
+    at most ``concurrency`` of them are loading at the same time.
+    Results are returned in the order of ``load_jobs``.
+
+    The files loaded by the dataloaders are shared by them until all of
+    them are loaded, then the memo is dropped.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_load_job(index: int, load_job: LoadJob) -> "DataloaderResult":
+        dataloader, load_args = load_job
+        async with semaphore:
+            result = await aload(dataloader, *load_args)
+        if on_loaded is not None:
+            on_loaded(index, result)
+        return result
+
+    # The load jobs are started in the scope, so they all use its memo
+    with request_memo_scope():
+        return list(
+            await asyncio.gather(
+                *(
+                    run_load_job(index, load_job)
+                    for index, load_job in enumerate(load_jobs)
+                )
+            )
+        )
+
+
+def run_dataloaders(
+    load_jobs: t.Iterable[LoadJob],
+    concurrency: int,
+    on_loaded: t.Optional[t.Callable[[int, "DataloaderResult"], None]] = None,
+) -> t.List["DataloaderResult"]:
+    """
+    Run many dataloaders on a new event loop. Blocking ``load()`` calls
+    share one executor sized to ``concurrency``, so the number of threads
+    does not grow with the number of jobs.
+    """
+
+    async def main() -> t.List["DataloaderResult"]:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(executor)
+        return await arun_dataloaders(load_jobs, concurrency, on_loaded)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return asyncio.run(main())
@@ -1,10 +1,12 @@
 import abc
+import asyncio
+import contextvars
 import itertools
 import typing as t
 from collections import defaultdict
 
 if t.TYPE_CHECKING:
-    from opendigger_pycli.datatypes import DataloaderProto
+    from opendigger_pycli.datatypes import DataloaderProto, DataloaderResult
 
 
 class DataLoadersType(t.TypedDict):
@@ -77,6 +79,22 @@ def filter_dataloader(
     return indicator_dataloaders
 
 
+LoadResultType = t.TypeVar("LoadResultType")
+
+
+async def run_load_in_executor(
+    load: t.Callable[..., LoadResultType], *args: t.Any
+) -> LoadResultType:
+    """
+    Await a blocking ``load`` call in the default executor of the running loop.
+    Like ``asyncio.to_thread``, the call runs in the context of the caller,
+    e.g. with its request memo.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, lambda: context.run(load, *args))
+
+
 class BaseRepoDataloader(abc.ABC):
     # Specify the name of the indicator,
     # which is different from the name field in datatypes
@@ -96,6 +114,9 @@ class BaseRepoDataloader(abc.ABC):
     def load(self, org: str, repo: str):
         pass
 
+    async def aload(self, org: str, repo: str) -> "DataloaderResult":
+        return await run_load_in_executor(self.load, org, repo)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -119,6 +140,11 @@ class BaseOpenRankNetworkDataloader(abc.ABC):
     def load(self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]):
         pass
 
+    async def aload(
+        self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]
+    ) -> "DataloaderResult":
+        return await run_load_in_executor(self.load, org, repo, dates)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -139,5 +165,8 @@ class BaseUserDataloader(abc.ABC):
     def load(self, username: str):
         pass
 
+    async def aload(self, username: str) -> "DataloaderResult":
+        return await run_load_in_executor(self.load, username)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -0,0 +1,319 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import typing as t
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import click
+
+from opendigger_pycli.config.utils import (
+    get_cache_config,
+    parse_bool,
+    parse_positive_int,
+)
+from opendigger_pycli.datatypes.config import CacheConfig
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    blob: str
+    size: int
+    fetched_at: float
+    etag: t.Optional[str] = None
+    last_modified: t.Optional[str] = None
+    # Responses which are not found are cached without a blob
+    is_missing: bool = False
+
+    @property
+    def validators(self) -> t.Dict[str, str]:
+        """Headers used to revalidate the entry with a conditional request"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class ResponseCache:
+    """
+    Content-addressed disk cache for OpenDigger responses.
+
+    Response bodies are stored once per content hash under ``blobs/``,
+    every URL has a small metadata file under ``entries/`` pointing to its
+    blob. The mtime of an entry file is its last access time, which is used
+    for LRU eviction once the blobs exceed ``max_size`` bytes.
+
+    URLs which are not found are stored as negative entries without a blob,
+    they expire after ``negative_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: int,
+        max_size: int,
+        refresh: bool = False,
+        negative_ttl: t.Optional[int] = None,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.max_size = max_size
+        self.refresh = refresh
+
+        self.entries_dir = cache_dir / "entries"
+        self.blobs_dir = cache_dir / "blobs"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._total_size: t.Optional[int] = None
+        self._blob_refs: t.Optional[t.Dict[str, int]] = None
+
+    def _entry_path(self, url: str) -> Path:
+        return self.entries_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _blob_path(self, blob: str) -> Path:
+        return self.blobs_dir / blob
+
+    def lookup(self, url: str) -> t.Optional[CacheEntry]:
+        entry_path = self._entry_path(url)
+        try:
+            entry = CacheEntry(**json.loads(entry_path.read_bytes()))
+        except (OSError, ValueError, TypeError):
+            return None
+        if entry.url != url:
+            return None
+        if not entry.is_missing and not self._blob_path(entry.blob).exists():
+            return None
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        if self.refresh:
+            return False
+        ttl = self.negative_ttl if entry.is_missing else self.ttl
+        return time.time() - entry.fetched_at < ttl
+
+    def read_body(self, entry: CacheEntry) -> t.Optional[bytes]:
+        try:
+            body = self._blob_path(entry.blob).read_bytes()
+        except OSError:
+            return None
+        self._touch(entry.url)
+        return body
+
+    def _touch(self, url: str) -> None:
+        try:
+            os.utime(self._entry_path(url))
+        except OSError:
+            pass
+
+    def _write_entry(self, entry: CacheEntry) -> None:
+        _write_atomic(
+            self._entry_path(entry.url), json.dumps(asdict(entry)).encode("utf-8")
+        )
+
+    def _replace_entry(self, entry: CacheEntry) -> None:
+        """
+        Write the entry of a URL, the blob of the entry it replaces is deleted
+        when no other entry refers to it any more.
+        """
+        blob_refs = self._get_blob_refs()
+        try:
+            old_blob = json.loads(self._entry_path(entry.url).read_bytes())["blob"]
+        except (OSError, ValueError, KeyError):
+            old_blob = ""
+        self._write_entry(entry)
+        if entry.blob:
+            blob_refs[entry.blob] = blob_refs.get(entry.blob, 0) + 1
+        if old_blob:
+            blob_refs[old_blob] = blob_refs.get(old_blob, 1) - 1
+            if blob_refs[old_blob] <= 0:
+                del blob_refs[old_blob]
+                self._delete_blob(old_blob)
+
+    def _delete_blob(self, blob: str) -> None:
+        total_size = self._get_total_size()
+        blob_path = self._blob_path(blob)
+        try:
+            size = blob_path.stat().st_size
+            blob_path.unlink()
+        except OSError:
+            return
+        self._total_size = total_size - size
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+    ) -> CacheEntry:
+        blob = hashlib.sha256(body).hexdigest()
+        entry = CacheEntry(
+            url=url,
+            blob=blob,
+            size=len(body),
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        with self._lock:
+            blob_path = self._blob_path(blob)
+            if not blob_path.exists():
+                total_size = self._get_total_size()
+                _write_atomic(blob_path, body)
+                self._total_size = total_size + len(body)
+            self._replace_entry(entry)
+            if self._get_total_size() > self.max_size:
+                self._evict()
+        return entry
+
+    def store_missing(self, url: str) -> CacheEntry:
+        """Remember that ``url`` was not found on the server"""
+        entry = CacheEntry(
+            url=url, blob="", size=0, fetched_at=time.time(), is_missing=True
+        )
+        with self._lock:
+            self._replace_entry(entry)
+        return entry
+
+    def mark_revalidated(self, entry: CacheEntry) -> CacheEntry:
+        """Restart the TTL of an entry after the server answered 304"""
+        entry.fetched_at = time.time()
+        with self._lock:
+            self._write_entry(entry)
+        return entry
+
+    def _get_total_size(self) -> int:
+        if self._total_size is None:
+            self._total_size = sum(
+                path.stat().st_size
+                for path in self.blobs_dir.iterdir()
+                if not path.name.startswith(".tmp-")
+            )
+        return self._total_size
+
+    def _get_blob_refs(self) -> t.Dict[str, int]:
+        """The number of entries referring to each blob"""
+        if self._blob_refs is None:
+            blob_refs: t.Dict[str, int] = {}
+            for entry_path in self.entries_dir.glob("*.json"):
+                try:
+                    blob = json.loads(entry_path.read_bytes())["blob"]
+                except (OSError, ValueError, KeyError):
+                    continue
+                if blob:
+                    blob_refs[blob] = blob_refs.get(blob, 0) + 1
+            self._blob_refs = blob_refs
+        return self._blob_refs
+
+    def _evict(self) -> None:
+        entries: t.List[t.Tuple[float, Path, str]] = []
+        blob_refs: t.Dict[str, int] = {}
+        for entry_path in self.entries_dir.glob("*.json"):
+            try:
+                blob = json.loads(entry_path.read_bytes())["blob"]
+                mtime = entry_path.stat().st_mtime
+            except (OSError, ValueError, KeyError):
+                continue
+            if not blob:
+                # Negative entries take no space in blobs
+                continue
+            entries.append((mtime, entry_path, blob))
+            blob_refs[blob] = blob_refs.get(blob, 0) + 1
+
+        total_size = self._get_total_size()
+        for _, entry_path, blob in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            blob_refs[blob] -= 1
+            if blob_refs[blob] > 0:
+                continue
+            blob_path = self._blob_path(blob)
+            try:
+                total_size -= blob_path.stat().st_size
+                blob_path.unlink()
+            except OSError:
+                continue
+        self._total_size = total_size
+        self._blob_refs = {blob: refs for blob, refs in blob_refs.items() if refs > 0}
+
+
+_cache_enabled_override: t.Optional[bool] = None
+_cache_refresh = False
+_response_cache: t.Optional[ResponseCache] = None
+_is_response_cache_loaded = False
+_response_cache_lock = threading.Lock()
+
+
+def configure_response_cache(
+    enabled: t.Optional[bool] = None, refresh: bool = False
+) -> None:
+    """
+    Override the cache settings of the config file for this process,
+    used by the ``--no-cache`` and ``--refresh`` options.
+    """
+    global _cache_enabled_override, _cache_refresh, _is_response_cache_loaded
+
+    with _response_cache_lock:
+        _cache_enabled_override = enabled
+        _cache_refresh = refresh
+        _is_response_cache_loaded = False
+
+
+def get_response_cache() -> t.Optional[ResponseCache]:
+    """Return the response cache, or None if caching is disabled"""
+    global _response_cache, _is_response_cache_loaded
+
+    with _response_cache_lock:
+        if _is_response_cache_loaded:
+            return _response_cache
+
+        cache_config = get_cache_config()
+        enabled = (
+            parse_bool(cache_config.enabled, True)
+            if _cache_enabled_override is None
+            else _cache_enabled_override
+        )
+        _is_response_cache_loaded = True
+        if not enabled:
+            _response_cache = None
+            return None
+
+        _response_cache = ResponseCache(
+            cache_dir=Path(click.get_app_dir("opendigger-pycli")) / "cache",
+            ttl=parse_positive_int(cache_config.ttl, int(CacheConfig.ttl)),
+            max_size=parse_positive_int(
+                cache_config.max_size_mb, int(CacheConfig.max_size_mb)
+            )
+            * 1024
+            * 1024,
+            refresh=_cache_refresh,
+            negative_ttl=parse_positive_int(
+                cache_config.negative_ttl, int(CacheConfig.negative_ttl)
+            ),
+        )
+        return _response_cache
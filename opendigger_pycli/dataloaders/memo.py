@@ -0,0 +1,65 @@
+import threading
+import typing as t
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+T = t.TypeVar("T")
+
+
+class RequestMemo:
+    """
+    Single-flight memo of loaded files. Concurrent loads of the same key wait
+    for the first one instead of loading the file again. Failed loads are
+    not memoized, so that they can be retried.
+    """
+
+    def __init__(self) -> None:
+        self._futures: t.Dict[t.Hashable, "Future[t.Any]"] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: t.Hashable, load: t.Callable[[], T]) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            is_loader = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+        if not is_loader:
+            return future.result()
+
+        try:
+            result = load()
+        except BaseException as e:
+            with self._lock:
+                del self._futures[key]
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+_request_memo: "ContextVar[t.Optional[RequestMemo]]" = ContextVar(
+    "request_memo", default=None
+)
+
+
+def get_request_memo() -> t.Optional[RequestMemo]:
+    """The memo of the current scope, files are not memoized outside a scope"""
+    return _request_memo.get()
+
+
+@contextmanager
+def request_memo_scope() -> t.Iterator[RequestMemo]:
+    """
+    Memoize the files loaded in this context, e.g. while the dataloaders of one
+    repo are run. The memo and the data in it are dropped when the scope ends.
+    """
+    memo = RequestMemo()
+    token = _request_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _request_memo.reset(token)
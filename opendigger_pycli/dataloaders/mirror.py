@@ -0,0 +1,93 @@
+import threading
+import typing as t
+from pathlib import Path
+
+from .aio import run_dataloaders
+from .base import filter_dataloader
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import DataloaderResult
+
+    from .aio import LoadJob
+
+ALL_INDICATOR_TYPES: t.Set[t.Literal["index", "metric", "network"]] = {
+    "index",
+    "metric",
+    "network",
+}
+
+_mirror_sync_dir: t.Optional[Path] = None
+_mirror_lock = threading.Lock()
+
+
+def configure_mirror_sync(mirror_sync_dir: t.Optional[Path]) -> None:
+    """Copy every fetched OpenDigger file into ``mirror_sync_dir``"""
+    global _mirror_sync_dir
+    _mirror_sync_dir = mirror_sync_dir
+
+
+def is_mirror_syncing() -> bool:
+    return _mirror_sync_dir is not None
+
+
+def get_mirror_path(mirror_dir: Path, data_path: str) -> Path:
+    return mirror_dir.joinpath(*data_path.split("/"))
+
+
+def write_mirror(data_path: str, body: bytes) -> None:
+    if _mirror_sync_dir is None:
+        return
+    mirror_path = get_mirror_path(_mirror_sync_dir, data_path)
+    with _mirror_lock:
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = mirror_path.with_name(f".{mirror_path.name}.{threading.get_ident()}")
+    tmp_path.write_bytes(body)
+    tmp_path.replace(mirror_path)
+
+
+def get_mirror_load_jobs(
+    repos: t.Sequence[t.Tuple[str, str]] = (),
+    usernames: t.Sequence[str] = (),
+    dates: t.Sequence[t.Tuple[int, int]] = (),
+) -> t.List["LoadJob"]:
+    """
+    Build the load jobs of all indicators of ``repos`` and ``usernames``,
+    indicators which need dates are only included when ``dates`` is given.
+    """
+    load_jobs: t.List["LoadJob"] = []
+    for dataloader in filter_dataloader({"repo"}, ALL_INDICATOR_TYPES, set()):
+        for org, repo in repos:
+            if not dataloader.pass_date:
+                load_jobs.append((dataloader, (org, repo)))
+            elif dates:
+                load_jobs.append((dataloader, (org, repo, list(dates))))
+    for dataloader in filter_dataloader({"user"}, ALL_INDICATOR_TYPES, set()):
+        for username in usernames:
+            if not dataloader.pass_date:
+                load_jobs.append((dataloader, (username,)))
+    return load_jobs
+
+
+def sync_mirror(
+    dest: Path,
+    load_jobs: t.Sequence["LoadJob"],
+    concurrency: int,
+    on_loaded: t.Optional[t.Callable[[int, "DataloaderResult"], None]] = None,
+) -> t.List["DataloaderResult"]:
+    """
+    Run ``load_jobs`` and keep a copy of every fetched file in ``dest``,
+    the directory tree mirrors the paths of the OpenDigger API. The files are
+    always downloaded, even if a local mirror is the configured data source.
+    """
+    # sources imports this module
+    from .sources import configure_data_source, get_data_source, get_remote_data_source
+
+    dest.mkdir(parents=True, exist_ok=True)
+    data_source = get_data_source()
+    configure_data_source(get_remote_data_source())
+    configure_mirror_sync(dest)
+    try:
+        return run_dataloaders(load_jobs, concurrency, on_loaded)
+    finally:
+        configure_mirror_sync(None)
+        configure_data_source(data_source)
@@ -1,5 +1,7 @@
+import asyncio
 import typing as t
 
+from opendigger_pycli.config.utils import get_max_requests_per_host
 from opendigger_pycli.datatypes import (
     BaseData,
     DataloaderResult,
@@ -13,12 +15,12 @@ from .base import (
     BaseRepoDataloader,
     BaseUserDataloader,
     register_dataloader,
+    run_load_in_executor,
 )
 from .utils import (
-    get_developer_data,
-    get_repo_data,
-    load_network_data,
-    load_openrank_network_data,
+    get_developer_network,
+    get_repo_network,
+    get_repo_openrank_network,
 )
 
 if t.TYPE_CHECKING:
@@ -33,8 +35,8 @@ class DeveloperNetworkRepoDataloader(BaseRepoDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/developer_network.json"
 
     def load(self, org: str, repo: str) -> DataloaderResult[DeveloperNetworkData]:
-        data = get_repo_data(org, repo, DeveloperNetworkData.name)
-        if data is None:
+        network = get_repo_network(org, repo, DeveloperNetworkData.name)
+        if network is None:
             return DataloaderResult(
                 is_success=False,
                 dataloader=t.cast("DataloaderProto", self),
@@ -44,7 +46,7 @@ class DeveloperNetworkRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=DeveloperNetworkData(value=load_network_data(data)),
+            data=DeveloperNetworkData(value=network),
             desc="",
         )
 
@@ -57,8 +59,8 @@ class RepoNetworkRepoDataloader(BaseRepoDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/repo_network.json"
 
     def load(self, org: str, repo: str) -> DataloaderResult[RepoNetworkData]:
-        data = get_repo_data(org, repo, RepoNetworkData.name)
-        if data is None:
+        network = get_repo_network(org, repo, RepoNetworkData.name)
+        if network is None:
             return DataloaderResult(
                 is_success=False,
                 dataloader=t.cast("DataloaderProto", self),
@@ -68,7 +70,7 @@ class RepoNetworkRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=RepoNetworkData(value=load_network_data(data)),
+            data=RepoNetworkData(value=network),
             desc="",
         )
 
@@ -82,22 +84,19 @@ class ProjectOpenRankNetworkRepoDataloader(BaseOpenRankNetworkDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/project_openrank_detail/2022-12.json"
     pass_date = True
 
-    def load(
-        self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]
+    def _load_month(self, org: str, repo: str, date: t.Tuple[int, int]) -> BaseData:
+        year, month = date
+        return BaseData(
+            year=int(year),
+            month=int(month),
+            value=get_repo_openrank_network(
+                org, repo, ProjectOpenRankNetworkData.name, date
+            ),
+        )
+
+    def _build_result(
+        self, values: t.List[BaseData]
     ) -> DataloaderResult[ProjectOpenRankNetworkData]:
-        values = []
-        for date in dates:
-            data = get_repo_data(org, repo, ProjectOpenRankNetworkData.name, date)
-            year, month = date
-            values.append(
-                BaseData(
-                    year=int(year),
-                    month=int(month),
-                    value=load_openrank_network_data(data)
-                    if data is not None
-                    else None,
-                )
-            )
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
@@ -105,6 +104,27 @@ class ProjectOpenRankNetworkRepoDataloader(BaseOpenRankNetworkDataloader):
             desc="",
         )
 
+    def load(
+        self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]
+    ) -> DataloaderResult[ProjectOpenRankNetworkData]:
+        # The months are fetched concurrently by aload(), which runs them in the
+        # shared executor of run_dataloaders instead of a pool of its own
+        return self._build_result([self._load_month(org, repo, date) for date in dates])
+
+    async def aload(
+        self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]
+    ) -> DataloaderResult[ProjectOpenRankNetworkData]:
+        # Every month is a separate file on the same host,
+        # so they are fetched concurrently up to the per-host limit
+        semaphore = asyncio.Semaphore(get_max_requests_per_host())
+
+        async def load_month(date: t.Tuple[int, int]) -> BaseData:
+            async with semaphore:
+                return await run_load_in_executor(self._load_month, org, repo, date)
+
+        values = await asyncio.gather(*(load_month(date) for date in dates))
+        return self._build_result(list(values))
+
 
 @register_dataloader
 class DeveloperNetworkUserDataloader(BaseUserDataloader):
@@ -116,8 +136,8 @@ class DeveloperNetworkUserDataloader(BaseUserDataloader):
     )
 
     def load(self, username: str) -> DataloaderResult[DeveloperNetworkData]:
-        data = get_developer_data(username, DeveloperNetworkData.name)
-        if data is None:
+        network = get_developer_network(username, DeveloperNetworkData.name)
+        if network is None:
             return DataloaderResult(
                 is_success=False,
                 dataloader=t.cast("DataloaderProto", self),
@@ -127,7 +147,7 @@ class DeveloperNetworkUserDataloader(BaseUserDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=DeveloperNetworkData(value=load_network_data(data)),
+            data=DeveloperNetworkData(value=network),
             desc="",
         )
 
@@ -140,8 +160,8 @@ class RepoNetworkUserDataloader(BaseUserDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/frank-zsy/repo_network.json"
 
     def load(self, username: str) -> DataloaderResult[RepoNetworkData]:
-        data = get_developer_data(username, RepoNetworkData.name)
-        if data is None:
+        network = get_developer_network(username, RepoNetworkData.name)
+        if network is None:
             return DataloaderResult(
                 is_success=False,
                 dataloader=t.cast("DataloaderProto", self),
@@ -151,6 +171,6 @@ class RepoNetworkUserDataloader(BaseUserDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=RepoNetworkData(value=load_network_data(data)),
+            data=RepoNetworkData(value=network),
             desc="",
         )
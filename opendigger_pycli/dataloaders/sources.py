@@ -0,0 +1,302 @@
+import abc
+import json
+import logging
+import threading
+import typing as t
+import zipfile
+from pathlib import Path
+
+from opendigger_pycli.config.utils import get_data_source_config
+from opendigger_pycli.utils import json_decoder
+from opendigger_pycli.utils.http import http_get
+
+from .cache import get_response_cache
+from .memo import get_request_memo
+from .mirror import is_mirror_syncing, write_mirror
+
+BASE_API_URL = "https://oss.x-lab.info/open_digger/github/"
+# Size of the chunks of streamed files
+CHUNK_SIZE = 64 * 1024
+
+T = t.TypeVar("T")
+
+logger = logging.getLogger("opendigger-pycli")
+
+
+class FetchError(Exception):
+    """A file could not be fetched, but it may exist (e.g. a 5xx response)"""
+
+
+class DataSource(abc.ABC):
+    """
+    Where the OpenDigger files are loaded from. Files are addressed by their
+    path relative to the API root, e.g. ``X-lab2017/open-digger/openrank.json``.
+    """
+
+    # Local data sources are queried without any access to GitHub
+    is_local: t.ClassVar[bool] = True
+    # Whether iter_chunks reads a file incrementally instead of fetching it whole
+    can_stream: t.ClassVar[bool] = False
+
+    @abc.abstractmethod
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        """
+        Return the content of the file, or None if it does not exist.
+        Raise ``FetchError`` if it is unknown whether the file exists.
+        """
+
+    @abc.abstractmethod
+    def contains(self, dir_path: str) -> bool:
+        """Whether there is any data of the repo or user at ``dir_path``"""
+
+    def _load_memoized(
+        self, key: t.Hashable, data_path: str, load: t.Callable[[], t.Optional[T]]
+    ) -> t.Optional[T]:
+        """
+        Share the result of ``load`` within the current request memo scope.
+        Files which could not be fetched are not memoized and load as None.
+        """
+        memo = get_request_memo()
+        try:
+            return load() if memo is None else memo.get_or_load(key, load)
+        except FetchError as e:
+            logger.warning(f"Failed to fetch {data_path}: {e}")
+            return None
+
+    def load_json(self, data_path: str) -> t.Optional[t.Dict]:
+        """
+        Load and parse a file, every file is loaded at most once per request
+        memo scope and the parsed data is shared by all dataloaders in it.
+        """
+        return self._load_memoized(
+            (self, data_path), data_path, lambda: self._load_json(data_path)
+        )
+
+    def _load_json(self, data_path: str) -> t.Optional[t.Dict]:
+        body = self.fetch(data_path)
+        if body is None:
+            return None
+        write_mirror(data_path, body)
+        return json_decoder.loads(body)
+
+    def iter_chunks(self, data_path: str) -> t.Optional[t.Iterator[bytes]]:
+        """
+        Return the content of the file in chunks, or None if it does not exist.
+        Data sources which can read a file incrementally override this.
+        """
+        body = self.fetch(data_path)
+        if body is None:
+            return None
+        write_mirror(data_path, body)
+        return (
+            body[start : start + CHUNK_SIZE]
+            for start in range(0, len(body), CHUNK_SIZE)
+        )
+
+    def load_stream(
+        self,
+        data_path: str,
+        parse: t.Callable[[t.Iterator[bytes]], T],
+        parse_key: t.Hashable,
+    ) -> t.Optional[T]:
+        """
+        Parse a file from its chunks without loading the whole document,
+        the result is shared by all dataloaders with the same ``parse_key``.
+        """
+
+        def load() -> t.Optional[T]:
+            chunks = self.iter_chunks(data_path)
+            return parse(chunks) if chunks is not None else None
+
+        return self._load_memoized((self, data_path, parse_key), data_path, load)
+
+
+class HttpDataSource(DataSource):
+    is_local = False
+
+    def __init__(self, base_url: str = BASE_API_URL) -> None:
+        self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        url = f"{self.base_url}{data_path}"
+        cache = get_response_cache()
+        entry = cache.lookup(url) if cache is not None else None
+        if cache is not None and entry is not None and cache.is_fresh(entry):
+            if entry.is_missing:
+                return None
+            body = cache.read_body(entry)
+            if body is not None:
+                return body
+
+        # Stale entries are revalidated with a conditional request
+        headers = entry.validators if entry is not None else {}
+        r = http_get(url, headers=headers)
+        if r.status_code == 304 and cache is not None and entry is not None:
+            body = cache.read_body(entry)
+            if body is not None:
+                cache.mark_revalidated(entry)
+                return body
+            r = http_get(url)
+        if r.status_code == 404:
+            if cache is not None:
+                cache.store_missing(url)
+            return None
+        if r.status_code != 200:
+            raise FetchError(f"GET {url} returned {r.status_code}")
+        if cache is not None:
+            cache.store(
+                url,
+                r.content,
+                etag=r.headers.get("ETag"),
+                last_modified=r.headers.get("Last-Modified"),
+            )
+        return r.content
+
+    def contains(self, dir_path: str) -> bool:
+        # The API has no directory listing, existence is checked on GitHub
+        return True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.base_url!r})"
+
+
+class LocalDataSource(DataSource):
+    """A directory created by ``opendigger mirror sync``"""
+
+    can_stream = True
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        try:
+            return self.root.joinpath(*data_path.split("/")).read_bytes()
+        except OSError:
+            return None
+
+    def iter_chunks(self, data_path: str) -> t.Optional[t.Iterator[bytes]]:
+        if is_mirror_syncing():
+            return super().iter_chunks(data_path)
+        file_path = self.root.joinpath(*data_path.split("/"))
+        if not file_path.is_file():
+            return None
+
+        def read_chunks() -> t.Iterator[bytes]:
+            with file_path.open("rb") as f:
+                yield from iter(lambda: f.read(CHUNK_SIZE), b"")
+
+        return read_chunks()
+
+    def contains(self, dir_path: str) -> bool:
+        return self.root.joinpath(*dir_path.split("/")).is_dir()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.root)!r})"
+
+
+class ArchiveDataSource(DataSource):
+    """A zip archive of a mirror, with the files at the root of the archive"""
+
+    def __init__(self, archive_path: Path) -> None:
+        self.archive_path = archive_path
+        self._archive = zipfile.ZipFile(archive_path)
+        self._names = set(self._archive.namelist())
+        self._lock = threading.Lock()
+
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        if data_path not in self._names:
+            return None
+        with self._lock:
+            return self._archive.read(data_path)
+
+    def contains(self, dir_path: str) -> bool:
+        prefix = f"{dir_path.rstrip('/')}/"
+        return any(name.startswith(prefix) for name in self._names)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.archive_path)!r})"
+
+
+class MemoryDataSource(DataSource):
+    """Files kept in memory, used as fixtures in tests"""
+
+    def __init__(
+        self, files: t.Optional[t.Mapping[str, t.Union[bytes, t.Dict]]] = None
+    ) -> None:
+        self.files: t.Dict[str, bytes] = {}
+        for data_path, content in (files or {}).items():
+            self.add(data_path, content)
+
+    def add(self, data_path: str, content: t.Union[bytes, t.Dict]) -> None:
+        self.files[data_path] = (
+            content if isinstance(content, bytes) else json.dumps(content).encode()
+        )
+
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        return self.files.get(data_path)
+
+    def contains(self, dir_path: str) -> bool:
+        prefix = f"{dir_path.rstrip('/')}/"
+        return any(data_path.startswith(prefix) for data_path in self.files)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.files)} files)"
+
+
+def parse_data_source(location: str) -> DataSource:
+    """
+    Build a data source from a location, which is an HTTP(S) URL,
+    a mirror directory or a zip archive of a mirror.
+    """
+    location = location.strip().strip('"')
+    if location.startswith(("http://", "https://")):
+        return HttpDataSource(location)
+
+    path = Path(location).expanduser().resolve()
+    if path.is_dir():
+        return LocalDataSource(path)
+    if path.is_file() and zipfile.is_zipfile(path):
+        return ArchiveDataSource(path)
+    raise ValueError(
+        f"{location} is not a URL, a mirror directory or a zip archive of a mirror"
+    )
+
+
+_data_source: t.Optional[DataSource] = None
+_data_source_lock = threading.Lock()
+
+
+def configure_data_source(data_source: t.Optional[DataSource]) -> None:
+    """
+    Override the data source of the config file for this process,
+    used by the ``--data-source`` option and tests.
+    """
+    global _data_source
+
+    with _data_source_lock:
+        _data_source = data_source
+
+
+def get_data_source() -> DataSource:
+    global _data_source
+
+    with _data_source_lock:
+        if _data_source is None:
+            location = get_data_source_config().location
+            try:
+                _data_source = parse_data_source(location)
+            except ValueError:
+                _data_source = HttpDataSource()
+        return _data_source
+
+
+def get_remote_data_source() -> DataSource:
+    """
+    The configured data source if it fetches from the network, e.g. a caching
+    proxy, otherwise OpenDigger itself. Used to sync mirrors, syncing from a
+    local mirror would only copy its files.
+    """
+    data_source = get_data_source()
+    if data_source.is_local:
+        return HttpDataSource()
+    return data_source
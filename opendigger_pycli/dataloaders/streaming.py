@@ -0,0 +1,314 @@
+import codecs
+import heapq
+import json
+import json.scanner
+import re
+import typing as t
+from dataclasses import dataclass
+
+from opendigger_pycli.datatypes import (
+    NAME_VALUE_NETWORK,
+    OPENRANK_NETWORK,
+    BaseNetworkData,
+    CompactNetworkBuilder,
+    NameAndValue,
+    NameNameAndValue,
+    ProjectOpenRankNetworkEdgeDict,
+    ProjectOpenRankNetworkNodeDict,
+)
+
+T = t.TypeVar("T")
+
+_WHITESPACE = " \t\n\r"
+_VALUE_ENDS = ",]}" + _WHITESPACE
+_ARRAY_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+
+class JsonStreamReader:
+    """
+    Incremental reader of a JSON document from chunks of bytes. Only the
+    unread part of the current chunks is kept, values are decoded one by one
+    with ``json.JSONDecoder.raw_decode``.
+    """
+
+    def __init__(self, chunks: t.Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scan_once = json.scanner.make_scanner(json.JSONDecoder())
+        self._buffer = ""
+        self._pos = 0
+        self._is_eof = False
+
+    def _read_more(self) -> bool:
+        if self._is_eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._is_eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(chunk)
+        # Drop the part of the buffer which has been read
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or "" at the end of the document"""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buffer):
+                return buffer[self._pos]
+            if not self._read_more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self._buffer, self._pos
+            )
+        self._pos += 1
+        return char
+
+    def read_value(self) -> t.Any:
+        """Decode the next value, reading more chunks until it is complete"""
+        if self._pos >= len(self._buffer) or self._buffer[self._pos] in _WHITESPACE:
+            self.peek()
+        while True:
+            try:
+                value, end = self._scan_once(self._buffer, self._pos)
+            except (StopIteration, json.JSONDecodeError):
+                if self._read_more():
+                    continue
+                raise json.JSONDecodeError(
+                    "Expecting value", self._buffer, self._pos
+                ) from None
+            # A number at the end of the buffer may continue in the next chunk
+            if (
+                type(value) in (int, float)
+                and (end == len(self._buffer) or self._buffer[end] not in _VALUE_ENDS)
+                and self._read_more()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> t.Iterator[t.Any]:
+        """Iterate the items of the array at the current position"""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            # Fast path for a separator which is complete in the buffer
+            match = _ARRAY_SEPARATOR.match(self._buffer, self._pos)
+            if match is not None and match.end() < len(self._buffer):
+                self._pos = match.end()
+                if match.group(1) == "]":
+                    return
+            elif self.expect(",]") == "]":
+                return
+
+    def iter_object(self) -> t.Iterator[str]:
+        """
+        Iterate the keys of the object at the current position, the value
+        of each key must be read (or skipped) before the next key.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+
+class Pruner(t.Generic[T]):
+    """
+    Keep the items with a weight of at least ``min_weight``, and only the
+    ``top_k`` heaviest of them. Items are returned by descending weight,
+    items with the same weight keep their order.
+    """
+
+    def __init__(
+        self,
+        get_weight: t.Callable[[T], float],
+        top_k: t.Optional[int] = None,
+        min_weight: t.Optional[float] = None,
+    ) -> None:
+        self.get_weight = get_weight
+        self.top_k = top_k
+        self.min_weight = min_weight
+        self._heap: t.List[t.Tuple[float, int, T]] = []
+        self._count = 0
+
+    def add(self, item: T) -> None:
+        weight = self.get_weight(item)
+        if self.min_weight is not None and weight < self.min_weight:
+            return
+        # Earlier items win ties, like a stable sort by descending weight
+        entry = (weight, -self._count, item)
+        self._count += 1
+        if self.top_k is None or len(self._heap) < self.top_k:
+            self._heap.append(entry)
+            if self.top_k is not None and len(self._heap) == self.top_k:
+                heapq.heapify(self._heap)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def result(self) -> t.List[T]:
+        self._heap.sort(key=lambda entry: entry[:2], reverse=True)
+        return [item for _, _, item in self._heap]
+
+
+@dataclass(frozen=True)
+class NetworkPruning:
+    """How many nodes and edges of a network are kept while it is parsed"""
+
+    top_k_nodes: t.Optional[int] = None
+    top_k_edges: t.Optional[int] = None
+    min_node_weight: t.Optional[float] = None
+    min_edge_weight: t.Optional[float] = None
+
+    @property
+    def is_pruning(self) -> bool:
+        return any(
+            limit is not None
+            for limit in (
+                self.top_k_nodes,
+                self.top_k_edges,
+                self.min_node_weight,
+                self.min_edge_weight,
+            )
+        )
+
+
+def _parse_network_stream(
+    chunks: t.Iterable[bytes],
+    edges_key: str,
+    add_node: t.Callable[[t.Any], None],
+    add_edge: t.Callable[[t.Any], None],
+    get_node_name: t.Callable[[t.Any], str],
+    get_node_weight: t.Callable[[t.Any], float],
+    get_edge_names: t.Callable[[t.Any], t.Tuple[str, str]],
+    get_edge_weight: t.Callable[[t.Any], float],
+    pruning: NetworkPruning,
+) -> None:
+    """
+    Pass the nodes and edges of a network file to ``add_node``/``add_edge``.
+    Nodes and edges are pruned as the items of the file, so only the kept
+    ones are passed on.
+    """
+    use_pruner = pruning.is_pruning
+    node_pruner: "Pruner[t.Any]" = Pruner(
+        get_node_weight, pruning.top_k_nodes, pruning.min_node_weight
+    )
+    edge_pruner: "Pruner[t.Any]" = Pruner(
+        get_edge_weight, pruning.top_k_edges, pruning.min_edge_weight
+    )
+    node_names: t.Optional[t.Set[str]] = None
+
+    reader = JsonStreamReader(chunks)
+    for key in reader.iter_object():
+        if key == "nodes" and reader.peek() == "[":
+            if not use_pruner:
+                for item in reader.iter_array():
+                    add_node(item)
+                continue
+            for item in reader.iter_array():
+                node_pruner.add(item)
+            kept_nodes = node_pruner.result()
+            if pruning.top_k_nodes is not None or pruning.min_node_weight is not None:
+                node_names = {get_node_name(item) for item in kept_nodes}
+            for item in kept_nodes:
+                add_node(item)
+        elif key == edges_key and reader.peek() == "[":
+            if not use_pruner:
+                for item in reader.iter_array():
+                    add_edge(item)
+                continue
+            for item in reader.iter_array():
+                # Edges of pruned nodes are dropped, if the nodes came first
+                if node_names is None or all(
+                    name in node_names for name in get_edge_names(item)
+                ):
+                    edge_pruner.add(item)
+            for item in edge_pruner.result():
+                add_edge(item)
+        else:
+            reader.read_value()
+
+
+def parse_network_stream(
+    chunks: t.Iterable[bytes],
+    pruning: NetworkPruning = NetworkPruning(),
+    compact: bool = False,
+) -> BaseNetworkData[NameAndValue, NameNameAndValue]:
+    """
+    Parse ``developer_network``/``repo_network`` data from chunks of the file.
+    The parser keeps the order of the file, or the descending weight of the
+    pruned items; the nodes and edges are then sorted by descending value by
+    ``BaseNetworkData``, or by ``CompactNetworkBuilder`` with ``compact``, like
+    ``load_network_data``. With ``compact``, the items are added to a
+    ``CompactNetworkData`` as they are parsed.
+    """
+    nodes: t.List[NameAndValue] = []
+    edges: t.List[NameNameAndValue] = []
+    builder = CompactNetworkBuilder(NAME_VALUE_NETWORK)
+    _parse_network_stream(
+        chunks,
+        edges_key="edges",
+        add_node=builder.add_node
+        if compact
+        else lambda node: nodes.append(NameAndValue(name=node[0], value=node[1])),
+        add_edge=builder.add_edge
+        if compact
+        else lambda edge: edges.append(
+            NameNameAndValue(name0=edge[0], name1=edge[1], value=edge[2])
+        ),
+        get_node_name=lambda node: node[0],
+        get_node_weight=lambda node: node[1],
+        get_edge_names=lambda edge: (edge[0], edge[1]),
+        get_edge_weight=lambda edge: edge[2],
+        pruning=pruning,
+    )
+    if compact:
+        return t.cast(BaseNetworkData, builder.build())
+    return BaseNetworkData(nodes=nodes, edges=edges)
+
+
+def parse_openrank_network_stream(
+    chunks: t.Iterable[bytes],
+    pruning: NetworkPruning = NetworkPruning(),
+    compact: bool = False,
+) -> BaseNetworkData[ProjectOpenRankNetworkNodeDict, ProjectOpenRankNetworkEdgeDict]:
+    """
+    Parse ``project_openrank_detail`` data from chunks of the file, nodes and
+    links keep the order of the file unless they are pruned by weight. With
+    ``compact``, the items are added to a ``CompactNetworkData`` as they are
+    parsed.
+    """
+    nodes: t.List[ProjectOpenRankNetworkNodeDict] = []
+    edges: t.List[ProjectOpenRankNetworkEdgeDict] = []
+    builder = CompactNetworkBuilder(OPENRANK_NETWORK)
+    _parse_network_stream(
+        chunks,
+        edges_key="links",
+        add_node=builder.add_node if compact else nodes.append,
+        add_edge=builder.add_edge if compact else edges.append,
+        get_node_name=lambda node: node["id"],
+        get_node_weight=lambda node: node["v"],
+        get_edge_names=lambda edge: (edge["s"], edge["t"]),
+        get_edge_weight=lambda edge: edge["w"],
+        pruning=pruning,
+    )
+    if compact:
+        return t.cast(BaseNetworkData, builder.build())
+    return BaseNetworkData(nodes=nodes, edges=edges)
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import typing as t
+
+from opendigger_pycli.dataloaders import (
+    OpenRankRepoDataloader,
+    ProjectOpenRankNetworkRepoDataloader,
+    run_dataloaders,
+)
+from opendigger_pycli.dataloaders.sources import (
+    MemoryDataSource,
+    configure_data_source,
+)
+from opendigger_pycli.datatypes import AsyncDataloaderProto, DataloaderResult
+
+
+class SyncOnlyDataloader:
+    name = "sync_only"
+    pass_date = False
+    indicator_type = "metric"
+    introducer = "X-lab"
+    type = "repo"
+    demo_url = ""
+
+    def __init__(self) -> None:
+        self.thread_names: t.Set[str] = set()
+
+    def load(self, org: str, repo: str) -> DataloaderResult:
+        self.thread_names.add(threading.current_thread().name)
+        return DataloaderResult(
+            is_success=True, dataloader=t.cast(t.Any, self), desc=f"{org}/{repo}"
+        )
+
+
+class AsyncOnlyDataloader(SyncOnlyDataloader):
+    name = "async_only"
+
+    async def aload(self, org: str, repo: str) -> DataloaderResult:
+        await asyncio.sleep(0)
+        return DataloaderResult(
+            is_success=True, dataloader=t.cast(t.Any, self), desc=f"async {repo}"
+        )
+
+
+def test_registered_dataloaders_are_async():
+    assert isinstance(OpenRankRepoDataloader(), AsyncDataloaderProto)
+    assert isinstance(ProjectOpenRankNetworkRepoDataloader(), AsyncDataloaderProto)
+    assert not isinstance(SyncOnlyDataloader(), AsyncDataloaderProto)
+
+
+def test_run_dataloaders():
+    sync_dataloader = SyncOnlyDataloader()
+    async_dataloader = AsyncOnlyDataloader()
+    load_jobs = [
+        (sync_dataloader if i % 2 else async_dataloader, ("org", f"repo-{i}"))
+        for i in range(200)
+    ]
+    loaded = []
+    results = run_dataloaders(
+        t.cast(t.Any, load_jobs), 4, lambda index, _: loaded.append(index)
+    )
+
+    assert sorted(loaded) == list(range(200))
+    assert [result.desc for result in results] == [
+        f"org/repo-{i}" if i % 2 else f"async repo-{i}" for i in range(200)
+    ]
+    assert len(sync_dataloader.thread_names) <= 4
+
+
+class RecordingOpenRankNetworkDataloader(ProjectOpenRankNetworkRepoDataloader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.thread_names: t.Set[str] = set()
+
+    def _load_month(self, org: str, repo: str, date: t.Tuple[int, int]):
+        self.thread_names.add(threading.current_thread().name)
+        return super()._load_month(org, repo, date)
+
+
+def test_openrank_network_months_share_the_fetch_executor():
+    dates = [(2023, month) for month in range(1, 13)]
+    configure_data_source(
+        MemoryDataSource(
+            {
+                f"org/repo/project_openrank_detail/{year}-{month:02d}.json": {
+                    "nodes": [{"id": "u", "n": "u", "c": "u", "i": 1, "r": 1, "v": 1}],
+                    "links": [],
+                }
+                for year, month in dates
+            }
+        )
+    )
+    try:
+        dataloader = RecordingOpenRankNetworkDataloader()
+        (result,) = run_dataloaders([(dataloader, ("org", "repo", dates))], 2)
+    finally:
+        configure_data_source(None)
+
+    assert result.data is not None
+    assert [base_data.month for base_data in result.data.value] == list(range(1, 13))
+    # No pool of its own, the months run on the 2 threads of run_dataloaders
+    assert len(dataloader.thread_names) <= 2
@@ -0,0 +1,85 @@
+import os
+import time
+
+from opendigger_pycli.dataloaders.cache import ResponseCache
+
+TEST_URL = (
+    "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/openrank.json"
+)
+
+
+def test_response_cache_store_and_lookup(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=60, max_size=1024)
+    assert cache.lookup(TEST_URL) is None
+
+    cache.store(TEST_URL, b'{"2023-01": 1.0}', etag='"abc"')
+    entry = cache.lookup(TEST_URL)
+    assert entry is not None
+    assert cache.is_fresh(entry)
+    assert entry.validators == {"If-None-Match": '"abc"'}
+    assert cache.read_body(entry) == b'{"2023-01": 1.0}'
+
+    refresh_cache = ResponseCache(tmp_path, ttl=60, max_size=1024, refresh=True)
+    assert not refresh_cache.is_fresh(entry)
+
+    entry.fetched_at = time.time() - 120
+    assert not cache.is_fresh(entry)
+    assert cache.is_fresh(cache.mark_revalidated(entry))
+
+
+def test_response_cache_lru_eviction(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=60, max_size=25)
+    cache.store(TEST_URL + "?0", b"0" * 10)
+    cache.store(TEST_URL + "?1", b"1" * 10)
+    # Access the first entry so that the second one is the least recently used
+    first_entry = cache.lookup(TEST_URL + "?0")
+    assert first_entry is not None
+    os.utime(cache._entry_path(TEST_URL + "?1"), (0, 0))
+    cache.store(TEST_URL + "?2", b"2" * 10)
+
+    assert cache.lookup(TEST_URL + "?0") is not None
+    assert cache.lookup(TEST_URL + "?1") is None
+    assert cache.lookup(TEST_URL + "?2") is not None
+
+
+def test_response_cache_negative_entry(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=60, max_size=25, negative_ttl=10)
+    cache.store_missing(TEST_URL)
+    entry = cache.lookup(TEST_URL)
+    assert entry is not None and entry.is_missing
+    assert cache.is_fresh(entry)
+    assert entry.validators == {}
+
+    entry.fetched_at = time.time() - 30
+    assert not cache.is_fresh(entry)
+
+    # Negative entries take no space and are never evicted
+    cache.store(TEST_URL + "?0", b"0" * 30)
+    assert cache.lookup(TEST_URL) is not None
+
+
+def test_response_cache_replaced_entry_releases_blob(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=60, max_size=1024)
+    cache.store(TEST_URL, b"0" * 10)
+    cache.store(TEST_URL + "?shared", b"1" * 10)
+    cache.store(TEST_URL + "?other", b"1" * 10)
+
+    # The blob of a URL which is not found any more is deleted
+    cache.store_missing(TEST_URL)
+    assert len(list(cache.blobs_dir.iterdir())) == 1
+    assert cache._get_total_size() == 10
+
+    # A blob which is still referred to by another entry is kept
+    cache.store(TEST_URL + "?shared", b"2" * 10)
+    assert cache.read_body(cache.lookup(TEST_URL + "?other")) == b"1" * 10
+    cache.store_missing(TEST_URL + "?other")
+    assert [path.name for path in cache.blobs_dir.iterdir()] == [
+        cache.lookup(TEST_URL + "?shared").blob
+    ]
+    assert cache._get_total_size() == 10
+
+    # A new cache counts the references from the entries on disk
+    cache = ResponseCache(tmp_path, ttl=60, max_size=1024)
+    cache.store_missing(TEST_URL + "?shared")
+    assert list(cache.blobs_dir.iterdir()) == []
+    assert cache._get_total_size() == 0
@@ -0,0 +1,69 @@
+import json
+
+from opendigger_pycli.dataloaders import OpenRankRepoDataloader, sources
+from opendigger_pycli.dataloaders.mirror import (
+    configure_mirror_sync,
+    get_mirror_load_jobs,
+    sync_mirror,
+)
+from opendigger_pycli.dataloaders.sources import (
+    LocalDataSource,
+    MemoryDataSource,
+    configure_data_source,
+    get_data_source,
+)
+
+
+def test_mirror_sync_and_data_source(tmp_path):
+    configure_data_source(
+        MemoryDataSource({"X-lab2017/open-digger/openrank.json": {"2023-01": 1.5}})
+    )
+    configure_mirror_sync(tmp_path)
+    try:
+        assert OpenRankRepoDataloader().load("X-lab2017", "open-digger").is_success
+    finally:
+        configure_mirror_sync(None)
+    assert (tmp_path / "X-lab2017" / "open-digger" / "openrank.json").exists()
+
+    configure_data_source(LocalDataSource(tmp_path))
+    try:
+        dataloader = OpenRankRepoDataloader()
+        success_data = dataloader.load("X-lab2017", "open-digger")
+        assert success_data.is_success
+        assert success_data.data is not None
+        assert success_data.data.value[0].value == 1.5
+
+        fail_data = dataloader.load("X-lab2017", "non-exist-repo")
+        assert not fail_data.is_success
+    finally:
+        configure_data_source(None)
+
+
+def test_sync_mirror_downloads_from_opendigger(tmp_path, monkeypatch):
+    # The configured data source is a mirror with outdated data
+    old_mirror = tmp_path / "old"
+    (old_mirror / "X-lab2017" / "open-digger").mkdir(parents=True)
+    (old_mirror / "X-lab2017" / "open-digger" / "openrank.json").write_text(
+        json.dumps({"2022-01": 1.0})
+    )
+    old_data_source = LocalDataSource(old_mirror)
+    opendigger = MemoryDataSource(
+        {"X-lab2017/open-digger/openrank.json": {"2023-01": 1.5}}
+    )
+    monkeypatch.setattr(sources, "HttpDataSource", lambda: opendigger)
+    configure_data_source(old_data_source)
+    try:
+        load_jobs = [
+            load_job
+            for load_job in get_mirror_load_jobs([("X-lab2017", "open-digger")])
+            if load_job[0].name == "openrank"
+        ]
+        (result,) = sync_mirror(tmp_path / "new", load_jobs, 1)
+        assert result.is_success
+        assert get_data_source() is old_data_source
+    finally:
+        configure_data_source(None)
+
+    assert json.loads(
+        (tmp_path / "new" / "X-lab2017" / "open-digger" / "openrank.json").read_text()
+    ) == {"2023-01": 1.5}
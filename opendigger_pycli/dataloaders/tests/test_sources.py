@@ -0,0 +1,155 @@
+import contextvars
+import threading
+import time
+import typing as t
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opendigger_pycli.dataloaders.memo import (
+    RequestMemo,
+    get_request_memo,
+    request_memo_scope,
+)
+from opendigger_pycli.dataloaders.sources import (
+    ArchiveDataSource,
+    FetchError,
+    HttpDataSource,
+    LocalDataSource,
+    MemoryDataSource,
+    parse_data_source,
+)
+from opendigger_pycli.utils import json_decoder
+
+TEST_DATA_PATH = "X-lab2017/open-digger/openrank.json"
+
+
+def test_parse_data_source(tmp_path):
+    http_data_source = parse_data_source("http://127.0.0.1:8080/github")
+    assert isinstance(http_data_source, HttpDataSource)
+    assert http_data_source.base_url == "http://127.0.0.1:8080/github/"
+    assert not http_data_source.is_local
+
+    assert isinstance(parse_data_source(str(tmp_path)), LocalDataSource)
+
+    archive_path = tmp_path / "mirror.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr(TEST_DATA_PATH, b'{"2023-01": 1.5}')
+    assert isinstance(parse_data_source(str(archive_path)), ArchiveDataSource)
+
+    with pytest.raises(ValueError):
+        parse_data_source(str(tmp_path / "non-exist"))
+
+
+def test_local_data_sources(tmp_path):
+    (tmp_path / "X-lab2017" / "open-digger").mkdir(parents=True)
+    (tmp_path / TEST_DATA_PATH).write_bytes(b'{"2023-01": 1.5}')
+    archive_path = tmp_path / "mirror.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr(TEST_DATA_PATH, b'{"2023-01": 1.5}')
+
+    for data_source in (
+        LocalDataSource(tmp_path),
+        ArchiveDataSource(archive_path),
+        MemoryDataSource({TEST_DATA_PATH: {"2023-01": 1.5}}),
+    ):
+        assert data_source.load_json(TEST_DATA_PATH) == {"2023-01": 1.5}
+        assert data_source.load_json("X-lab2017/non-exist/openrank.json") is None
+        assert data_source.contains("X-lab2017/open-digger")
+        assert not data_source.contains("X-lab2017/open")
+
+
+class CountingDataSource(MemoryDataSource):
+    def __init__(self) -> None:
+        super().__init__({TEST_DATA_PATH: {"2023-01": 1.5}})
+        self.fetch_count = 0
+        self.barrier = threading.Barrier(8, timeout=5)
+
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        self.fetch_count += 1
+        time.sleep(0.05)
+        return super().fetch(data_path)
+
+    def load_json_after_barrier(self, data_path: str) -> t.Optional[t.Dict]:
+        self.barrier.wait()
+        return self.load_json(data_path)
+
+
+def test_request_memo_single_flight():
+    data_source = CountingDataSource()
+    with request_memo_scope(), ThreadPoolExecutor(max_workers=8) as executor:
+        # Threads of the executor do not inherit the context by themselves
+        contexts = [contextvars.copy_context() for _ in range(8)]
+        results = list(
+            executor.map(
+                lambda context: context.run(
+                    data_source.load_json_after_barrier, TEST_DATA_PATH
+                ),
+                contexts,
+            )
+        )
+        assert data_source.fetch_count == 1
+        assert all(result is results[0] for result in results)
+
+        assert data_source.load_json("X-lab2017/non-exist/openrank.json") is None
+        assert data_source.load_json("X-lab2017/non-exist/openrank.json") is None
+        assert data_source.fetch_count == 2
+
+    # The memo is dropped with its scope, without a scope nothing is memoized
+    assert get_request_memo() is None
+    data_source.load_json(TEST_DATA_PATH)
+    data_source.load_json(TEST_DATA_PATH)
+    assert data_source.fetch_count == 4
+
+
+class FlakyDataSource(MemoryDataSource):
+    def __init__(self) -> None:
+        super().__init__({TEST_DATA_PATH: {"2023-01": 1.5}})
+        self.fetch_count = 0
+
+    def fetch(self, data_path: str) -> t.Optional[bytes]:
+        self.fetch_count += 1
+        if self.fetch_count == 1:
+            raise FetchError("503")
+        return super().fetch(data_path)
+
+
+def test_request_memo_does_not_keep_fetch_errors():
+    data_source = FlakyDataSource()
+    with request_memo_scope():
+        assert data_source.load_json(TEST_DATA_PATH) is None
+        assert data_source.load_json(TEST_DATA_PATH) == {"2023-01": 1.5}
+        assert data_source.load_json(TEST_DATA_PATH) == {"2023-01": 1.5}
+    assert data_source.fetch_count == 2
+
+
+def test_request_memo_does_not_keep_failures():
+    memo = RequestMemo()
+
+    def fail() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        memo.get_or_load("key", fail)
+    assert memo.get_or_load("key", lambda: 1) == 1
+    assert memo.get_or_load("key", lambda: 2) == 1
+
+
+@pytest.mark.parametrize("decoder_name", ["json", "orjson"])
+def test_json_decoders(decoder_name):
+    if decoder_name == "orjson":
+        pytest.importorskip("orjson")
+    body = '{"2023-01": 1.5, "nodes": [["X-lab2017/open-digger", 2.0]], "name": "开源"}'
+    try:
+        json_decoder.configure_json_decoder(decoder_name)
+        assert json_decoder.get_json_decoder()[0] == decoder_name
+        assert MemoryDataSource({"a.json": body.encode()})._load_json("a.json") == {
+            "2023-01": 1.5,
+            "nodes": [["X-lab2017/open-digger", 2.0]],
+            "name": "开源",
+        }
+        with pytest.raises(ValueError):
+            json_decoder.loads(b"{")
+    finally:
+        json_decoder.configure_json_decoder(None)
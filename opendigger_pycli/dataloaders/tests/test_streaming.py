@@ -0,0 +1,227 @@
+import json
+import random
+import typing as t
+
+import pytest
+
+from opendigger_pycli.dataloaders.sources import (
+    LocalDataSource,
+    MemoryDataSource,
+    configure_data_source,
+)
+from opendigger_pycli.dataloaders.streaming import (
+    JsonStreamReader,
+    NetworkPruning,
+    parse_network_stream,
+    parse_openrank_network_stream,
+)
+from opendigger_pycli.dataloaders import utils as dataloader_utils
+from opendigger_pycli.dataloaders.utils import (
+    NetworkOptions,
+    configure_network_options,
+    fetch_network,
+    get_developer_network,
+    get_network_options,
+    load_network_data,
+)
+from opendigger_pycli.datatypes import CompactNetworkData, GraphConfig
+
+
+def split_chunks(body: bytes, size: int):
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+def make_network(node_count: int = 50, edge_count: int = 200):
+    rng = random.Random(0)
+    names = [f"开发者-{i}" for i in range(node_count)]
+    return {
+        "nodes": [[name, round(rng.uniform(0, 10), 1)] for name in names],
+        "edges": [
+            [rng.choice(names), rng.choice(names), rng.choice([1, 2.5, 1e-3, 3])]
+            for _ in range(edge_count)
+        ],
+        "meta": {"skipped": [1, {"a": None}], "flag": True},
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_parse_network_stream_matches_load_network_data(chunk_size):
+    data = make_network()
+    body = json.dumps(data, ensure_ascii=False, indent=1).encode()
+    network = parse_network_stream(split_chunks(body, chunk_size))
+    assert network == load_network_data(data)
+
+
+def test_parse_network_stream_pruning():
+    data = make_network()
+    body = json.dumps(data).encode()
+    pruning = NetworkPruning(top_k_nodes=10, top_k_edges=5, min_edge_weight=2)
+    network = parse_network_stream(split_chunks(body, 100), pruning)
+
+    expected = load_network_data(data)
+    assert network.nodes == expected.nodes[:10]
+    kept_names = {node.name for node in network.nodes}
+    assert (
+        network.edges
+        == [
+            edge
+            for edge in expected.edges
+            if edge.value >= 2 and edge.name0 in kept_names and edge.name1 in kept_names
+        ][:5]
+    )
+
+
+def test_parse_openrank_network_stream():
+    data = {
+        "nodes": [
+            {"id": "a", "n": "a", "c": "u", "i": 1, "r": 1, "v": 1.0},
+            {"id": "b", "n": "b", "c": "u", "i": 1, "r": 1, "v": 3.0},
+            {"id": "c", "n": "c", "c": "r", "i": 1, "r": 1, "v": 2.0},
+        ],
+        "links": [
+            {"s": "a", "t": "b", "w": 1},
+            {"s": "b", "t": "c", "w": 2},
+        ],
+    }
+    body = json.dumps(data).encode()
+    assert parse_openrank_network_stream([body]).nodes == data["nodes"]
+
+    network = parse_openrank_network_stream(
+        split_chunks(body, 3), NetworkPruning(top_k_nodes=2)
+    )
+    assert [node["id"] for node in network.nodes] == ["b", "c"]
+    assert network.edges == [{"s": "b", "t": "c", "w": 2}]
+
+
+@pytest.mark.parametrize(
+    "pruning", [NetworkPruning(), NetworkPruning(top_k_nodes=10, top_k_edges=5)]
+)
+def test_parse_network_stream_compact(pruning):
+    body = json.dumps(make_network()).encode()
+    network = parse_network_stream(split_chunks(body, 100), pruning)
+    compact = parse_network_stream(split_chunks(body, 100), pruning, compact=True)
+    assert isinstance(compact, CompactNetworkData)
+    assert compact == network
+
+    data = {
+        "links": [{"s": "a", "t": "b", "w": 1}],
+        "nodes": [{"id": "b", "n": "b", "v": 1.0}, {"id": "a", "v": 2.0}],
+    }
+    compact = parse_openrank_network_stream([json.dumps(data).encode()], compact=True)
+    assert list(compact.nodes) == data["nodes"]
+    assert list(compact.edges) == data["links"]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_parse_network_stream_sorts_by_value(compact):
+    body = json.dumps(
+        {
+            "nodes": [["a", 1], ["b", 3], ["c", 2]],
+            "edges": [["a", "b", 1], ["b", "c", 5]],
+        }
+    ).encode()
+
+    network = parse_network_stream([body], compact=compact)
+
+    assert [(node.name, node.value) for node in network.nodes] == [
+        ("b", 3),
+        ("c", 2),
+        ("a", 1),
+    ]
+    assert [(edge.name0, edge.name1) for edge in network.edges] == [
+        ("b", "c"),
+        ("a", "b"),
+    ]
+
+
+def test_json_stream_reader_errors():
+    reader = JsonStreamReader([b'{"nodes": [1, 2'])
+    key = next(reader.iter_object())
+    assert key == "nodes"
+    with pytest.raises(json.JSONDecodeError):
+        list(reader.iter_array())
+
+
+def test_local_data_source_streams_files(tmp_path):
+    body = json.dumps(make_network()).encode()
+    (tmp_path / "org" / "repo").mkdir(parents=True)
+    (tmp_path / "org" / "repo" / "developer_network.json").write_bytes(body)
+
+    data_source = LocalDataSource(tmp_path)
+    assert data_source.iter_chunks("org/repo/missing.json") is None
+    chunks = data_source.iter_chunks("org/repo/developer_network.json")
+    assert b"".join(chunks) == body
+    network = data_source.load_stream(
+        "org/repo/developer_network.json", parse_network_stream, "test"
+    )
+    assert network == load_network_data(json.loads(body))
+
+
+class RecordingMemoryDataSource(MemoryDataSource):
+    def __init__(self, files) -> None:
+        super().__init__(files)
+        self.streamed: t.List[str] = []
+
+    def iter_chunks(self, data_path: str) -> t.Optional[t.Iterator[bytes]]:
+        self.streamed.append(data_path)
+        return super().iter_chunks(data_path)
+
+
+def test_fetch_network_only_streams_local_files(tmp_path):
+    data = make_network()
+    data_source = RecordingMemoryDataSource({"u/developer_network.json": data})
+    (tmp_path / "u").mkdir()
+    (tmp_path / "u" / "developer_network.json").write_text(json.dumps(data))
+    configure_network_options(NetworkOptions())
+    try:
+        # Without pruning, a fetched file is decoded at once
+        configure_data_source(data_source)
+        assert get_developer_network("u", "developer_network") == load_network_data(
+            data
+        )
+        assert data_source.streamed == []
+
+        configure_data_source(LocalDataSource(tmp_path))
+        assert get_developer_network("u", "developer_network") == load_network_data(
+            data
+        )
+    finally:
+        configure_data_source(None)
+        configure_network_options(None)
+
+
+def test_fetch_network_with_options():
+    data = make_network()
+    data_source = RecordingMemoryDataSource({"u/developer_network.json": data})
+    configure_data_source(data_source)
+    try:
+        network = fetch_network(
+            "u/developer_network.json",
+            parse_network_stream,
+            load_network_data,
+            NetworkOptions(NetworkPruning(top_k_nodes=3), compact=True),
+        )
+        assert data_source.streamed == ["u/developer_network.json"]
+        assert isinstance(network, CompactNetworkData)
+        assert list(network.nodes) == load_network_data(data).nodes[:3]
+    finally:
+        configure_data_source(None)
+
+
+def test_network_options_are_read_once(monkeypatch):
+    graph_configs = []
+
+    def get_graph_config():
+        graph_configs.append(GraphConfig(top_k_nodes="5", compact="true"))
+        return graph_configs[-1]
+
+    monkeypatch.setattr(dataloader_utils, "get_graph_config", get_graph_config)
+    configure_network_options(None)
+    try:
+        assert get_network_options() == NetworkOptions(
+            NetworkPruning(top_k_nodes=5), compact=True
+        )
+        get_network_options()
+        assert len(graph_configs) == 1
+    finally:
+        configure_network_options(None)
@@ -1,10 +1,22 @@
+import threading
 import typing as t
+from dataclasses import dataclass, field
 
-import requests
-
+from opendigger_pycli.config.utils import (
+    get_graph_config,
+    get_series_config,
+    parse_bool,
+    parse_optional_float,
+    parse_optional_positive_int,
+)
 from opendigger_pycli.datatypes import (
+    NAME_VALUE_NETWORK,
+    OPENRANK_NETWORK,
     BaseData,
     BaseNetworkData,
+    ColumnarSeries,
+    CompactNetworkData,
+    GraphConfig,
     NameAndValue,
     NameNameAndValue,
     ProjectOpenRankNetworkEdgeDict,
@@ -12,39 +24,193 @@ from opendigger_pycli.datatypes import (
     TimeDurationRelatedIndicatorDict,
 )
 
-BASE_API_URL = "https://oss.x-lab.info/open_digger/github/"
+from .sources import get_data_source
+from .streaming import (
+    NetworkPruning,
+    parse_network_stream,
+    parse_openrank_network_stream,
+)
 
-T = t.TypeVar("T")
 
+def fetch_json(data_path: str) -> t.Optional[t.Dict]:
+    """
+    Load the OpenDigger file at ``data_path`` from the configured data source,
+    the path is relative to the API root. Returns None if the file does not exist.
+    """
+    return get_data_source().load_json(data_path)
 
-def get_repo_data(
+
+def get_repo_data_path(
     org: str,
     repo: str,
     indicator_name: str,
     date: t.Optional[t.Tuple[int, int]] = None,
-) -> t.Optional[t.Dict]:
+) -> str:
     if date is not None:
         year, month = date
-        url = f"{BASE_API_URL}{org}/{repo}/{indicator_name}/{year}-{month:02}.json"
-    else:
-        url = f"{BASE_API_URL}{org}/{repo}/{indicator_name}.json"
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
+        return f"{org}/{repo}/{indicator_name}/{year}-{month:02}.json"
+    return f"{org}/{repo}/{indicator_name}.json"
+
+
+def get_repo_data(
+    org: str,
+    repo: str,
+    indicator_name: str,
+    date: t.Optional[t.Tuple[int, int]] = None,
+) -> t.Optional[t.Dict]:
+    return fetch_json(get_repo_data_path(org, repo, indicator_name, date))
 
 
 def get_developer_data(username: str, indicator_name: str) -> t.Optional[t.Dict]:
-    url = f"{BASE_API_URL}{username}/{indicator_name}.json"
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
+    return fetch_json(f"{username}/{indicator_name}.json")
+
+
+@dataclass(frozen=True)
+class NetworkOptions:
+    """How network files are loaded, as configured in [graph]"""
+
+    pruning: NetworkPruning = field(default_factory=NetworkPruning)
+    compact: bool = False
+
+    @classmethod
+    def from_config(cls, graph_config: GraphConfig) -> "NetworkOptions":
+        return cls(
+            pruning=NetworkPruning(
+                top_k_nodes=parse_optional_positive_int(graph_config.top_k_nodes),
+                top_k_edges=parse_optional_positive_int(graph_config.top_k_edges),
+                min_node_weight=parse_optional_float(graph_config.min_node_weight),
+                min_edge_weight=parse_optional_float(graph_config.min_edge_weight),
+            ),
+            compact=parse_bool(graph_config.compact, False),
+        )
+
+
+_network_options: t.Optional[NetworkOptions] = None
+_network_options_lock = threading.Lock()
+
+
+def configure_network_options(network_options: t.Optional[NetworkOptions]) -> None:
+    """
+    Override the [graph] options of the config file for this process, None
+    reads them from the config file again the next time they are needed.
+    """
+    global _network_options
+
+    with _network_options_lock:
+        _network_options = network_options
+
+
+def get_network_options() -> NetworkOptions:
+    """The [graph] options, the config file is only read once per run"""
+    global _network_options
+
+    with _network_options_lock:
+        if _network_options is None:
+            _network_options = NetworkOptions.from_config(get_graph_config())
+        return _network_options
+
+
+def fetch_network(
+    data_path: str,
+    parse_stream: t.Callable[
+        [t.Iterable[bytes], NetworkPruning, bool], BaseNetworkData
+    ],
+    load_data: t.Callable[[t.Dict, bool], BaseNetworkData],
+    network_options: t.Optional[NetworkOptions] = None,
+) -> t.Optional[BaseNetworkData]:
+    """
+    Load the network file at ``data_path`` from the configured data source.
+    With pruning configured in [graph], or a data source which can read the
+    file incrementally, the file is streamed and nodes and edges are pruned
+    while they are parsed. Otherwise the whole file is decoded at once, which
+    is faster. With ``graph.compact``, the network is built as a
+    ``CompactNetworkData`` straight from the items of the file.
+    """
+    if network_options is None:
+        network_options = get_network_options()
+    pruning = network_options.pruning
+    compact = network_options.compact
+
+    data_source = get_data_source()
+    if pruning.is_pruning or data_source.can_stream:
+        return data_source.load_stream(
+            data_path,
+            lambda chunks: parse_stream(chunks, pruning, compact),
+            (parse_stream, pruning, compact),
+        )
+
+    data = data_source.load_json(data_path)
+    return load_data(data, compact) if data is not None else None
+
+
+def get_repo_network(
+    org: str, repo: str, indicator_name: str
+) -> t.Optional[BaseNetworkData[NameAndValue, NameNameAndValue]]:
+    return fetch_network(
+        get_repo_data_path(org, repo, indicator_name),
+        parse_network_stream,
+        load_network_data,
+    )
+
+
+def get_developer_network(
+    username: str, indicator_name: str
+) -> t.Optional[BaseNetworkData[NameAndValue, NameNameAndValue]]:
+    return fetch_network(
+        f"{username}/{indicator_name}.json", parse_network_stream, load_network_data
+    )
+
+
+def get_repo_openrank_network(
+    org: str, repo: str, indicator_name: str, date: t.Tuple[int, int]
+) -> t.Optional[
+    BaseNetworkData[ProjectOpenRankNetworkNodeDict, ProjectOpenRankNetworkEdgeDict]
+]:
+    return fetch_network(
+        get_repo_data_path(org, repo, indicator_name, date),
+        parse_openrank_network_stream,
+        load_openrank_network_data,
+    )
+
+
+_columnar_series: t.Optional[bool] = None
+_columnar_series_lock = threading.Lock()
+
+
+def configure_columnar_series(enabled: t.Optional[bool]) -> None:
+    """
+    Override ``series.columnar`` of the config file for this process, None
+    reads it from the config file again the next time it is needed.
+    """
+    global _columnar_series
+
+    with _columnar_series_lock:
+        _columnar_series = enabled
+
+
+def is_columnar_series_enabled() -> bool:
+    """Whether numeric series are loaded as ``ColumnarSeries``, read once per run"""
+    global _columnar_series
+
+    with _columnar_series_lock:
+        if _columnar_series is None:
+            _columnar_series = parse_bool(get_series_config().columnar, False)
+        return _columnar_series
 
 
 def load_base_data(
     data: t.Dict[str, t.Any], load_value: t.Callable
 ) -> t.List[BaseData]:
+    if (load_value is int or load_value is float) and is_columnar_series_enabled():
+        try:
+            return t.cast(
+                t.List[BaseData],
+                ColumnarSeries.from_dict(data, t.cast(t.Type[float], load_value)),
+            )
+        except TypeError:
+            # Not a numeric series, e.g. values given as strings
+            pass
+
     base_data_list: t.List[BaseData] = []
 
     for date, value in data.items():
@@ -111,18 +277,28 @@ def load_non_trival_indicator_data(
 
 
 def load_openrank_network_data(
-    data: t.Dict[str, t.List],
+    data: t.Dict[str, t.List], compact: bool = False
 ) -> BaseNetworkData[ProjectOpenRankNetworkNodeDict, ProjectOpenRankNetworkEdgeDict]:
     nodes = data["nodes"]
     edges = data["links"]
+    if compact:
+        return t.cast(
+            BaseNetworkData,
+            CompactNetworkData.from_items(OPENRANK_NETWORK, nodes, edges),
+        )
     return BaseNetworkData(nodes=nodes, edges=edges)
 
 
 def load_network_data(
-    data: t.Dict[str, t.List]
+    data: t.Dict[str, t.List], compact: bool = False
 ) -> BaseNetworkData[NameAndValue, NameNameAndValue]:
     nodes = data["nodes"]
     edges = data["edges"]
+    if compact:
+        return t.cast(
+            BaseNetworkData,
+            CompactNetworkData.from_items(NAME_VALUE_NETWORK, nodes, edges),
+        )
     return BaseNetworkData(
         nodes=[NameAndValue(name=node[0], value=node[1]) for node in nodes],
         edges=[
@@ -1,4 +1,13 @@
-from .config import ALL_CONFIGS, AppKeyConfig, UserInfoConfig
-from .dataloader import DataloaderProto, DataloaderResult
+from .config import (
+    ALL_CONFIGS,
+    AppKeyConfig,
+    CacheConfig,
+    DataSourceConfig,
+    GraphConfig,
+    NetworkConfig,
+    SeriesConfig,
+    UserInfoConfig,
+)
+from .dataloader import AsyncDataloaderProto, DataloaderProto, DataloaderResult
 from .indicators import *  # noqa F403
-from .query import IndicatorQuery
+from .query import CompiledQuery, IndicatorQuery
@@ -21,7 +21,56 @@ class UserInfoConfig(BaseConfig):
     email: str = "Unknown"
 
 
+@dataclass
+class NetworkConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "network"
+    concurrency: str = "8"
+    query_concurrency: str = "4"
+    max_in_flight: str = "16"
+    max_per_host: str = "8"
+    connect_timeout: str = "5"
+    read_timeout: str = "30"
+    max_retries: str = "3"
+    backoff_factor: str = "0.5"
+
+
+@dataclass
+class CacheConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "cache"
+    enabled: str = "true"
+    ttl: str = "86400"
+    negative_ttl: str = "3600"
+    max_size_mb: str = "512"
+
+
+@dataclass
+class DataSourceConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "data_source"
+    location: str = "https://oss.x-lab.info/open_digger/github/"
+
+
+@dataclass
+class GraphConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "graph"
+    top_k_nodes: str = "None"
+    top_k_edges: str = "None"
+    min_node_weight: str = "None"
+    min_edge_weight: str = "None"
+    compact: str = "false"
+
+
+@dataclass
+class SeriesConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "series"
+    columnar: str = "false"
+
+
 ALL_CONFIGS: t.Dict[str, t.Type[BaseConfig]] = {
     "app_keys": AppKeyConfig,
     "user_info": UserInfoConfig,
+    "network": NetworkConfig,
+    "cache": CacheConfig,
+    "data_source": DataSourceConfig,
+    "graph": GraphConfig,
+    "series": SeriesConfig,
 }
@@ -34,3 +34,11 @@ class DataloaderProto(t.Protocol):
 
     def load(self, *args, **kwargs) -> DataloaderResult:
         ...
+
+
+@t.runtime_checkable
+class AsyncDataloaderProto(DataloaderProto, t.Protocol):
+    """Dataloaders which can also be awaited on an event loop"""
+
+    async def aload(self, *args, **kwargs) -> DataloaderResult:
+        ...
@@ -19,6 +19,14 @@ from .base import (
     TrivialIndicatorData,
     TrivialNetworkIndicatorData,
 )
+from .columnar import ColumnarSeries, to_columnar
+from .compact import (
+    NAME_VALUE_NETWORK,
+    OPENRANK_NETWORK,
+    CompactNetworkBuilder,
+    CompactNetworkData,
+    to_compact_network,
+)
 from .indices import ActivityData, AttentionData, OpenRankData
 from .metrics import (
     AcceptedChangeRequestData,
@@ -1,5 +1,5 @@
 import typing as t
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Generic, List, NamedTuple, TypedDict, TypeVar
 
 T = TypeVar("T")
@@ -179,6 +179,9 @@ class BaseNetworkData(Generic[T, S]):
     edges: List[S]
 
     def __post_init__(self):
-        if isinstance(self.nodes[0], NameAndValue):
+        if self.nodes and isinstance(self.nodes[0], NameAndValue):
             self.nodes = list(sorted(self.nodes, key=lambda x: x.value, reverse=True))  # type: ignore
             self.edges = list(sorted(self.edges, key=lambda x: x.value, reverse=True))  # type: ignore
+
+    def to_dict(self) -> t.Dict[str, List[t.Any]]:
+        return asdict(self)
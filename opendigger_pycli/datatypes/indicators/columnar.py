@@ -0,0 +1,268 @@
+import typing as t
+from dataclasses import replace
+
+from ..query import MAX_QUERY_YEAR, MIN_QUERY_YEAR, CompiledQuery
+from .base import TRIVIAL_INDICATOR_DATA, BaseData
+
+if t.TYPE_CHECKING:
+    import numpy as np
+
+    from .base import NonTrivialIndicatorData, TrivialIndicatorData
+
+# The number of months a query can contain, the bits of an ordinal mask
+QUERY_MONTH_COUNT = (MAX_QUERY_YEAR - MIN_QUERY_YEAR + 1) * 12
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "The columnar representation needs numpy, "
+            "install it with `pip install opendigger_pycli[columnar]`"
+        ) from e
+    return numpy
+
+
+def is_number(value: t.Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ColumnarSeries(t.Sequence[BaseData]):
+    """
+    A time series of numeric indicator values stored as parallel arrays:
+    int32 ``year``/``month``, bool ``is_raw`` and float64 ``value``.
+
+    It can be used wherever a sorted ``List[BaseData]`` is read, items are
+    created on access. Slices are numpy views of the same arrays, and
+    filtering with ``query_compiled``, ``date_mask`` and ``select`` runs on
+    the arrays.
+    """
+
+    __slots__ = ("year", "month", "is_raw", "value", "value_type")
+
+    def __init__(
+        self,
+        year: "np.ndarray",
+        month: "np.ndarray",
+        is_raw: "np.ndarray",
+        value: "np.ndarray",
+        value_type: t.Type[t.Union[int, float]] = float,
+    ) -> None:
+        self.year = year
+        self.month = month
+        self.is_raw = is_raw
+        self.value = value
+        # Values are stored as float64, ints are converted back on access
+        self.value_type = value_type
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: t.Dict[str, t.Any],
+        value_type: t.Optional[t.Type[t.Union[int, float]]] = None,
+    ) -> "ColumnarSeries":
+        """
+        Build a series from the raw OpenDigger JSON, e.g. ``{"2023-01": 1.5}``,
+        with the same parsing and ordering as ``load_base_data``. Values are
+        read back as ``value_type``, by default as ints if they all are ints.
+        """
+        np = import_numpy()
+        years: t.List[int] = []
+        months: t.List[int] = []
+        is_raws: t.List[bool] = []
+        values: t.List[float] = []
+        inferred_value_type: t.Type[t.Union[int, float]] = int
+        for date, value in data.items():
+            try:
+                year, month = date.split("-")[:2]
+                year_number, month_number = int(year), int(month)
+            except ValueError:
+                continue
+            if not is_number(value):
+                raise TypeError(
+                    f"{value!r} is not a number, "
+                    "only numeric time series can be columnar"
+                )
+            years.append(year_number)
+            months.append(month_number)
+            is_raws.append(date.endswith("raw"))
+            values.append(value)
+            if isinstance(value, float):
+                inferred_value_type = float
+
+        series = cls(
+            np.array(years, dtype=np.int32),
+            np.array(months, dtype=np.int32),
+            np.array(is_raws, dtype=np.bool_),
+            np.array(values, dtype=np.float64),
+            value_type or inferred_value_type,
+        )
+        return series.sorted()
+
+    @classmethod
+    def from_base_data(cls, base_data_list: t.Sequence[BaseData]) -> "ColumnarSeries":
+        if isinstance(base_data_list, ColumnarSeries):
+            return base_data_list
+        np = import_numpy()
+        value_type: t.Type[t.Union[int, float]] = int
+        for base_data in base_data_list:
+            if not is_number(base_data.value):
+                raise TypeError(
+                    f"{base_data.value!r} is not a number, "
+                    "only numeric time series can be columnar"
+                )
+            if isinstance(base_data.value, float):
+                value_type = float
+        return cls(
+            np.fromiter(
+                (d.year for d in base_data_list), np.int32, len(base_data_list)
+            ),
+            np.fromiter(
+                (d.month for d in base_data_list), np.int32, len(base_data_list)
+            ),
+            np.fromiter(
+                (d.is_raw for d in base_data_list), np.bool_, len(base_data_list)
+            ),
+            np.fromiter(
+                (d.value for d in base_data_list), np.float64, len(base_data_list)
+            ),
+            value_type,
+        )
+
+    def sorted(self) -> "ColumnarSeries":
+        """Sort by year and month, raw data first, like ``BaseData.__lt__``"""
+        np = import_numpy()
+        order = np.lexsort((~self.is_raw, self.month, self.year))
+        return self.select(order)
+
+    def select(self, index: t.Any) -> "ColumnarSeries":
+        """Select items by a bool mask, an index array or a slice"""
+        return ColumnarSeries(
+            self.year[index],
+            self.month[index],
+            self.is_raw[index],
+            self.value[index],
+            self.value_type,
+        )
+
+    def query_compiled(
+        self, compiled_query: CompiledQuery
+    ) -> t.Tuple["ColumnarSeries", CompiledQuery]:
+        """
+        The items matching the query, and the parts of the query which matched
+        at least one item, like ``MonthIndex.query_compiled``. The ordinal
+        bitsets are converted to bool arrays, so no item is created.
+        """
+        np = import_numpy()
+        ordinals = (self.year.astype(np.int64) - MIN_QUERY_YEAR) * 12 + self.month - 1
+        in_range = (ordinals >= 0) & (ordinals < QUERY_MONTH_COUNT)
+        ordinals = np.where(in_range, ordinals, 0)
+
+        data_months = np.zeros(QUERY_MONTH_COUNT, dtype=np.uint8)
+        data_months[ordinals[in_range]] = 1
+        data_ordinal_mask = int.from_bytes(
+            np.packbits(data_months, bitorder="little").tobytes(), "little"
+        )
+
+        query_ordinal_mask = compiled_query.to_ordinal_mask()
+        query_months = np.unpackbits(
+            np.frombuffer(
+                query_ordinal_mask.to_bytes((QUERY_MONTH_COUNT + 7) // 8, "little"),
+                dtype=np.uint8,
+            ),
+            count=QUERY_MONTH_COUNT,
+            bitorder="little",
+        ).astype(np.bool_)
+        return (
+            self.select(in_range & query_months[ordinals]),
+            compiled_query.matched(data_ordinal_mask),
+        )
+
+    def date_mask(
+        self,
+        years: t.Iterable[int] = (),
+        months: t.Iterable[int] = (),
+        year_months: t.Iterable[t.Tuple[int, int]] = (),
+    ) -> "np.ndarray":
+        """Bool mask of the items in any of ``years``, ``months`` or ``year_months``"""
+        np = import_numpy()
+        mask = np.isin(self.year, list(years)) | np.isin(self.month, list(months))
+        year_months = list(year_months)
+        if year_months:
+            ordinals = self.year.astype(np.int64) * 12 + self.month
+            mask |= np.isin(
+                ordinals, [year * 12 + month for year, month in year_months]
+            )
+        return mask
+
+    def to_base_data(self) -> t.List[BaseData]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    @t.overload
+    def __getitem__(self, index: int) -> BaseData:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "ColumnarSeries":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Basic slicing of numpy arrays returns views, no data is copied
+            return self.select(index)
+        return BaseData(
+            year=int(self.year[index]),
+            month=int(self.month[index]),
+            value=self.value_type(self.value[index]),
+            is_raw=bool(self.is_raw[index]),
+        )
+
+    def __iter__(self) -> t.Iterator[BaseData]:
+        value_type = self.value_type
+        for year, month, value, is_raw in zip(
+            self.year.tolist(),
+            self.month.tolist(),
+            self.value.tolist(),
+            self.is_raw.tolist(),
+        ):
+            yield BaseData(
+                year=year, month=month, value=value_type(value), is_raw=is_raw
+            )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnarSeries, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def to_columnar(
+    indicator_data: t.Union["TrivialIndicatorData", "NonTrivialIndicatorData"]
+) -> t.Union["TrivialIndicatorData", "NonTrivialIndicatorData"]:
+    """
+    Return a copy of the indicator data whose numeric time series are
+    ``ColumnarSeries``, series of other values (e.g. levels) are kept as is.
+    """
+    if indicator_data.data_class == TRIVIAL_INDICATOR_DATA:
+        return replace(
+            indicator_data,
+            value=ColumnarSeries.from_base_data(
+                t.cast(t.Sequence[BaseData], indicator_data.value)
+            ),
+        )
+
+    value: t.Dict[str, t.Any] = dict(
+        t.cast(t.Mapping[str, t.Sequence[BaseData]], indicator_data.value)
+    )
+    for key, base_data_list in value.items():
+        try:
+            value[key] = ColumnarSeries.from_base_data(base_data_list)
+        except TypeError:
+            continue
+    return replace(indicator_data, value=value)
@@ -0,0 +1,387 @@
+import bisect
+import typing as t
+from array import array
+
+from .base import BaseNetworkData, NameAndValue, NameNameAndValue
+
+NAME_VALUE_NETWORK: t.Literal["name_value"] = "name_value"
+OPENRANK_NETWORK: t.Literal["openrank"] = "openrank"
+
+Weights = t.Union["array[t.Any]", t.List[t.Any]]
+
+
+def pack_weights(values: t.Sequence[t.Any]) -> t.Tuple[Weights, t.Callable]:
+    """
+    Pack weights into the smallest array they fit in without any loss:
+    int32 for ints, float32 for floats with up to 7 significant digits,
+    float64 for other floats. Weights of mixed types are kept as a list.
+    Returns the weights and the function which converts an item back.
+    """
+    value_types = {type(value) for value in values}
+    if value_types == {int}:
+        try:
+            return array("i", values), int
+        except OverflowError:
+            return array("q", values), int
+    if value_types == {float}:
+        float32_weights = array("f", values)
+        if all(
+            float(f"{weight:.7g}") == value
+            for weight, value in zip(float32_weights, values)
+        ):
+            return float32_weights, read_float32
+        return array("d", values), float
+    return list(values), identity
+
+
+def read_float32(weight: float) -> float:
+    return float(f"{weight:.7g}")
+
+
+def identity(value: t.Any) -> t.Any:
+    return value
+
+
+# The value of a node attribute which is not set on the node. JSON never
+# decodes to Ellipsis, and it keeps its identity when pickled.
+MISSING_ATTRIBUTE = Ellipsis
+
+
+class CompactNetworkData:
+    """
+    A network stored as arrays: a table of interned node ids, the node weights,
+    and the edges as CSR adjacency arrays (``indptr``/``indices`` in int32,
+    packed weights) sorted by source node. ``edge_order`` keeps the position
+    of each edge in the original edge list.
+
+    ``nodes`` and ``edges`` are sequence views which create ``NameAndValue``/
+    ``NameNameAndValue`` (or the dicts of ``project_openrank_detail``) on
+    access, so it can be used wherever a ``BaseNetworkData`` is read.
+    Use ``CompactNetworkBuilder`` to create one.
+    """
+
+    __slots__ = (
+        "kind",
+        "node_ids",
+        "node_count",
+        "node_weights",
+        "node_attributes",
+        "indptr",
+        "indices",
+        "edge_weights",
+        "edge_order",
+        "_read_node_weight",
+        "_read_edge_weight",
+        "_node_index",
+    )
+
+    def __init__(
+        self,
+        kind: t.Literal["name_value", "openrank"],
+        node_ids: t.List[str],
+        node_count: int,
+        node_weights: t.Sequence[t.Any],
+        sources: "array[int]",
+        targets: "array[int]",
+        edge_weights: t.Sequence[t.Any],
+        node_attributes: t.Optional[t.Dict[str, t.Optional[t.List[t.Any]]]] = None,
+    ) -> None:
+        """
+        ``node_ids`` are the ids of the ``node_count`` nodes followed by the ids
+        which are only referred to by edges, ``sources`` and ``targets`` are
+        indexes into ``node_ids``.
+        """
+        self.kind = kind
+        self.node_ids = node_ids
+        self.node_count = node_count
+        self._node_index: t.Optional[t.Dict[str, int]] = None
+        self.node_weights, self._read_node_weight = pack_weights(node_weights)
+        self.node_attributes = node_attributes or {}
+
+        # Counting sort of the edges by source node, stable within a source
+        edge_count = len(sources)
+        counts = array("i", [0]) * (len(node_ids) + 1)
+        for source in sources:
+            counts[source + 1] += 1
+        for index in range(len(node_ids)):
+            counts[index + 1] += counts[index]
+        self.indptr = array("i", counts)
+        self.indices = array("i", [0]) * edge_count
+        self.edge_order = array("i", [0]) * edge_count
+        csr_weights: t.List[t.Any] = [None] * edge_count
+        for position in range(edge_count):
+            source = sources[position]
+            csr_position = counts[source]
+            counts[source] += 1
+            self.indices[csr_position] = targets[position]
+            csr_weights[csr_position] = edge_weights[position]
+            self.edge_order[position] = csr_position
+        self.edge_weights, self._read_edge_weight = pack_weights(csr_weights)
+
+    @classmethod
+    def from_items(
+        cls,
+        kind: t.Literal["name_value", "openrank"],
+        nodes: t.Iterable[t.Any],
+        edges: t.Iterable[t.Any],
+    ) -> "CompactNetworkData":
+        """Build from the items of a network file, see ``CompactNetworkBuilder``"""
+        builder = CompactNetworkBuilder(kind)
+        for node in nodes:
+            builder.add_node(node)
+        for edge in edges:
+            builder.add_edge(edge)
+        return builder.build()
+
+    @classmethod
+    def from_network(cls, network: BaseNetworkData) -> "CompactNetworkData":
+        nodes = t.cast(t.List[t.Any], network.nodes)
+        edges = t.cast(t.List[t.Any], network.edges)
+        if nodes and isinstance(nodes[0], dict):
+            return cls.from_items(OPENRANK_NETWORK, nodes, edges)
+        return cls.from_items(
+            NAME_VALUE_NETWORK,
+            ((node.name, node.value) for node in nodes),
+            ((edge.name0, edge.name1, edge.value) for edge in edges),
+        )
+
+    def get_node_index(self, node_id: str) -> int:
+        if self._node_index is None:
+            self._node_index = {name: index for index, name in enumerate(self.node_ids)}
+        return self._node_index[node_id]
+
+    def get_node(self, index: int) -> t.Any:
+        node_id = self.node_ids[index]
+        weight = self._read_node_weight(self.node_weights[index])
+        if self.kind == NAME_VALUE_NETWORK:
+            return NameAndValue(name=node_id, value=weight)
+        node = {}
+        for name, values in self.node_attributes.items():
+            if name == "id":
+                node[name] = node_id
+            elif name == "v":
+                node[name] = weight
+            elif values is not None and values[index] is not MISSING_ATTRIBUTE:
+                node[name] = values[index]
+        return node
+
+    def get_edge(self, csr_position: int) -> t.Any:
+        source = self.node_ids[bisect.bisect_right(self.indptr, csr_position) - 1]
+        target = self.node_ids[self.indices[csr_position]]
+        weight = self._read_edge_weight(self.edge_weights[csr_position])
+        if self.kind == NAME_VALUE_NETWORK:
+            return NameNameAndValue(name0=source, name1=target, value=weight)
+        return {"s": source, "t": target, "w": weight}
+
+    @property
+    def nodes(self) -> "NodeView":
+        return NodeView(self)
+
+    @property
+    def edges(self) -> "EdgeView":
+        return EdgeView(self)
+
+    def neighbors(self, node_id: str) -> t.List[t.Tuple[str, t.Any]]:
+        """The targets and weights of the edges from ``node_id``"""
+        try:
+            index = self.get_node_index(node_id)
+        except KeyError:
+            return []
+        return [
+            (
+                self.node_ids[self.indices[csr_position]],
+                self._read_edge_weight(self.edge_weights[csr_position]),
+            )
+            for csr_position in range(self.indptr[index], self.indptr[index + 1])
+        ]
+
+    def out_degree(self, node_id: str) -> int:
+        try:
+            index = self.get_node_index(node_id)
+        except KeyError:
+            return 0
+        return self.indptr[index + 1] - self.indptr[index]
+
+    def to_dict(self) -> t.Dict[str, t.List[t.Any]]:
+        return {"nodes": list(self.nodes), "edges": list(self.edges)}
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "_node_index"
+        }
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._node_index = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CompactNetworkData, BaseNetworkData)):
+            return list(self.nodes) == list(other.nodes) and list(self.edges) == list(
+                other.edges
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(nodes={self.node_count}, "
+            f"edges={len(self.indices)})"
+        )
+
+
+class NodeView(t.Sequence[t.Any]):
+    __slots__ = ("_network",)
+
+    def __init__(self, network: CompactNetworkData) -> None:
+        self._network = network
+
+    def __len__(self) -> int:
+        return self._network.node_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._network.get_node(i) for i in range(len(self))[index]]
+        return self._network.get_node(range(len(self))[index])
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return map(self._network.get_node, range(len(self)))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class EdgeView(t.Sequence[t.Any]):
+    """The edges in the order of the original edge list"""
+
+    __slots__ = ("_network",)
+
+    def __init__(self, network: CompactNetworkData) -> None:
+        self._network = network
+
+    def __len__(self) -> int:
+        return len(self._network.edge_order)
+
+    def __getitem__(self, index):
+        edge_order = self._network.edge_order
+        if isinstance(index, slice):
+            return [self._network.get_edge(i) for i in edge_order[index]]
+        return self._network.get_edge(edge_order[index])
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return map(self._network.get_edge, self._network.edge_order)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class CompactNetworkBuilder:
+    """
+    Collects the nodes and edges of a network as they are read, e.g. while a
+    network file is parsed, and builds a ``CompactNetworkData`` from them.
+    Nodes and edges are the items of the file: ``[id, weight]`` and
+    ``[source, target, weight]``, or the dicts of ``project_openrank_detail``.
+    """
+
+    def __init__(self, kind: t.Literal["name_value", "openrank"]) -> None:
+        self.kind = kind
+        # Node ids are interned in the order they are seen, by nodes or edges
+        self._ids: t.List[str] = []
+        self._id_index: t.Dict[str, int] = {}
+        self._node_id_indexes = array("i")
+        self._node_weights: t.List[t.Any] = []
+        # "id" and "v" are kept in the node table, None keeps their position
+        self._node_attributes: t.Dict[str, t.Optional[t.List[t.Any]]] = {}
+        self._sources = array("i")
+        self._targets = array("i")
+        self._edge_weights: t.List[t.Any] = []
+
+    def _intern(self, node_id: str) -> int:
+        index = self._id_index.get(node_id)
+        if index is None:
+            index = self._id_index[node_id] = len(self._ids)
+            self._ids.append(node_id)
+        return index
+
+    def add_node(self, node: t.Any) -> None:
+        if self.kind == NAME_VALUE_NETWORK:
+            self._node_id_indexes.append(self._intern(node[0]))
+            self._node_weights.append(node[1])
+            return
+
+        node_count = len(self._node_weights)
+        self._node_id_indexes.append(self._intern(node["id"]))
+        self._node_weights.append(node["v"])
+        for name, value in node.items():
+            if name not in self._node_attributes:
+                self._node_attributes[name] = (
+                    None if name in ("id", "v") else [MISSING_ATTRIBUTE] * node_count
+                )
+            values = self._node_attributes[name]
+            if values is not None:
+                values.append(value)
+        # Attributes of other nodes which are not set on this one
+        for values in self._node_attributes.values():
+            if values is not None and len(values) == node_count:
+                values.append(MISSING_ATTRIBUTE)
+
+    def add_edge(self, edge: t.Any) -> None:
+        if self.kind == NAME_VALUE_NETWORK:
+            source, target, weight = edge[0], edge[1], edge[2]
+        else:
+            source, target, weight = edge["s"], edge["t"], edge["w"]
+        self._sources.append(self._intern(source))
+        self._targets.append(self._intern(target))
+        self._edge_weights.append(weight)
+
+    def build(self) -> CompactNetworkData:
+        node_order: t.Sequence[int] = range(len(self._node_weights))
+        edge_order: t.Sequence[int] = range(len(self._edge_weights))
+        if self.kind == NAME_VALUE_NETWORK:
+            # Like BaseNetworkData, sorted by descending weight
+            node_order = sort_by_weight(self._node_weights)
+            edge_order = sort_by_weight(self._edge_weights)
+
+        # The nodes come first in the id table, followed by the ids which are
+        # only referred to by edges. Duplicate nodes share the first index.
+        node_ids = [self._ids[self._node_id_indexes[index]] for index in node_order]
+        new_indexes = array("i", [-1]) * len(self._ids)
+        for node_index, position in enumerate(node_order):
+            id_index = self._node_id_indexes[position]
+            if new_indexes[id_index] < 0:
+                new_indexes[id_index] = node_index
+        for id_index, node_id in enumerate(self._ids):
+            if new_indexes[id_index] < 0:
+                new_indexes[id_index] = len(node_ids)
+                node_ids.append(node_id)
+
+        return CompactNetworkData(
+            self.kind,
+            node_ids,
+            len(node_order),
+            [self._node_weights[index] for index in node_order],
+            array("i", [new_indexes[self._sources[index]] for index in edge_order]),
+            array("i", [new_indexes[self._targets[index]] for index in edge_order]),
+            [self._edge_weights[index] for index in edge_order],
+            self._node_attributes if self.kind == OPENRANK_NETWORK else None,
+        )
+
+
+def sort_by_weight(weights: t.List[t.Any]) -> t.List[int]:
+    """The positions of the weights by descending weight, stable for ties"""
+    return sorted(range(len(weights)), key=weights.__getitem__, reverse=True)
+
+
+def to_compact_network(
+    network: BaseNetworkData,
+) -> t.Union[BaseNetworkData, CompactNetworkData]:
+    """
+    The compact form of a network, empty networks and networks with nodes of
+    an unknown shape are kept as they are.
+    """
+    if not network.nodes or not isinstance(network.nodes[0], (NameAndValue, dict)):
+        return network
+    return CompactNetworkData.from_network(network)
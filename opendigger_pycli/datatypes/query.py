@@ -1,9 +1,149 @@
 import typing as t
 from dataclasses import dataclass, field
 
+# The range of years a query can contain
+MIN_QUERY_YEAR = 1970
+MAX_QUERY_YEAR = 2100
+
+
+def to_query_ordinal(year: int, month: int) -> int:
+    """The bit of a month in ``CompiledQuery.year_months``, 0 is 1970-01"""
+    return (year - MIN_QUERY_YEAR) * 12 + month - 1
+
+
+def iter_bits(mask: int) -> t.Iterator[int]:
+    """The positions of the set bits of ``mask``, lowest first"""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+# The months of a year, and each month of all years, as ordinal bitsets
+_YEAR_MONTHS_MASK = (1 << 12) - 1
+_MONTH_COLUMN_MASKS = [
+    sum(
+        1 << month
+        for month in range(month, (MAX_QUERY_YEAR - MIN_QUERY_YEAR + 1) * 12, 12)
+    )
+    for month in range(12)
+]
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """
+    An ``IndicatorQuery`` as integer bitsets: bit ``year - 1970`` of ``years``,
+    bit ``month - 1`` of ``months`` and bit ``to_query_ordinal(year, month)``
+    of ``year_months``. Union, intersection and difference of queries are
+    single integer operations.
+    """
+
+    years: int = 0
+    months: int = 0
+    year_months: int = 0
+
+    @classmethod
+    def from_query(cls, query: "IndicatorQuery") -> "CompiledQuery":
+        for year in (*query.years, *(year for year, _ in query.year_months)):
+            if not MIN_QUERY_YEAR <= year <= MAX_QUERY_YEAR:
+                raise ValueError(
+                    f"{year} is out of the query range "
+                    f"{MIN_QUERY_YEAR}~{MAX_QUERY_YEAR}"
+                )
+        for month in (*query.months, *(month for _, month in query.year_months)):
+            if not 1 <= month <= 12:
+                raise ValueError(f"{month} is not a month")
+        return cls(
+            years=sum(1 << (year - MIN_QUERY_YEAR) for year in query.years),
+            months=sum(1 << (month - 1) for month in query.months),
+            year_months=sum(
+                1 << to_query_ordinal(year, month) for year, month in query.year_months
+            ),
+        )
+
+    @classmethod
+    def merge(cls, queries: t.Iterable["IndicatorQuery"]) -> "CompiledQuery":
+        """The union of the compiled queries"""
+        merged = cls()
+        for query in queries:
+            merged |= query.compiled
+        return merged
+
+    def to_query(self) -> "IndicatorQuery":
+        return IndicatorQuery(
+            years=frozenset(bit + MIN_QUERY_YEAR for bit in iter_bits(self.years)),
+            months=frozenset(bit + 1 for bit in iter_bits(self.months)),
+            year_months=frozenset(
+                (MIN_QUERY_YEAR + bit // 12, bit % 12 + 1)
+                for bit in iter_bits(self.year_months)
+            ),
+        )
+
+    def to_ordinal_mask(self) -> int:
+        """The months matching the query, as a bitset of month ordinals"""
+        mask = self.year_months
+        for bit in iter_bits(self.years):
+            mask |= _YEAR_MONTHS_MASK << (bit * 12)
+        for bit in iter_bits(self.months):
+            mask |= _MONTH_COLUMN_MASKS[bit]
+        return mask
+
+    def matched(self, ordinal_mask: int) -> "CompiledQuery":
+        """The parts of the query matching any month of ``ordinal_mask``"""
+        return CompiledQuery(
+            years=sum(
+                1 << bit
+                for bit in iter_bits(self.years)
+                if ordinal_mask >> (bit * 12) & _YEAR_MONTHS_MASK
+            ),
+            months=sum(
+                1 << bit
+                for bit in iter_bits(self.months)
+                if ordinal_mask & _MONTH_COLUMN_MASKS[bit]
+            ),
+            year_months=self.year_months & ordinal_mask,
+        )
+
+    def __or__(self, other: "CompiledQuery") -> "CompiledQuery":
+        return CompiledQuery(
+            self.years | other.years,
+            self.months | other.months,
+            self.year_months | other.year_months,
+        )
+
+    def __and__(self, other: "CompiledQuery") -> "CompiledQuery":
+        return CompiledQuery(
+            self.years & other.years,
+            self.months & other.months,
+            self.year_months & other.year_months,
+        )
+
+    def __sub__(self, other: "CompiledQuery") -> "CompiledQuery":
+        return CompiledQuery(
+            self.years & ~other.years,
+            self.months & ~other.months,
+            self.year_months & ~other.year_months,
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.years or self.months or self.year_months)
+
 
 @dataclass(frozen=True)
 class IndicatorQuery:
+    """
+    The months, years and year-months selected by a query. Years must be in
+    ``MIN_QUERY_YEAR~MAX_QUERY_YEAR`` and months in ``1~12``, otherwise creating
+    the query raises ``ValueError`` since it can not be compiled. The CLI
+    rejects such queries while parsing the options.
+    """
+
     months: t.FrozenSet[int] = field(default_factory=frozenset)
     years: t.FrozenSet[int] = field(default_factory=frozenset)
     year_months: t.FrozenSet[t.Tuple[int, int]] = field(default_factory=frozenset)
+    # Compiled once when the query is created
+    compiled: CompiledQuery = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "compiled", CompiledQuery.from_query(self))
@@ -0,0 +1,79 @@
+import pytest
+
+from opendigger_pycli.datatypes import (
+    ActivityDetailData,
+    BaseData,
+    ColumnarSeries,
+    IndicatorQuery,
+    OpenRankData,
+    to_columnar,
+)
+from opendigger_pycli.results.indexing import MonthIndex
+
+np = pytest.importorskip("numpy")
+
+TEST_DATA = {"2023-02": 2.5, "2022-12": 1, "2023-02-raw": 3.0, "2023-01": 1.5}
+
+
+def test_columnar_series_from_dict():
+    series = ColumnarSeries.from_dict(TEST_DATA)
+    assert series.year.dtype == np.int32 and series.value.dtype == np.float64
+    assert series == sorted(
+        BaseData(
+            year=int(date[:4]),
+            month=int(date[5:7]),
+            value=value,
+            is_raw=date.endswith("raw"),
+        )
+        for date, value in TEST_DATA.items()
+    )
+    assert series[0] == BaseData(year=2022, month=12, value=1.0)
+    assert series[2].is_raw and not series[3].is_raw
+
+    with pytest.raises(TypeError):
+        ColumnarSeries.from_dict({"2023-01": [1, 2]})
+
+
+def test_columnar_series_views_and_filtering():
+    series = ColumnarSeries.from_dict(TEST_DATA)
+    tail = series[1:]
+    assert np.shares_memory(tail.value, series.value)
+    assert len(tail) == 3
+
+    selected = series.select(series.date_mask(years=[2022], year_months=[(2023, 1)]))
+    assert [(d.year, d.month) for d in selected] == [(2022, 12), (2023, 1)]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        IndicatorQuery(years=frozenset({2023, 2030})),
+        IndicatorQuery(months=frozenset({12, 6})),
+        IndicatorQuery(year_months=frozenset({(2023, 2), (2100, 12), (1970, 1)})),
+    ],
+)
+def test_columnar_series_query_compiled_matches_month_index(query):
+    series = ColumnarSeries.from_dict({**TEST_DATA, "1969-01": 1, "2101-01": 1})
+    selected, matched = series.query_compiled(query.compiled)
+    positions, expected_matched = MonthIndex(list(series)).query_compiled(
+        query.compiled
+    )
+    assert selected == [series[position] for position in positions]
+    assert matched == expected_matched
+
+
+def test_columnar_series_from_dict_value_type():
+    series = ColumnarSeries.from_dict({"2023-01": 1, "2023-02": 2}, float)
+    assert isinstance(series[0].value, float)
+
+
+def test_to_columnar():
+    int_data = [BaseData(year=2023, month=1, value=1), BaseData(2023, 2, 2)]
+    openrank_data = to_columnar(OpenRankData(value=int_data))
+    assert isinstance(openrank_data.value, ColumnarSeries)
+    assert openrank_data.value == int_data
+    assert isinstance(openrank_data.value[0].value, int)
+
+    activity_detail_data = ActivityDetailData(value=[BaseData(2023, 1, [1, 2])])
+    with pytest.raises(TypeError):
+        to_columnar(activity_detail_data)
@@ -0,0 +1,104 @@
+import pickle
+from types import SimpleNamespace
+
+from opendigger_pycli.datatypes import (
+    NAME_VALUE_NETWORK,
+    BaseData,
+    BaseNetworkData,
+    CompactNetworkBuilder,
+    CompactNetworkData,
+    NameAndValue,
+    NameNameAndValue,
+    to_compact_network,
+)
+from opendigger_pycli.exporters.json_exporter import export_indicator_to_json
+
+
+def make_network():
+    return BaseNetworkData(
+        nodes=[
+            NameAndValue("a", 3),
+            NameAndValue("b", 2),
+            NameAndValue("c", 1),
+        ],
+        edges=[
+            NameNameAndValue("a", "b", 12.34),
+            NameNameAndValue("c", "a", 2.5),
+            NameNameAndValue("a", "c", 1.23456789),
+            NameNameAndValue("x", "a", 0.1),
+        ],
+    )
+
+
+def test_compact_network_matches_network():
+    network = make_network()
+    compact = CompactNetworkData.from_network(network)
+
+    assert compact == network
+    assert list(compact.nodes) == network.nodes
+    assert list(compact.edges) == network.edges
+    assert compact.edges[1:3] == network.edges[1:3]
+    assert compact.nodes[-1] == network.nodes[-1]
+    assert compact.to_dict() == network.to_dict()
+    assert compact.neighbors("a") == [("b", 12.34), ("c", 1.23456789)]
+    assert compact.out_degree("x") == 1
+    assert compact.neighbors("missing") == []
+    assert compact.indptr.itemsize == compact.indices.itemsize == 4
+
+
+def test_compact_network_pickle():
+    compact = CompactNetworkData.from_network(make_network())
+    restored = pickle.loads(pickle.dumps(compact))
+    assert restored == compact
+    assert restored.neighbors("c") == [("a", 2.5)]
+
+
+def test_compact_openrank_network():
+    network = BaseNetworkData(
+        nodes=[
+            {"id": "a", "n": "a", "c": "u", "i": 1, "r": 0.5, "v": 1.0},
+            {"id": "b", "n": "b", "c": "r", "i": 2, "r": 0.1, "v": 3.25},
+        ],
+        edges=[{"s": "b", "t": "a", "w": 1}, {"s": "a", "t": "b", "w": 2}],
+    )
+    compact = to_compact_network(network)
+
+    assert isinstance(compact, CompactNetworkData)
+    assert compact == network
+    assert list(compact.nodes[0]) == ["id", "n", "c", "i", "r", "v"]
+    assert export_indicator_to_json(
+        SimpleNamespace(value=[BaseData(2023, 1, compact)])
+    ) == export_indicator_to_json(SimpleNamespace(value=[BaseData(2023, 1, network)]))
+
+
+def test_compact_openrank_network_keeps_attributes_of_every_node():
+    network = BaseNetworkData(
+        nodes=[
+            {"id": "a", "n": "a", "v": 1.0},
+            {"id": "b", "c": "r", "v": 2.0, "x": [1]},
+        ],
+        edges=[],
+    )
+    compact = pickle.loads(pickle.dumps(to_compact_network(network)))
+    assert list(compact.nodes) == network.nodes
+
+
+def test_compact_network_from_items_with_edges_first():
+    builder = CompactNetworkBuilder(NAME_VALUE_NETWORK)
+    builder.add_edge(["x", "b", 1])
+    builder.add_node(["b", 2])
+    builder.add_edge(["b", "x", 3])
+    compact = builder.build()
+
+    assert list(compact.nodes) == [NameAndValue("b", 2)]
+    # Sorted by descending weight like BaseNetworkData
+    assert list(compact.edges) == [
+        NameNameAndValue("b", "x", 3),
+        NameNameAndValue("x", "b", 1),
+    ]
+    assert compact.neighbors("b") == [("x", 3)]
+
+
+def test_empty_network_is_not_compacted():
+    network = BaseNetworkData(nodes=[], edges=[])
+    assert to_compact_network(network) is network
@@ -0,0 +1,71 @@
+import pickle
+
+import pytest
+
+from opendigger_pycli.datatypes import CompiledQuery, IndicatorQuery
+from opendigger_pycli.datatypes.query import to_query_ordinal
+
+
+def test_compiled_query_round_trip():
+    query = IndicatorQuery(
+        months=frozenset({1, 12}),
+        years=frozenset({1970, 2023, 2100}),
+        year_months=frozenset({(2019, 1), (2100, 12)}),
+    )
+    assert query.compiled.to_query() == query
+    assert pickle.loads(pickle.dumps(query)).compiled == query.compiled
+
+
+@pytest.mark.parametrize(
+    "query_kwargs",
+    [
+        {"years": frozenset({1969})},
+        {"years": frozenset({2101})},
+        {"months": frozenset({0})},
+        {"months": frozenset({13})},
+        {"year_months": frozenset({(2023, 13)})},
+        {"year_months": frozenset({(1969, 12)})},
+    ],
+)
+def test_indicator_query_out_of_range(query_kwargs):
+    with pytest.raises(ValueError):
+        IndicatorQuery(**query_kwargs)
+
+
+def test_compiled_query_set_operations():
+    q1 = IndicatorQuery(years=frozenset({2022}), months=frozenset({3}))
+    q2 = IndicatorQuery(years=frozenset({2023}), months=frozenset({3, 4}))
+    merged = CompiledQuery.merge([q1, q2])
+    assert merged == q1.compiled | q2.compiled
+    assert merged.to_query() == IndicatorQuery(
+        years=frozenset({2022, 2023}), months=frozenset({3, 4})
+    )
+    assert (q1.compiled & q2.compiled).to_query() == IndicatorQuery(
+        months=frozenset({3})
+    )
+    assert not CompiledQuery.merge([])
+
+
+def test_compiled_query_matched():
+    query = IndicatorQuery(
+        months=frozenset({2, 5}),
+        years=frozenset({2021, 2022}),
+        year_months=frozenset({(2023, 1), (2023, 2)}),
+    )
+    data_months = [(2022, 2), (2023, 1)]
+    ordinal_mask = sum(
+        1 << to_query_ordinal(year, month) for year, month in data_months
+    )
+
+    matched = query.compiled.matched(ordinal_mask)
+    assert matched.to_query() == IndicatorQuery(
+        months=frozenset({2}),
+        years=frozenset({2022}),
+        year_months=frozenset({(2023, 1)}),
+    )
+    assert (query.compiled - matched).to_query() == IndicatorQuery(
+        months=frozenset({5}),
+        years=frozenset({2021}),
+        year_months=frozenset({(2023, 2)}),
+    )
+    assert query.compiled.to_ordinal_mask() & ordinal_mask == ordinal_mask
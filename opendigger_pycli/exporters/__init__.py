@@ -1,8 +1,24 @@
 import typing as t
 
 JSON_FORMT = "json"
+NDJSON_FORMAT = "ndjson"
 REPORT_FORMAT = "report"
+PARQUET_FORMAT = "parquet"
+ARROW_FORMAT = "arrow"
+SQLITE_FORMAT = "sqlite"
 
-SURPPORTED_EXPORT_FORMATS = [REPORT_FORMAT, JSON_FORMT]
-SURPPORTED_EXPORT_FORMAT_TYPE = t.Literal["json", "report"]
+SURPPORTED_EXPORT_FORMATS = [
+    REPORT_FORMAT,
+    JSON_FORMT,
+    NDJSON_FORMAT,
+    PARQUET_FORMAT,
+    ARROW_FORMAT,
+    SQLITE_FORMAT,
+]
+SURPPORTED_EXPORT_FORMAT_TYPE = t.Literal[
+    "json", "ndjson", "report", "parquet", "arrow", "sqlite"
+]
 CAN_SPLIT_EXPORT_FORMATS = [JSON_FORMT]
+CAN_COMPRESS_EXPORT_FORMATS = [JSON_FORMT, NDJSON_FORMAT]
+# All query results are written together into one dataset
+COLUMNAR_EXPORT_FORMATS = [PARQUET_FORMAT, ARROW_FORMAT]
@@ -4,8 +4,6 @@ import json
 from xml.etree import ElementTree as etree
 from dataclasses import asdict
 
-import openai
-
 from opendigger_pycli.console import CONSOLE
 from opendigger_pycli.config.utils import (
     has_openai_api_key,
@@ -89,6 +87,9 @@ def analyze_indicators_data(
     </indicator>
     """
 
+    # openai takes a long time to import, it is only needed for the analysis
+    import openai
+
     if not openai.api_key:
         if not has_openai_api_key():
             return {"error": "No OpenAI API key found."}
@@ -3,7 +3,6 @@ import base64
 import math
 import typing as t
 from collections import OrderedDict
-from dataclasses import asdict
 from functools import cached_property
 from pathlib import Path
 
@@ -60,17 +59,31 @@ JINJA_ENV = Environment(
 
 
 class ChartReportExporter:
-    exporters: t.Dict[str, "BaseChartExporter"] = {}
-    custom_exporters: t.Dict[str, "BaseChartExporter"] = {}
+    """
+    Renders one report. The registries hold exporter classes, every report
+    gets its own exporter instances, so the indicator data of a report is
+    released with it.
+    """
+
+    exporters: t.Dict[str, t.Type["BaseChartExporter"]] = {}
+    custom_exporters: t.Dict[str, t.Type["BaseChartExporter"]] = {}
+
+    def __init__(self) -> None:
+        self.exporter_instances: t.Dict[str, "BaseChartExporter"] = {
+            exporter_name: exporter()
+            for exporter_name, exporter in {
+                **ChartReportExporter.exporters,
+                **ChartReportExporter.custom_exporters,
+            }.items()
+        }
 
     def register_custom_exporter(self, exporter: t.Type["BaseChartExporter"]) -> None:
-        ChartReportExporter.custom_exporters[exporter.exporter_name] = exporter()
+        ChartReportExporter.custom_exporters[exporter.exporter_name] = exporter
+        self.exporter_instances[exporter.exporter_name] = exporter()
 
     def add_indicator_data(self, indicator_data: t.Any) -> None:
         is_added = False
-        for exporter_name, exporter in ChartReportExporter.exporters.items():
-            if exporter_name in ChartReportExporter.custom_exporters:
-                exporter = ChartReportExporter.custom_exporters[exporter_name]
+        for exporter in self.exporter_instances.values():
             if indicator_data.__class__ in exporter.accepted_indicator_dataclass:
                 exporter.add_indicator_data(indicator_data)
                 is_added = True
@@ -81,9 +94,7 @@ class ChartReportExporter:
 
     def get_all_export_datum(self) -> t.List["ExportData"]:
         export_datum = []
-        for exporter_name, exporter in ChartReportExporter.exporters.items():
-            if exporter_name in ChartReportExporter.custom_exporters:
-                exporter = ChartReportExporter.custom_exporters[exporter_name]
+        for exporter in self.exporter_instances.values():
             export_datum.extend(exporter.get_export_datum())
         return export_datum
 
@@ -105,8 +116,12 @@ class ChartReportExporter:
         )
 
 
-def register_exporter(exporter: t.Type["BaseChartExporter"]) -> None:
-    ChartReportExporter.exporters[exporter.exporter_name] = exporter()
+ExporterType = t.TypeVar("ExporterType", bound=t.Type["BaseChartExporter"])
+
+
+def register_exporter(exporter: ExporterType) -> ExporterType:
+    ChartReportExporter.exporters[exporter.exporter_name] = exporter
+    return exporter
 
 
 def get_indicator_title(indicator_name: str) -> str:
@@ -1259,7 +1274,7 @@ class ProjectOpenRankNetworkExporter(BaseChartExporter):
                     ExportData(
                         name=f"{get_indicator_title(indicator_data.name)}: {base_data.year}-{base_data.month:02}",
                         chart=ProjectOpenRankGraph(
-                            graph_data=str(asdict(base_data.value))
+                            graph_data=str(base_data.value.to_dict())
                         ),
                     )
                 )
@@ -0,0 +1,86 @@
+import typing as t
+from pathlib import Path
+
+from .tidy import TIDY_COLUMNS, TidyRow
+
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
+COLUMNAR_FILE_FORMATS = {"parquet": "parquet", "arrow": "ipc"}
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "The parquet and arrow formats need pyarrow, "
+            "install it with `pip3 install 'opendigger_pycli[parquet]'`"
+        ) from e
+    return pyarrow
+
+
+def get_tidy_schema() -> "pa.Schema":
+    pa = import_pyarrow()
+    return pa.schema(
+        [
+            ("entity", pa.string()),
+            ("indicator", pa.string()),
+            ("sub_key", pa.string()),
+            ("year", pa.int16()),
+            ("month", pa.int8()),
+            ("is_raw", pa.bool_()),
+            ("value", pa.float64()),
+        ]
+    )
+
+
+class ColumnarExporter:
+    """
+    Collects tidy rows of many repos or users and writes them as one dataset
+    partitioned by indicator, ``indicator=<name>/part-0.parquet``. The rows
+    are converted to an Arrow record batch per call of ``add_rows``, so only
+    the compact Arrow buffers are held until the dataset is written.
+    """
+
+    def __init__(self, format: t.Literal["parquet", "arrow"]) -> None:
+        self.pa = import_pyarrow()
+        self.format = format
+        self.schema = get_tidy_schema()
+        self.batches: t.List["pa.RecordBatch"] = []
+
+    @property
+    def row_count(self) -> int:
+        return sum(batch.num_rows for batch in self.batches)
+
+    def add_rows(self, rows: t.Iterable[TidyRow]) -> int:
+        columns: t.List[t.List[t.Any]] = [[] for _ in TIDY_COLUMNS]
+        for row in rows:
+            for column, item in zip(columns, row):
+                column.append(item)
+        count = len(columns[0])
+        if count:
+            self.batches.append(
+                self.pa.record_batch(
+                    [
+                        self.pa.array(column, type=field.type)
+                        for column, field in zip(columns, self.schema)
+                    ],
+                    schema=self.schema,
+                )
+            )
+        return count
+
+    def export(self, save_path: Path) -> Path:
+        import pyarrow.dataset as ds
+
+        ds.write_dataset(
+            self.pa.Table.from_batches(self.batches, schema=self.schema),
+            save_path,
+            format=COLUMNAR_FILE_FORMATS[self.format],
+            partitioning=["indicator"],
+            partitioning_flavor="hive",
+            basename_template=f"part-{{i}}.{self.format}",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        return save_path
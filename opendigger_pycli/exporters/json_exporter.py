@@ -79,7 +79,7 @@ def export_indicator_to_json(
                 if base_data.is_raw
                 else f"{base_data.year}-{base_data.month:02}"
             )
-            result[key] = asdict(base_data.value) if base_data.value else None
+            result[key] = base_data.value.to_dict() if base_data.value else None
     else:
         values = t.cast("t.List[BaseData]", values)
         for value in values:
@@ -89,9 +89,46 @@ def export_indicator_to_json(
                 else f"{value.year}-{value.month:02}"
             )
             if isinstance(value.value, list) and hasattr(value.value[0], "name"):
-                value.value = t.cast("t.List[NameAndValue]", value.value)
-                result[key] = [v.tuple for v in value.value]
+                name_and_values = t.cast("t.List[NameAndValue]", value.value)
+                result[key] = [v.tuple for v in name_and_values]
             else:
                 result[key] = value.value
 
     return result
+
+
+def iter_indicator_json_records(
+    indicator_data: t.Union[
+        "TrivialIndicatorData",
+        "NonTrivialIndicatorData",
+        "TrivialNetworkIndicatorData",
+        "NonTrivalNetworkInciatorData",
+    ],
+) -> t.Iterator[t.Dict[str, t.Any]]:
+    """
+    The JSON export of an indicator as one record per month, e.g.
+    ``{"month": "2023-01", "is_raw": False, "value": 1.5}``. The values of
+    the sub-indicators of a month are combined into one object, networks
+    which are not split by month are a single record without a month.
+    """
+    result = export_indicator_to_json(indicator_data)
+    if hasattr(indicator_data.value, "nodes"):
+        yield {"month": None, "is_raw": False, "value": result}
+        return
+
+    if isinstance(indicator_data.value, dict):
+        month_values: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for key, values in result.items():
+            for month, value in values.items():
+                month_values.setdefault(month, {})[key] = value
+        items: t.Iterable[t.Tuple[str, t.Any]] = month_values.items()
+    else:
+        items = result.items()
+
+    for month, value in items:
+        is_raw = month.endswith("-raw")
+        yield {
+            "month": month[: -len("-raw")] if is_raw else month,
+            "is_raw": is_raw,
+            "value": value,
+        }
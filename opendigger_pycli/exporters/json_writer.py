@@ -0,0 +1,71 @@
+import io
+import json
+import typing as t
+from contextlib import contextmanager
+from pathlib import Path
+
+COMPRESSIONS = ["gzip", "zstd"]
+COMPRESSION_TYPE = t.Literal["gzip", "zstd"]
+COMPRESSION_SUFFIXES: t.Dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def check_compression(compression: t.Optional[str]) -> None:
+    """Raise ImportError if the module needed by ``compression`` is missing"""
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "zstd compression requires zstandard, "
+                "install it with `pip3 install 'opendigger_pycli[zstd]'`"
+            ) from None
+
+
+@contextmanager
+def open_export_file(
+    path: Path, compression: t.Optional[str] = None
+) -> t.Iterator[t.TextIO]:
+    """Open a text file to export to, compressed while it is written"""
+    if compression is None:
+        with path.open("w", encoding="utf-8") as file:
+            yield file
+    elif compression == "gzip":
+        import gzip
+
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            yield t.cast(t.TextIO, file)
+    elif compression == "zstd":
+        import zstandard
+
+        with path.open("wb") as raw_file:
+            writer = zstandard.ZstdCompressor().stream_writer(raw_file, closefd=False)
+            with io.TextIOWrapper(writer, encoding="utf-8") as file:  # type: ignore
+                yield t.cast(t.TextIO, file)
+    else:
+        raise ValueError(f"Unknown compression {compression}")
+
+
+def write_json_object(file: t.TextIO, items: t.Iterable[t.Tuple[str, t.Any]]) -> None:
+    """
+    Write the items as ``json.dumps(dict(items), indent=2, sort_keys=True)``
+    does, one value at a time. The items must be sorted by key.
+    """
+    is_empty = True
+    for key, value in items:
+        file.write("{\n  " if is_empty else ",\n  ")
+        is_empty = False
+        file.write(json.dumps(key))
+        file.write(": ")
+        # Nested lines are indented by one more level than the object
+        file.write(json.dumps(value, indent=2, sort_keys=True).replace("\n", "\n  "))
+    file.write("{}" if is_empty else "\n}")
+
+
+def write_ndjson(file: t.TextIO, records: t.Iterable[t.Dict[str, t.Any]]) -> int:
+    """Write one JSON record per line, returns the number of records"""
+    count = 0
+    for record in records:
+        file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        file.write("\n")
+        count += 1
+    return count
@@ -0,0 +1,307 @@
+import datetime
+import sqlite3
+import typing as t
+from pathlib import Path
+
+from opendigger_pycli.datatypes.query import CompiledQuery, to_query_ordinal
+
+from .tidy import (
+    iter_indicator_month_values,
+    iter_network_edges,
+    iter_network_nodes,
+    iter_value_items,
+)
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import (
+        NonTrivalNetworkInciatorData,
+        IndicatorQuery,
+        NonTrivialIndicatorData,
+        TrivialIndicatorData,
+        TrivialNetworkIndicatorData,
+    )
+
+SCHEMA_VERSION = 1
+
+# Primary key columns can not be NULL: values without a sub key are stored
+# with an empty sub key, networks which are not split by month with year and
+# month 0.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    entity_count INTEGER NOT NULL DEFAULT 0,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    changed_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS timeseries (
+    entity TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    sub_key TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    is_raw INTEGER NOT NULL,
+    value REAL,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    PRIMARY KEY (entity, indicator, year, month, sub_key, is_raw)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS timeseries_indicator_month
+    ON timeseries (indicator, year, month);
+CREATE INDEX IF NOT EXISTS timeseries_run ON timeseries (run_id);
+CREATE TABLE IF NOT EXISTS network_nodes (
+    entity TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    is_raw INTEGER NOT NULL,
+    node TEXT NOT NULL,
+    value REAL,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    PRIMARY KEY (entity, indicator, year, month, is_raw, node)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS network_nodes_node ON network_nodes (node);
+CREATE TABLE IF NOT EXISTS network_edges (
+    entity TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    is_raw INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    value REAL,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    PRIMARY KEY (entity, indicator, year, month, is_raw, source, target)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS network_edges_target ON network_edges (target);
+"""
+
+# Rows are only written when their value changed, so run_id is the last run
+# which changed a row and unchanged rows are not touched at all.
+UPSERT_TIMESERIES = """
+INSERT INTO timeseries
+    (entity, indicator, sub_key, year, month, is_raw, value, run_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (entity, indicator, year, month, sub_key, is_raw) DO UPDATE
+SET value = excluded.value, run_id = excluded.run_id
+WHERE timeseries.value IS NOT excluded.value
+"""
+UPSERT_NETWORK_NODES = """
+INSERT INTO network_nodes
+    (entity, indicator, year, month, is_raw, node, value, run_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (entity, indicator, year, month, is_raw, node) DO UPDATE
+SET value = excluded.value, run_id = excluded.run_id
+WHERE network_nodes.value IS NOT excluded.value
+"""
+UPSERT_NETWORK_EDGES = """
+INSERT INTO network_edges
+    (entity, indicator, year, month, is_raw, source, target, value, run_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (entity, indicator, year, month, is_raw, source, target) DO UPDATE
+SET value = excluded.value, run_id = excluded.run_id
+WHERE network_edges.value IS NOT excluded.value
+"""
+UPSERT_STATEMENTS = {
+    "timeseries": UPSERT_TIMESERIES,
+    "network_nodes": UPSERT_NETWORK_NODES,
+    "network_edges": UPSERT_NETWORK_EDGES,
+}
+# The primary key of a table after (entity, indicator), in the order of the
+# columns of its upsert
+TABLE_KEY_COLUMNS = {
+    "timeseries": ("sub_key", "year", "month", "is_raw"),
+    "network_nodes": ("year", "month", "is_raw", "node"),
+    "network_edges": ("year", "month", "is_raw", "source", "target"),
+}
+
+
+def is_queried_month(year: int, month: int, ordinal_mask: t.Optional[int]) -> bool:
+    """
+    Whether the month of a row was queried, ``ordinal_mask`` is None when all
+    months were. Networks which are not split by month are always queried.
+    """
+    if ordinal_mask is None or not year:
+        return True
+    return bool(ordinal_mask >> to_query_ordinal(year, month) & 1)
+
+
+def now_isoformat() -> str:
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+class SqliteExporter:
+    """
+    Accumulates indicators of many runs in one SQLite database. Every repo or
+    user is written in its own transaction: its rows are upserted with
+    ``executemany``, rows whose value did not change are left as they are, and
+    rows of the queried months which are not in the new data are deleted.
+    """
+
+    def __init__(self, database_path: Path) -> None:
+        self.database_path = database_path
+        # Transactions are handled explicitly, one per repo or user
+        self.connection = sqlite3.connect(str(database_path), isolation_level=None)
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.run_id: t.Optional[int] = None
+        self.entity_count = 0
+        self.row_count = 0
+        self.changed_count = 0
+
+    def begin_run(self) -> int:
+        cursor = self.connection.execute(
+            "INSERT INTO runs (started_at) VALUES (?)", (now_isoformat(),)
+        )
+        self.run_id = t.cast(int, cursor.lastrowid)
+        return self.run_id
+
+    def _delete_stale_rows(
+        self,
+        table: str,
+        entity: str,
+        indicator_name: str,
+        keys: t.Set[t.Tuple[t.Any, ...]],
+        ordinal_mask: t.Optional[int],
+    ) -> None:
+        """Delete the rows of the queried months whose key is not in ``keys``"""
+        key_columns = TABLE_KEY_COLUMNS[table]
+        year_index = key_columns.index("year")
+        month_index = key_columns.index("month")
+        stale_keys = [
+            (entity, indicator_name, *key)
+            for key in self.connection.execute(
+                f"SELECT {', '.join(key_columns)} FROM {table} "
+                "WHERE entity = ? AND indicator = ?",
+                (entity, indicator_name),
+            )
+            if key not in keys
+            and is_queried_month(key[year_index], key[month_index], ordinal_mask)
+        ]
+        conditions = " AND ".join(
+            f"{column} = ?" for column in ("entity", "indicator", *key_columns)
+        )
+        self.connection.executemany(
+            f"DELETE FROM {table} WHERE {conditions}", stale_keys
+        )
+
+    def add_indicators_data(
+        self,
+        entity: str,
+        indicators_data: t.Iterable[
+            t.Tuple[
+                str,
+                t.Union[
+                    "TrivialIndicatorData",
+                    "NonTrivialIndicatorData",
+                    "TrivialNetworkIndicatorData",
+                    "NonTrivalNetworkInciatorData",
+                ],
+            ]
+        ],
+        indicator_queries: t.Optional[
+            t.Mapping[str, t.Sequence["IndicatorQuery"]]
+        ] = None,
+    ) -> None:
+        """
+        Upsert the indicators of a repo or user. ``indicator_queries`` are the
+        queries the indicators were filtered with, rows are only deleted in
+        the months they select; an indicator without queries is replaced as a
+        whole. The indicators are loaded before the transaction begins, so the
+        database is only locked while the rows are written.
+        """
+        if self.run_id is None:
+            raise RuntimeError("The run has not begun")
+
+        run_id = self.run_id
+        indicators_rows: t.List[t.Tuple[str, t.Dict[str, t.List[t.Tuple]]]] = []
+        for indicator_name, indicator_data in indicators_data:
+            rows: t.Dict[str, t.List[t.Tuple]] = {
+                table: [] for table in UPSERT_STATEMENTS
+            }
+            for key, year, month, is_raw, value in iter_indicator_month_values(
+                indicator_data
+            ):
+                if value is None:
+                    continue
+                row_key = (entity, indicator_name, year or 0, month or 0, is_raw)
+                if hasattr(value, "nodes"):
+                    for node, weight in iter_network_nodes(value):
+                        rows["network_nodes"].append((*row_key, node, weight, run_id))
+                    for source, target, weight in iter_network_edges(value):
+                        rows["network_edges"].append(
+                            (*row_key, source, target, weight, run_id)
+                        )
+                    continue
+                for sub_key, number in iter_value_items(value):
+                    if key is not None:
+                        sub_key = key if sub_key is None else f"{key}.{sub_key}"
+                    rows["timeseries"].append(
+                        (
+                            entity,
+                            indicator_name,
+                            sub_key or "",
+                            year,
+                            month,
+                            is_raw,
+                            number,
+                            run_id,
+                        )
+                    )
+            indicators_rows.append((indicator_name, rows))
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            total_changes = self.connection.total_changes
+            row_count = 0
+            for indicator_name, rows in indicators_rows:
+                queries = (indicator_queries or {}).get(indicator_name)
+                ordinal_mask = (
+                    CompiledQuery.merge(queries).to_ordinal_mask() if queries else None
+                )
+                for table, table_rows in rows.items():
+                    self.connection.executemany(UPSERT_STATEMENTS[table], table_rows)
+                    # The key of a row is between (entity, indicator) and value
+                    self._delete_stale_rows(
+                        table,
+                        entity,
+                        indicator_name,
+                        {row[2:-2] for row in table_rows},
+                        ordinal_mask,
+                    )
+                    row_count += len(table_rows)
+            changed_count = self.connection.total_changes - total_changes
+            self.connection.execute(
+                "UPDATE runs SET entity_count = entity_count + 1, "
+                "row_count = row_count + ?, changed_count = changed_count + ? "
+                "WHERE run_id = ?",
+                (row_count, changed_count, run_id),
+            )
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.entity_count += 1
+        self.row_count += row_count
+        self.changed_count += changed_count
+
+    def finish_run(self) -> None:
+        self.connection.execute(
+            "UPDATE runs SET finished_at = ? WHERE run_id = ?",
+            (now_isoformat(), self.run_id),
+        )
+        self.run_id = None
+
+    def rollback_run(self) -> None:
+        """
+        End a run which did not finish. The repos and users written before
+        are kept, a run without any of them is removed.
+        """
+        if self.connection.in_transaction:
+            self.connection.execute("ROLLBACK")
+        if self.run_id is not None and not self.entity_count:
+            self.connection.execute("DELETE FROM runs WHERE run_id = ?", (self.run_id,))
+        self.run_id = None
+
+    def close(self) -> None:
+        self.connection.close()
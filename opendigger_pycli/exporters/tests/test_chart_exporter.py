@@ -0,0 +1,35 @@
+from opendigger_pycli.datatypes import BaseData, OpenRankData
+from opendigger_pycli.exporters import chart_exporter
+from opendigger_pycli.exporters.chart_exporter import (
+    BarExporter,
+    ChartReportExporter,
+)
+
+
+def make_openrank_data(value: float) -> OpenRankData:
+    return OpenRankData(value=[BaseData(year=2023, month=1, value=value)])
+
+
+def test_register_exporter_keeps_the_class():
+    assert isinstance(BarExporter, type)
+    assert ChartReportExporter.exporters["bar_exporter"] is BarExporter
+
+
+def test_reports_do_not_share_exporter_state(monkeypatch):
+    monkeypatch.setattr(
+        chart_exporter, "analyze_indicators_data", lambda indicator_data: {}
+    )
+    first = ChartReportExporter()
+    first.add_indicator_data(make_openrank_data(123.25))
+    first_report = first.export("first")
+
+    second = ChartReportExporter()
+    second.add_indicator_data(make_openrank_data(456.5))
+    second_report = second.export("second")
+
+    assert first.exporter_instances["bar_exporter"] is not (
+        second.exporter_instances["bar_exporter"]
+    )
+    assert "123.25" in first_report
+    assert "123.25" not in second_report
+    assert "456.5" in second_report
@@ -0,0 +1,85 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from opendigger_pycli.datatypes import (
+    BaseData,
+    BaseNetworkData,
+    DeveloperNetworkData,
+    IssueResponseTimeData,
+    NameAndValue,
+    NameNameAndValue,
+    StarData,
+)
+from opendigger_pycli.exporters.json_exporter import iter_indicator_json_records
+from opendigger_pycli.exporters.json_writer import (
+    open_export_file,
+    write_json_object,
+    write_ndjson,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"a": 1},
+        {
+            "star": {"2023-01": 1, "2023-02-raw": 2.5},
+            "developer_network": {"nodes": [["开发者", 1.0]], "edges": []},
+            "issue_response_time": {"avg": {}, "levels": {"2023-01": [1, 2]}},
+            "empty": [],
+        },
+    ],
+)
+def test_write_json_object_matches_json_dumps(data):
+    file = io.StringIO()
+    write_json_object(file, sorted(data.items()))
+    assert file.getvalue() == json.dumps(data, indent=2, sort_keys=True)
+
+
+def test_write_ndjson_gzip(tmp_path):
+    records = [{"repo": "o/r", "month": "2023-01", "value": "开发者"}, {"value": None}]
+    path = tmp_path / "records.ndjson.gz"
+    with open_export_file(path, "gzip") as file:
+        assert write_ndjson(file, records) == 2
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        assert [json.loads(line) for line in file] == records
+
+
+def test_iter_indicator_json_records():
+    star = StarData(
+        value=[
+            BaseData(year=2023, month=1, value=1),
+            BaseData(year=2023, month=1, value=3, is_raw=True),
+        ]
+    )
+    assert list(iter_indicator_json_records(star)) == [
+        {"month": "2023-01", "is_raw": False, "value": 1},
+        {"month": "2023-01", "is_raw": True, "value": 3},
+    ]
+
+    response_time = IssueResponseTimeData(
+        value={
+            "avg": [BaseData(year=2023, month=1, value=1.5)],
+            "levels": [BaseData(year=2023, month=1, value=[1, 2])],
+        }
+    )
+    assert list(iter_indicator_json_records(response_time)) == [
+        {"month": "2023-01", "is_raw": False, "value": {"avg": 1.5, "levels": [1, 2]}}
+    ]
+
+    network = DeveloperNetworkData(
+        value=BaseNetworkData(
+            nodes=[NameAndValue("a", 1.0)], edges=[NameNameAndValue("a", "a", 2.0)]
+        )
+    )
+    assert list(iter_indicator_json_records(network)) == [
+        {
+            "month": None,
+            "is_raw": False,
+            "value": {"nodes": [("a", 1.0)], "edges": [("a", "a", 2.0)]},
+        }
+    ]
@@ -0,0 +1,180 @@
+import sqlite3
+import typing as t
+
+import pytest
+
+from opendigger_pycli.datatypes import (
+    BaseData,
+    BaseNetworkData,
+    DeveloperNetworkData,
+    IndicatorQuery,
+    IssueResponseTimeData,
+    NameAndValue,
+    NameNameAndValue,
+    StarData,
+)
+from opendigger_pycli.exporters.sqlite_exporter import SqliteExporter
+
+
+def make_indicators_data(stars: int, edges: int = 1):
+    return [
+        (
+            "star",
+            StarData(
+                value=[
+                    BaseData(year=2023, month=1, value=1),
+                    BaseData(year=2023, month=2, value=stars),
+                ]
+            ),
+        ),
+        (
+            "issue_response_time",
+            IssueResponseTimeData(
+                value=t.cast(
+                    t.Any, {"levels": [BaseData(year=2023, month=1, value=[4, 0])]}
+                )
+            ),
+        ),
+        (
+            "developer_network",
+            DeveloperNetworkData(
+                value=BaseNetworkData(
+                    nodes=[NameAndValue("a", 1.0), NameAndValue("b", 2.0)],
+                    edges=[NameNameAndValue("a", "b", 3.0)][:edges],
+                )
+            ),
+        ),
+    ]
+
+
+def export_run(database_path, stars: int, edges: int = 1) -> SqliteExporter:
+    exporter = SqliteExporter(database_path)
+    exporter.begin_run()
+    for entity in ("o/r0", "o/r1"):
+        exporter.add_indicators_data(entity, make_indicators_data(stars, edges))
+    exporter.finish_run()
+    exporter.close()
+    return exporter
+
+
+def test_upsert_only_changed_rows(tmp_path):
+    database_path = tmp_path / "opendigger.sqlite"
+    first = export_run(database_path, stars=2)
+    assert (first.row_count, first.changed_count) == (14, 14)
+    assert export_run(database_path, stars=2).changed_count == 0
+    third = export_run(database_path, stars=5)
+    assert (third.row_count, third.changed_count) == (14, 2)
+
+    connection = sqlite3.connect(str(database_path))
+    assert connection.execute(
+        "SELECT entity, sub_key, year, month, value, run_id FROM timeseries "
+        "WHERE indicator = 'star' ORDER BY entity, month"
+    ).fetchall() == [
+        ("o/r0", "", 2023, 1, 1.0, 1),
+        ("o/r0", "", 2023, 2, 5.0, 3),
+        ("o/r1", "", 2023, 1, 1.0, 1),
+        ("o/r1", "", 2023, 2, 5.0, 3),
+    ]
+    assert connection.execute(
+        "SELECT sub_key, value FROM timeseries "
+        "WHERE entity = 'o/r0' AND indicator = 'issue_response_time'"
+    ).fetchall() == [("levels.0", 4.0), ("levels.1", 0.0)]
+    assert connection.execute(
+        "SELECT year, month, source, target, value FROM network_edges "
+        "WHERE entity = 'o/r0'"
+    ).fetchall() == [(0, 0, "a", "b", 3.0)]
+    assert connection.execute(
+        "SELECT run_id, entity_count, row_count, changed_count FROM runs"
+    ).fetchall() == [(1, 2, 14, 14), (2, 2, 14, 0), (3, 2, 14, 2)]
+
+
+def test_stale_rows_are_removed(tmp_path):
+    database_path = tmp_path / "opendigger.sqlite"
+    export_run(database_path, stars=2)
+    second = export_run(database_path, stars=2, edges=0)
+    assert (second.row_count, second.changed_count) == (12, 2)
+
+    exporter = SqliteExporter(database_path)
+    exporter.begin_run()
+    exporter.add_indicators_data("o/r0", make_indicators_data(stars=2)[:1])
+    exporter.finish_run()
+    exporter.close()
+
+    connection = sqlite3.connect(str(database_path))
+    assert connection.execute("SELECT COUNT(*) FROM network_edges").fetchone() == (0,)
+    # Only the indicators which were exported again are replaced
+    assert connection.execute(
+        "SELECT COUNT(*) FROM timeseries WHERE entity = 'o/r0'"
+    ).fetchone() == (4,)
+    assert connection.execute(
+        "SELECT run_id, changed_count FROM runs WHERE run_id = 3"
+    ).fetchone() == (3, 0)
+
+
+def test_narrower_export_keeps_other_months(tmp_path):
+    database_path = tmp_path / "opendigger.sqlite"
+    star = [
+        BaseData(year=year, month=month, value=year + month)
+        for year in (2022, 2023)
+        for month in (1, 2)
+    ]
+    exporter = SqliteExporter(database_path)
+    exporter.begin_run()
+    exporter.add_indicators_data("o/r", [("star", StarData(value=star))])
+
+    # Only 2023 was queried, 2023-02 has no data anymore
+    exporter.add_indicators_data(
+        "o/r",
+        [("star", StarData(value=[BaseData(year=2023, month=1, value=2024)]))],
+        {"star": [IndicatorQuery(years=frozenset({2023}))]},
+    )
+    exporter.finish_run()
+    exporter.close()
+
+    assert exporter.changed_count == 4 + 1
+    connection = sqlite3.connect(str(database_path))
+    assert connection.execute(
+        "SELECT year, month, value FROM timeseries ORDER BY year, month"
+    ).fetchall() == [(2022, 1, 2023.0), (2022, 2, 2024.0), (2023, 1, 2024.0)]
+
+
+def test_each_entity_is_committed(tmp_path):
+    database_path = tmp_path / "opendigger.sqlite"
+    exporter = SqliteExporter(database_path)
+    exporter.begin_run()
+    exporter.add_indicators_data("o/r", make_indicators_data(stars=2))
+
+    # The database is not locked between two repos or users
+    connection = sqlite3.connect(str(database_path), timeout=0)
+    connection.execute("BEGIN IMMEDIATE")
+    assert connection.execute("SELECT COUNT(*) FROM timeseries").fetchone() == (4,)
+    connection.execute("ROLLBACK")
+
+    exporter.rollback_run()
+    with pytest.raises(RuntimeError):
+        exporter.add_indicators_data("o/r", make_indicators_data(stars=2))
+    exporter.close()
+
+    # The unfinished run keeps what was written
+    assert connection.execute(
+        "SELECT finished_at, entity_count, row_count FROM runs"
+    ).fetchall() == [(None, 1, 7)]
+
+
+def test_rollback_run_without_entities(tmp_path):
+    database_path = tmp_path / "opendigger.sqlite"
+    exporter = SqliteExporter(database_path)
+    exporter.begin_run()
+
+    def failing_indicators_data():
+        yield make_indicators_data(stars=2)[0]
+        raise RuntimeError("failed to load")
+
+    with pytest.raises(RuntimeError):
+        exporter.add_indicators_data("o/r", failing_indicators_data())
+    exporter.rollback_run()
+    exporter.close()
+
+    connection = sqlite3.connect(str(database_path))
+    assert connection.execute("SELECT COUNT(*) FROM runs").fetchone() == (0,)
+    assert connection.execute("SELECT COUNT(*) FROM timeseries").fetchone() == (0,)
@@ -0,0 +1,86 @@
+import pytest
+
+from opendigger_pycli.datatypes import (
+    BaseData,
+    BaseNetworkData,
+    BusFactorData,
+    DeveloperNetworkData,
+    IssueResponseTimeData,
+    NameAndValue,
+    NameNameAndValue,
+    StarData,
+)
+from opendigger_pycli.exporters.tidy import TidyRow, iter_indicator_tidy_rows
+
+
+def test_trivial_indicator_rows():
+    star = StarData(
+        value=[
+            BaseData(year=2023, month=1, value=1),
+            BaseData(year=2023, month=1, value=3, is_raw=True),
+        ]
+    )
+    assert list(iter_indicator_tidy_rows("o/r", "star", star)) == [
+        TidyRow("o/r", "star", None, 2023, 1, False, 1),
+        TidyRow("o/r", "star", None, 2023, 1, True, 3),
+    ]
+
+    bus_factor = BusFactorData(
+        value=[BaseData(year=2023, month=2, value=[NameAndValue("a", 2.0)])]
+    )
+    assert list(iter_indicator_tidy_rows("o/r", "bus_factor", bus_factor)) == [
+        TidyRow("o/r", "bus_factor", "a", 2023, 2, False, 2.0),
+    ]
+
+
+def test_non_trivial_indicator_rows():
+    response_time = IssueResponseTimeData(
+        value={
+            "avg": [BaseData(year=2023, month=1, value=1.5)],
+            "levels": [BaseData(year=2023, month=1, value=[4, 0])],
+        }
+    )
+    assert list(iter_indicator_tidy_rows("o/r", "irt", response_time)) == [
+        TidyRow("o/r", "irt", "avg", 2023, 1, False, 1.5),
+        TidyRow("o/r", "irt", "levels.0", 2023, 1, False, 4),
+        TidyRow("o/r", "irt", "levels.1", 2023, 1, False, 0),
+    ]
+
+
+def test_network_rows():
+    network = DeveloperNetworkData(
+        value=BaseNetworkData(
+            nodes=[NameAndValue("a", 1.0)], edges=[NameNameAndValue("a", "b", 2.0)]
+        )
+    )
+    assert list(iter_indicator_tidy_rows("u", "developer_network", network)) == [
+        TidyRow("u", "developer_network", "node:a", None, None, False, 1.0),
+        TidyRow("u", "developer_network", "edge:a->b", None, None, False, 2.0),
+    ]
+
+
+def test_columnar_exporter_partitions_by_indicator(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+
+    from opendigger_pycli.exporters.columnar_exporter import ColumnarExporter
+
+    exporter = ColumnarExporter("parquet")
+    for entity in ("o/r0", "o/r1"):
+        exporter.add_rows(
+            [
+                TidyRow(entity, "star", None, 2023, 1, False, 1),
+                TidyRow(entity, "irt", "avg", 2023, 1, False, 1.5),
+            ]
+        )
+    save_path = exporter.export(tmp_path / "dataset")
+
+    assert sorted(path.name for path in save_path.iterdir()) == [
+        "indicator=irt",
+        "indicator=star",
+    ]
+    table = ds.dataset(save_path, format="parquet", partitioning="hive").to_table(
+        filter=ds.field("indicator") == "star"
+    )
+    assert table.column("entity").to_pylist() == ["o/r0", "o/r1"]
+    assert table.column("value").to_pylist() == [1.0, 1.0]
@@ -0,0 +1,128 @@
+import typing as t
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import (
+        NonTrivalNetworkInciatorData,
+        NonTrivialIndicatorData,
+        TrivialIndicatorData,
+        TrivialNetworkIndicatorData,
+    )
+
+TIDY_COLUMNS = ("entity", "indicator", "sub_key", "year", "month", "is_raw", "value")
+
+
+class TidyRow(t.NamedTuple):
+    entity: str
+    indicator: str
+    sub_key: t.Optional[str]
+    year: t.Optional[int]
+    month: t.Optional[int]
+    is_raw: bool
+    value: t.Optional[float]
+
+
+def iter_network_nodes(network: t.Any) -> t.Iterator[t.Tuple[str, t.Any]]:
+    """The ``(id, weight)`` of the nodes of a network"""
+    for node in network.nodes:
+        if isinstance(node, dict):
+            yield node["id"], node["v"]
+        else:
+            yield node.name, node.value
+
+
+def iter_network_edges(network: t.Any) -> t.Iterator[t.Tuple[str, str, t.Any]]:
+    """The ``(source, target, weight)`` of the edges of a network"""
+    for edge in network.edges:
+        if isinstance(edge, dict):
+            yield edge["s"], edge["t"], edge["w"]
+        else:
+            yield edge.name0, edge.name1, edge.value
+
+
+def iter_value_items(value: t.Any) -> t.Iterator[t.Tuple[t.Optional[str], t.Any]]:
+    """
+    Flatten the value of a ``BaseData`` into ``(sub_key, number)`` items:
+
+    - numbers have no sub key
+    - ``NameAndValue`` lists are keyed by name, lists of names count 1 per name
+    - other lists are keyed by their index, e.g. the hours of ``active_dates_and_times``
+    - networks are keyed by ``node:<id>`` and ``edge:<source>-><target>``
+    """
+    if value is None:
+        return
+    if hasattr(value, "nodes"):
+        for node_id, weight in iter_network_nodes(value):
+            yield f"node:{node_id}", weight
+        for source, target, weight in iter_network_edges(value):
+            yield f"edge:{source}->{target}", weight
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if hasattr(item, "name"):
+                yield item.name, item.value
+            elif isinstance(item, str):
+                yield item, 1
+            else:
+                yield str(index), item
+    else:
+        yield None, value
+
+
+class MonthValue(t.NamedTuple):
+    key: t.Optional[str]
+    year: t.Optional[int]
+    month: t.Optional[int]
+    is_raw: bool
+    value: t.Any
+
+
+def iter_indicator_month_values(
+    indicator_data: t.Union[
+        "TrivialIndicatorData",
+        "NonTrivialIndicatorData",
+        "TrivialNetworkIndicatorData",
+        "NonTrivalNetworkInciatorData",
+    ],
+) -> t.Iterator[MonthValue]:
+    """
+    The value of every month of an indicator, ``key`` is the sub-indicator of
+    non-trivial indicators. Networks which are not split by month are a single
+    value without a year and month.
+    """
+    if hasattr(indicator_data.value, "nodes"):
+        yield MonthValue(None, None, None, False, indicator_data.value)
+        return
+
+    if isinstance(indicator_data.value, dict):
+        keyed_values: t.Iterable[
+            t.Tuple[t.Optional[str], t.Any]
+        ] = indicator_data.value.items()
+    else:
+        keyed_values = [(None, indicator_data.value)]
+
+    for key, values in keyed_values:
+        for base_data in values:
+            yield MonthValue(
+                key, base_data.year, base_data.month, base_data.is_raw, base_data.value
+            )
+
+
+def iter_indicator_tidy_rows(
+    entity: str,
+    indicator_name: str,
+    indicator_data: t.Union[
+        "TrivialIndicatorData",
+        "NonTrivialIndicatorData",
+        "TrivialNetworkIndicatorData",
+        "NonTrivalNetworkInciatorData",
+    ],
+) -> t.Iterator[TidyRow]:
+    """
+    The indicator data as tidy rows with one number per row. The keys of
+    non-trivial indicators prefix the sub key (``avg``, ``levels.0``), networks
+    which are not split by month have no year and month.
+    """
+    for key, year, month, is_raw, value in iter_indicator_month_values(indicator_data):
+        for sub_key, number in iter_value_items(value):
+            if key is not None:
+                sub_key = key if sub_key is None else f"{key}.{sub_key}"
+            yield TidyRow(entity, indicator_name, sub_key, year, month, is_raw, number)
@@ -149,35 +149,45 @@ class DisplyCMDResult:
             )
         return save_path
 
-    def display(self) -> None:
-        if not self.query_results:
-            CONSOLE.print("[red]No results to display")
+    def _display_query_result(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> None:
+        if not query_result.queried_data:
             return
 
+        if self.paging:
+            with CONSOLE.pager(styles=self.pager_color):
+                self._handle_title(query_result)
+        else:
+            self._handle_title(query_result)
+
+        self._handle_query_result(query_result)
+
+        save_path = self._handle_save_path(query_result)
+        if save_path is not None:
+            with open(save_path, "w") as f:
+                f.write(CONSOLE.export_html())
+            CONSOLE.print(f"[green]Saving results to[/] {save_path}")
+
+    def iter_display(
+        self,
+    ) -> t.Iterator[t.Union["RepoQueryResult", "UserQueryResult"]]:
+        """Display every query result as soon as it arrives and pass it on."""
         if self.save_path is not None and self.paging:
             CONSOLE.print(
                 "[yellow]You cannot use save output and paging at the same time, paging will be disabled"
             )
             self.paging = False
 
-        save_paths = []
+        has_results = False
         for query_result in self.query_results:
-            if not query_result.queried_data:
-                continue
-
-            if self.paging:
-                with CONSOLE.pager(styles=self.pager_color):
-                    self._handle_title(query_result)
-            else:
-                self._handle_title(query_result)
-
-            self._handle_query_result(query_result)
+            has_results = True
+            self._display_query_result(query_result)
+            yield query_result
 
-            save_path = self._handle_save_path(query_result)
-            if save_path is not None:
-                save_paths.append(save_path)
-                with open(save_path, "w") as f:
-                    f.write(CONSOLE.export_html())
+        if not has_results:
+            CONSOLE.print("[red]No results to display")
 
-        for save_path in save_paths:
-            CONSOLE.print(f"[green]Saving results to[/] {save_path}")
+    def display(self) -> None:
+        for _ in self.iter_display():
+            pass
@@ -1,22 +1,79 @@
 import datetime
 import json
+import pickle
+import sys
 import typing as t
+from collections import deque
+from pathlib import Path
 
 from opendigger_pycli.console import CONSOLE
 from opendigger_pycli.console.utils import print_failed_query
-from opendigger_pycli.exporters import JSON_FORMT, REPORT_FORMAT
-from opendigger_pycli.exporters.chart_exporter import ChartReportExporter
-from opendigger_pycli.exporters.json_exporter import export_indicator_to_json
+from opendigger_pycli.exporters import (
+    COLUMNAR_EXPORT_FORMATS,
+    JSON_FORMT,
+    NDJSON_FORMAT,
+    REPORT_FORMAT,
+    SQLITE_FORMAT,
+)
+from opendigger_pycli.exporters.json_exporter import (
+    export_indicator_to_json,
+    iter_indicator_json_records,
+)
+from opendigger_pycli.exporters.json_writer import (
+    COMPRESSION_SUFFIXES,
+    open_export_file,
+    write_json_object,
+    write_ndjson,
+)
+from opendigger_pycli.exporters.tidy import iter_indicator_tidy_rows
 
+from .planner import get_indicator_queries
 from .query import QueryResults, RepoQueryResult, UserQueryResult
 
 if t.TYPE_CHECKING:
-    from pathlib import Path
+    from concurrent.futures import Future
 
     from opendigger_pycli.exporters import (
         SURPPORTED_EXPORT_FORMAT_TYPE,
         SURPPORTED_EXPORT_FORMATS,
     )
+    from opendigger_pycli.exporters.json_writer import COMPRESSION_TYPE
+    from opendigger_pycli.exporters.tidy import TidyRow
+
+
+def render_report(title: str, indicator_datum: t.List[t.Any]) -> str:
+    # pyecharts and jinja2 are only imported when a report is exported
+    from opendigger_pycli.exporters.chart_exporter import ChartReportExporter
+
+    chart_report_exporter = ChartReportExporter()
+    for indicator_data in indicator_datum:
+        chart_report_exporter.add_indicator_data(indicator_data)
+    return chart_report_exporter.export(title)
+
+
+def get_custom_chart_exporters() -> t.Dict[str, t.Type[t.Any]]:
+    """
+    The custom chart exporters registered in this process. No exporter can be
+    registered before the chart exporter module is imported, so it is not
+    imported here.
+    """
+    chart_exporter = sys.modules.get("opendigger_pycli.exporters.chart_exporter")
+    if chart_exporter is None:
+        return {}
+    return dict(chart_exporter.ChartReportExporter.custom_exporters)
+
+
+def init_report_worker(custom_exporters: t.Dict[str, t.Type[t.Any]]) -> None:
+    """Register the custom chart exporters of the parent process in a worker"""
+    from opendigger_pycli.exporters.chart_exporter import ChartReportExporter
+
+    ChartReportExporter.custom_exporters.update(custom_exporters)
+
+
+def write_report(save_path: Path, title: str, indicator_datum: t.List[t.Any]) -> Path:
+    """Render a report and save it, runs in the worker processes with --jobs"""
+    save_path.write_text(render_report(title, indicator_datum), encoding="utf-8")
+    return save_path
 
 
 class ExportResult:
@@ -24,6 +81,8 @@ class ExportResult:
     format: "SURPPORTED_EXPORT_FORMAT_TYPE"
     save_path: "Path"
     is_split: bool
+    jobs: int
+    compression: t.Optional["COMPRESSION_TYPE"]
 
     def __init__(
         self,
@@ -31,23 +90,34 @@ class ExportResult:
         format: "SURPPORTED_EXPORT_FORMAT_TYPE",
         save_path: "Path",
         is_split: bool,
+        jobs: int = 1,
+        compression: t.Optional["COMPRESSION_TYPE"] = None,
         **kwargs,
     ) -> None:
         self.query_results = query_results
         self.format = format
         self.save_path = save_path
         self.is_split = is_split
+        self.jobs = jobs
+        self.compression = compression
 
-    def _query_result_to_json(
+    @property
+    def compression_suffix(self) -> str:
+        if self.compression is None:
+            return ""
+        return COMPRESSION_SUFFIXES[self.compression]
+
+    def _iter_query_result_indicator_data(
         self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
-    ) -> t.Dict[str, t.Dict]:
-        result: t.Dict[str, t.Dict] = {}
+    ) -> t.Iterator[t.Tuple[str, t.Any]]:
+        """
+        The data of the loaded indicators sorted by name, an indicator is only
+        loaded and queried when it is reached.
+        """
         queried_indicators_data = query_result.queried_data
         failed_queries = query_result.failed_query
-        for (
-            indicator_name,
-            indicator_dataloder_result,
-        ) in queried_indicators_data.items():
+        for indicator_name in sorted(queried_indicators_data):
+            indicator_dataloder_result = queried_indicators_data[indicator_name]
             indicator_name_formated = indicator_name.replace("_", " ").title()
             if (
                 not indicator_dataloder_result.is_success
@@ -62,50 +132,70 @@ class ExportResult:
             if failed_query:
                 if isinstance(failed_query, dict):
                     for key, value in failed_query.items():
-                        if value is not None:
+                        if value is None:
                             continue
                         print_failed_query(indicator_name + "." + key, value)
                 else:
                     print_failed_query(indicator_name, failed_query)
 
-            result[indicator_name] = export_indicator_to_json(
-                indicator_dataloder_result.data
+            yield indicator_name, indicator_dataloder_result.data
+
+    def _query_result_to_json(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> t.Dict[str, t.Dict]:
+        return {
+            indicator_name: export_indicator_to_json(indicator_data)
+            for indicator_name, indicator_data in (
+                self._iter_query_result_indicator_data(query_result)
             )
+        }
+
+    def _iter_query_result_records(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> t.Iterator[t.Dict[str, t.Any]]:
+        """One NDJSON record per (repo or user, indicator, month)"""
+        if query_result.__class__ is RepoQueryResult:
+            query_result = t.cast(RepoQueryResult, query_result)
+            target = {"repo": f"{query_result.org_name}/{query_result.repo_name}"}
+        else:
+            query_result = t.cast(UserQueryResult, query_result)
+            target = {"user": query_result.username}
 
-        return result
+        for indicator_name, indicator_data in self._iter_query_result_indicator_data(
+            query_result
+        ):
+            for record in iter_indicator_json_records(indicator_data):
+                yield {**target, "indicator": indicator_name, **record}
 
-    def _query_result_to_report(
+    def _get_query_result_entity(
         self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
     ) -> str:
-        chart_report_exporter = ChartReportExporter()
-
-        queried_indicators_data = query_result.queried_data
-        failed_queries = query_result.failed_query
-        for (
-            indicator_name,
-            indicator_dataloder_result,
-        ) in queried_indicators_data.items():
-            indicator_name_formated = indicator_name.replace("_", " ").title()
-            if (
-                not indicator_dataloder_result.is_success
-                or not indicator_dataloder_result.data
-            ):
-                CONSOLE.print(
-                    f"[red]Failed to load {indicator_name_formated} indicator data: {indicator_dataloder_result.desc}"
-                )
-                continue
+        """The full name of the repo, or the name of the user"""
+        if query_result.__class__ is RepoQueryResult:
+            query_result = t.cast(RepoQueryResult, query_result)
+            return f"{query_result.org_name}/{query_result.repo_name}"
+        query_result = t.cast(UserQueryResult, query_result)
+        return query_result.username
 
-            failed_query = failed_queries.get(indicator_name)
-            if failed_query:
-                if isinstance(failed_query, dict):
-                    for key, value in failed_query.items():
-                        if value is not None:
-                            continue
-                        print_failed_query(indicator_name + "." + key, value)
-                else:
-                    print_failed_query(indicator_name, failed_query)
+    def _iter_query_result_tidy_rows(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> t.Iterator["TidyRow"]:
+        entity = self._get_query_result_entity(query_result)
+        for indicator_name, indicator_data in self._iter_query_result_indicator_data(
+            query_result
+        ):
+            yield from iter_indicator_tidy_rows(entity, indicator_name, indicator_data)
 
-            chart_report_exporter.add_indicator_data(indicator_dataloder_result.data)
+    def _query_result_to_report_data(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> t.Tuple[str, t.List[t.Any]]:
+        """The title and the indicator data of the report of a query result"""
+        indicator_datum = [
+            indicator_data
+            for _, indicator_data in self._iter_query_result_indicator_data(
+                query_result
+            )
+        ]
 
         if query_result.__class__ is RepoQueryResult:
             query_result = t.cast(RepoQueryResult, query_result)
@@ -114,7 +204,7 @@ class ExportResult:
             query_result = t.cast(UserQueryResult, query_result)
             title = f"User {query_result.username} Indicator Report"
 
-        return chart_report_exporter.export(title)
+        return title, indicator_datum
 
     def _handle_save_path(
         self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
@@ -141,7 +231,13 @@ class ExportResult:
         else:
             base_path.mkdir(parents=True, exist_ok=True)
             if self.format == JSON_FORMT:
-                save_path = (base_path / current_datetime_str).with_suffix(".json")
+                save_path = (base_path / current_datetime_str).with_suffix(
+                    ".json" + self.compression_suffix
+                )
+            elif self.format == NDJSON_FORMAT:
+                save_path = (base_path / current_datetime_str).with_suffix(
+                    ".ndjson" + self.compression_suffix
+                )
             elif self.format == REPORT_FORMAT:
                 save_path = (base_path / current_datetime_str).with_suffix(".html")
             else:
@@ -149,32 +245,213 @@ class ExportResult:
 
         return save_path
 
-    def export(self) -> None:
-        if not self.query_results:
+    def _export_query_result(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> None:
+        save_path = self._handle_save_path(query_result)
+        if save_path is None:
+            raise ValueError("Save path is None")
+
+        # Indicators are serialized one by one straight to the file
+        if self.format == JSON_FORMT:
+            indicator_datum = self._iter_query_result_indicator_data(query_result)
+            if self.is_split:
+                for indicator_name, indicator_data in indicator_datum:
+                    save_path_splited = (
+                        save_path / f"{indicator_name}.json{self.compression_suffix}"
+                    )
+                    with open_export_file(save_path_splited, self.compression) as file:
+                        json.dump(
+                            export_indicator_to_json(indicator_data),
+                            file,
+                            indent=2,
+                            sort_keys=True,
+                        )
+                    CONSOLE.print(
+                        f"[green]Save Indicator {indicator_name} Data to {save_path}"
+                    )
+            else:
+                with open_export_file(save_path, self.compression) as file:
+                    write_json_object(
+                        file,
+                        (
+                            (indicator_name, export_indicator_to_json(indicator_data))
+                            for indicator_name, indicator_data in indicator_datum
+                        ),
+                    )
+                CONSOLE.print(f"[green]Save All Indicator Data to {save_path}")
+        elif self.format == NDJSON_FORMAT:
+            with open_export_file(save_path, self.compression) as file:
+                count = write_ndjson(
+                    file, self._iter_query_result_records(query_result)
+                )
+            CONSOLE.print(f"[green]Save {count} Indicator Records to {save_path}")
+        else:
+            write_report(save_path, *self._query_result_to_report_data(query_result))
+            CONSOLE.print(f"[green]Save Report to {save_path}")
+
+    def _iter_export_reports_in_processes(
+        self, custom_exporters: t.Dict[str, t.Type[t.Any]]
+    ) -> t.Iterator[t.Union["RepoQueryResult", "UserQueryResult"]]:
+        """
+        Render the reports in a pool of ``jobs`` processes. Only the title and
+        the indicator data are sent to the workers, which render and save the
+        reports. The spawned workers do not inherit the custom chart exporters
+        of this process, they are registered again by the pool initializer.
+        Results are passed on in the order of the query results.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        pending: t.Deque[
+            t.Tuple[t.Union["RepoQueryResult", "UserQueryResult"], "Future[Path]"]
+        ] = deque()
+
+        def finish_report() -> t.Union["RepoQueryResult", "UserQueryResult"]:
+            query_result, future = pending.popleft()
+            CONSOLE.print(f"[green]Save Report to {future.result()}")
+            return query_result
+
+        # Query results are still fetched by threads, forking them is not safe
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_report_worker,
+            initargs=(custom_exporters,),
+        ) as executor:
+            for query_result in self.query_results:
+                save_path = self._handle_save_path(query_result)
+                if save_path is None:
+                    raise ValueError("Save path is None")
+                future = executor.submit(
+                    write_report,
+                    save_path,
+                    *self._query_result_to_report_data(query_result),
+                )
+                pending.append((query_result, future))
+                # Limit the reports in flight, finished ones are passed on early
+                while len(pending) > 2 * self.jobs or (
+                    pending and pending[0][1].done()
+                ):
+                    yield finish_report()
+            while pending:
+                yield finish_report()
+
+    def _iter_export_columnar(
+        self,
+    ) -> t.Iterator[t.Union["RepoQueryResult", "UserQueryResult"]]:
+        """
+        Flatten every query result into tidy rows as it arrives, and write the
+        rows of all of them into one dataset partitioned by indicator.
+        """
+        from opendigger_pycli.exporters.columnar_exporter import ColumnarExporter
+
+        columnar_exporter = ColumnarExporter(self.format)  # type: ignore
+        has_results = False
+        for query_result in self.query_results:
+            has_results = True
+            columnar_exporter.add_rows(self._iter_query_result_tidy_rows(query_result))
+            yield query_result
+
+        if not has_results:
             CONSOLE.print("[red]No results to export")
             return
 
-        for query_result in self.query_results:
-            save_path = self._handle_save_path(query_result)
-            if save_path is None:
-                raise ValueError("Save path is None")
-
-            if self.format == "json":
-                result = self._query_result_to_json(query_result)
-
-                if self.is_split:
-                    for indicator_name, indicator_json_data in result.items():
-                        save_path_splited = save_path / f"{indicator_name}.json"
-                        save_path_splited.write_text(
-                            json.dumps(indicator_json_data, indent=2, sort_keys=True)
-                        )
-                        CONSOLE.print(
-                            f"[green]Save Indicator {indicator_name} Data to {save_path}"
+        current_datetime_str = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        save_path = columnar_exporter.export(
+            self.save_path / self.format / current_datetime_str
+        )
+        CONSOLE.print(
+            f"[green]Save {columnar_exporter.row_count} Indicator Rows to {save_path}"
+        )
+
+    def _iter_export_sqlite(
+        self,
+    ) -> t.Iterator[t.Union["RepoQueryResult", "UserQueryResult"]]:
+        """
+        Upsert every query result into the same database in ``save_path`` as it
+        arrives, each one in its own transaction. Rows are only deleted in the
+        months selected by the queries. A run which does not finish keeps the
+        results written so far and is left without ``finished_at``.
+        """
+        from opendigger_pycli.exporters.sqlite_exporter import SqliteExporter
+
+        self.save_path.mkdir(parents=True, exist_ok=True)
+        sqlite_exporter = SqliteExporter(self.save_path / "opendigger.sqlite")
+        try:
+            sqlite_exporter.begin_run()
+            for query_result in self.query_results:
+                sqlite_exporter.add_indicators_data(
+                    self._get_query_result_entity(query_result),
+                    self._iter_query_result_indicator_data(query_result),
+                    {
+                        indicator_name: get_indicator_queries(
+                            indicator_name,
+                            query_result.grouped_indicator_queries,
+                            query_result.uniform_query,
                         )
-                else:
-                    save_path.write_text(json.dumps(result, indent=2, sort_keys=True))
-                    CONSOLE.print(f"[green]Save All Indicator Data to {save_path}")
+                        for indicator_name in query_result.data
+                    },
+                )
+                yield query_result
+
+            if not sqlite_exporter.entity_count:
+                sqlite_exporter.rollback_run()
+                CONSOLE.print("[red]No results to export")
+                return
+            sqlite_exporter.finish_run()
+        except BaseException:
+            sqlite_exporter.rollback_run()
+            raise
+        finally:
+            sqlite_exporter.close()
+
+        CONSOLE.print(
+            f"[green]Save {sqlite_exporter.row_count} Indicator Rows "
+            f"({sqlite_exporter.changed_count} changed) to "
+            f"{sqlite_exporter.database_path}"
+        )
+
+    def iter_export(
+        self,
+    ) -> t.Iterator[t.Union["RepoQueryResult", "UserQueryResult"]]:
+        """Export every query result as soon as it arrives and pass it on."""
+        if self.format in COLUMNAR_EXPORT_FORMATS:
+            yield from self._iter_export_columnar()
+            return
+        if self.format == SQLITE_FORMAT:
+            yield from self._iter_export_sqlite()
+            return
+
+        has_results = False
+        if self.format == REPORT_FORMAT and self.jobs > 1:
+            custom_exporters = get_custom_chart_exporters()
+            try:
+                # Classes are pickled by reference, local classes can not be
+                pickle.dumps(custom_exporters)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                CONSOLE.print(
+                    "[yellow]Custom chart exporters can not be sent to worker "
+                    "processes, rendering the reports in this process"
+                )
             else:
-                rv = self._query_result_to_report(query_result)
-                save_path.write_text(rv, encoding="utf-8")
-                CONSOLE.print(f"[green]Save Report to {save_path}")
+                for query_result in self._iter_export_reports_in_processes(
+                    custom_exporters
+                ):
+                    has_results = True
+                    yield query_result
+                if not has_results:
+                    CONSOLE.print("[red]No results to export")
+                return
+
+        for query_result in self.query_results:
+            has_results = True
+            self._export_query_result(query_result)
+            yield query_result
+
+        if not has_results:
+            CONSOLE.print("[red]No results to export")
+
+    def export(self) -> None:
+        for _ in self.iter_export():
+            pass
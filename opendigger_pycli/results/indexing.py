@@ -0,0 +1,147 @@
+import bisect
+import itertools
+import typing as t
+import weakref
+
+from opendigger_pycli.datatypes.query import (
+    MAX_QUERY_YEAR,
+    MIN_QUERY_YEAR,
+    IndicatorQuery,
+    iter_bits,
+)
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import BaseData
+    from opendigger_pycli.datatypes.query import CompiledQuery
+
+
+def to_month_ordinal(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+
+def iter_year_ranges(years: t.Iterable[int]) -> t.Iterator[t.Tuple[int, int]]:
+    """Group years into ranges of consecutive years, e.g. 2019~2023"""
+    sorted_years = sorted(years)
+    for _, group in itertools.groupby(
+        enumerate(sorted_years), key=lambda item: item[1] - item[0]
+    ):
+        years_in_range = [year for _, year in group]
+        yield years_in_range[0], years_in_range[-1]
+
+
+class MonthIndex:
+    """
+    Sorted month ordinals (year * 12 + month - 1) of the items with a value,
+    with the positions of the items in the original list.
+
+    Compiled queries are matched against the bitset of the months with data,
+    the items of each matching month are found by binary search.
+    """
+
+    __slots__ = ("ordinals", "positions", "_ordinal_mask")
+
+    def __init__(self, base_data_list: t.Sequence["BaseData"]) -> None:
+        entries = sorted(
+            (to_month_ordinal(base_data.year, base_data.month), position)
+            for position, base_data in enumerate(base_data_list)
+            if base_data.value is not None
+        )
+        self.ordinals = [ordinal for ordinal, _ in entries]
+        self.positions = [position for _, position in entries]
+        self._ordinal_mask: t.Optional[int] = None
+
+    def _get_ordinal_range(self, start: int, stop: int) -> t.Tuple[int, int]:
+        return (
+            bisect.bisect_left(self.ordinals, start),
+            bisect.bisect_left(self.ordinals, stop),
+        )
+
+    def get_ordinal_mask(self) -> int:
+        """The months with data as a bitset, like ``CompiledQuery.year_months``"""
+        if self._ordinal_mask is None:
+            first_ordinal = to_month_ordinal(MIN_QUERY_YEAR, 1)
+            last_ordinal = to_month_ordinal(MAX_QUERY_YEAR, 12)
+            ordinal_mask = 0
+            for ordinal in self.ordinals:
+                if first_ordinal <= ordinal <= last_ordinal:
+                    ordinal_mask |= 1 << (ordinal - first_ordinal)
+            self._ordinal_mask = ordinal_mask
+        return self._ordinal_mask
+
+    def query_compiled(
+        self, compiled_query: "CompiledQuery"
+    ) -> t.Tuple[t.List[int], "CompiledQuery"]:
+        """
+        Return the sorted positions of the items matching the query,
+        and the parts of the query which matched at least one item.
+        """
+        ordinal_mask = self.get_ordinal_mask()
+        first_ordinal = to_month_ordinal(MIN_QUERY_YEAR, 1)
+        positions: t.List[int] = []
+        for bit in iter_bits(compiled_query.to_ordinal_mask() & ordinal_mask):
+            start, stop = self._get_ordinal_range(
+                first_ordinal + bit, first_ordinal + bit + 1
+            )
+            positions.extend(self.positions[start:stop])
+        positions.sort()
+        return positions, compiled_query.matched(ordinal_mask)
+
+    def query(
+        self,
+        years: t.AbstractSet[int],
+        months: t.AbstractSet[int],
+        year_months: t.AbstractSet[t.Tuple[int, int]],
+    ) -> t.Tuple[t.List[int], t.Set[int], t.Set[int], t.Set[t.Tuple[int, int]]]:
+        """
+        Return the sorted positions of the items matching any of the conditions,
+        and the years, months and year-months which matched at least one item.
+        """
+        query = IndicatorQuery(
+            years=frozenset(years),
+            months=frozenset(months),
+            year_months=frozenset(year_months),
+        )
+        positions, matched = self.query_compiled(query.compiled)
+        matched_query = matched.to_query()
+        return (
+            positions,
+            set(matched_query.years),
+            set(matched_query.months),
+            set(matched_query.year_months),
+        )
+
+
+# Month indexes of the lists of indicator data, by the id of the indicator data
+_month_indexes: t.Dict[
+    int, t.Dict[str, t.Tuple[t.Sequence["BaseData"], MonthIndex]]
+] = {}
+
+
+def _forget_month_indexes(owner_id: int) -> None:
+    _month_indexes.pop(owner_id, None)
+
+
+def get_month_index(
+    base_data_list: t.Sequence["BaseData"],
+    owner: t.Optional[t.Any] = None,
+    key: str = "value",
+) -> MonthIndex:
+    """
+    Return the month index of ``base_data_list``. If the list belongs to an
+    indicator data ``owner``, the index is built once and kept until the
+    indicator data is garbage collected.
+    """
+    if owner is None:
+        return MonthIndex(base_data_list)
+
+    owner_id = id(owner)
+    owner_indexes = _month_indexes.get(owner_id)
+    if owner_indexes is None:
+        owner_indexes = _month_indexes.setdefault(owner_id, {})
+        weakref.finalize(owner, _forget_month_indexes, owner_id)
+    cached = owner_indexes.get(key)
+    if cached is not None and cached[0] is base_data_list:
+        return cached[1]
+    month_index = MonthIndex(base_data_list)
+    owner_indexes[key] = (base_data_list, month_index)
+    return month_index
@@ -0,0 +1,141 @@
+import datetime
+import logging
+import typing as t
+from dataclasses import dataclass
+
+from opendigger_pycli.datatypes.query import (
+    MIN_QUERY_YEAR,
+    CompiledQuery,
+    iter_bits,
+    to_query_ordinal,
+)
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import DataloaderProto, IndicatorQuery
+
+# OpenDigger has no data before 2015
+FIRST_DATA_YEAR = 2015
+
+logger = logging.getLogger("opendigger-pycli")
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """
+    How a dataloader is fetched: the arguments of its ``load``, or the reason
+    why it is skipped.
+    """
+
+    dataloader: "DataloaderProto"
+    load_args: t.Optional[t.Tuple] = None
+    skip_reason: t.Optional[str] = None
+
+    @property
+    def is_skipped(self) -> bool:
+        return self.load_args is None
+
+
+def group_indicator_queries(
+    indicator_queries: t.Iterable[t.Tuple[str, t.Optional["IndicatorQuery"]]],
+) -> t.Dict[str, t.List["IndicatorQuery"]]:
+    """The queries of each selected indicator, in the order they were selected"""
+    grouped_queries: t.Dict[str, t.List["IndicatorQuery"]] = {}
+    for indicator_name, indicator_query in indicator_queries:
+        queries = grouped_queries.setdefault(indicator_name, [])
+        if indicator_query is not None:
+            queries.append(indicator_query)
+    return grouped_queries
+
+
+def get_indicator_queries(
+    indicator_name: str,
+    grouped_queries: t.Mapping[str, t.List["IndicatorQuery"]],
+    uniform_query: t.Optional["IndicatorQuery"],
+) -> t.List["IndicatorQuery"]:
+    """The queries of an indicator, no query means all data of the indicator"""
+    if uniform_query is not None:
+        return [uniform_query]
+    return grouped_queries.get(indicator_name, [])
+
+
+def get_query_dates(
+    queries: t.Iterable["IndicatorQuery"], today: datetime.date
+) -> t.List[t.Tuple[int, int]]:
+    """
+    The months for which OpenDigger may have data matching any of the queries,
+    from January 2015 up to the current month.
+    """
+    first_ordinal = to_query_ordinal(FIRST_DATA_YEAR, 1)
+    last_ordinal = to_query_ordinal(today.year, today.month)
+    data_months_mask = ((1 << (last_ordinal - first_ordinal + 1)) - 1) << first_ordinal
+    ordinal_mask = CompiledQuery.merge(queries).to_ordinal_mask() & data_months_mask
+    return [
+        (MIN_QUERY_YEAR + bit // 12, bit % 12 + 1) for bit in iter_bits(ordinal_mask)
+    ]
+
+
+def plan_fetches(
+    target: t.Tuple,
+    dataloaders: t.Sequence["DataloaderProto"],
+    grouped_queries: t.Mapping[str, t.List["IndicatorQuery"]],
+    uniform_query: t.Optional["IndicatorQuery"],
+    today: t.Optional[datetime.date] = None,
+) -> t.List[FetchPlan]:
+    """
+    Plan the fetch of each dataloader from the queries. Dataloaders which load
+    a file per month (``pass_date``) only fetch the months of the queries and
+    are not fetched at all if no month can match. Other dataloaders always
+    fetch the full series, so that unmatched queries are reported as failed.
+    """
+    if today is None:
+        today = datetime.date.today()
+
+    fetch_plans = []
+    for dataloader in dataloaders:
+        queries = get_indicator_queries(dataloader.name, grouped_queries, uniform_query)
+        if not queries:
+            if dataloader.pass_date:
+                fetch_plans.append(
+                    FetchPlan(dataloader, skip_reason="a date query is required")
+                )
+            else:
+                fetch_plans.append(FetchPlan(dataloader, target))
+            continue
+
+        if not dataloader.pass_date:
+            fetch_plans.append(FetchPlan(dataloader, target))
+            continue
+
+        dates = get_query_dates(queries, today)
+        if dates:
+            fetch_plans.append(FetchPlan(dataloader, (*target, dates)))
+        else:
+            fetch_plans.append(
+                FetchPlan(
+                    dataloader,
+                    skip_reason=f"no data from {FIRST_DATA_YEAR}-01 to "
+                    f"{today.year}-{today.month:02d} matches the query",
+                )
+            )
+    return fetch_plans
+
+
+def log_fetch_plans(title: str, fetch_plans: t.Sequence[FetchPlan]) -> None:
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    lines = [f"Fetch plan of {title}:"]
+    for fetch_plan in fetch_plans:
+        name = fetch_plan.dataloader.name
+        load_args = fetch_plan.load_args
+        if load_args is None:
+            lines.append(f"  {name}: skipped, {fetch_plan.skip_reason}")
+        elif fetch_plan.dataloader.pass_date:
+            dates = t.cast(t.List[t.Tuple[int, int]], load_args[-1])
+            lines.append(
+                f"  {name}: {len(dates)} monthly files, "
+                f"{dates[0][0]}-{dates[0][1]:02d} ~ {dates[-1][0]}-{dates[-1][1]:02d}"
+            )
+        else:
+            lines.append(f"  {name}: full series")
+    logger.debug("\n".join(lines))
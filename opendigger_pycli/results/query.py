@@ -1,17 +1,15 @@
 from __future__ import annotations
-import copy
-import datetime
+import functools
 import typing as t
-from dataclasses import dataclass, field, replace
-
-from rich.progress import track
+from dataclasses import InitVar, dataclass, field, replace
 
 from opendigger_pycli.datatypes import (
     NON_TRIVAL_NETWORK_INDICATOR_DATA,
     NON_TRIVIAL_INDICATOR_DATA,
     TRIVIAL_INDICATOR_DATA,
     TRIVIAL_NETWORK_INDICATOR_DATA,
-    IndicatorQuery,
+    ColumnarSeries,
+    CompiledQuery,
 )
 from opendigger_pycli.console import CONSOLE
 from opendigger_pycli.utils.gtihub_api import (
@@ -21,16 +19,34 @@ from opendigger_pycli.utils.gtihub_api import (
     get_issue_comments,
     create_issue_comment_reactions,
 )
-from opendigger_pycli.config.utils import get_github_pat, has_github_pat, get_user_info
-from opendigger_pycli.utils import THREAD_POOL
+from opendigger_pycli.dataloaders.aio import run_dataloaders
+from opendigger_pycli.dataloaders.sources import get_data_source
+from opendigger_pycli.results.indexing import get_month_index
+from opendigger_pycli.results.planner import (
+    get_indicator_queries,
+    group_indicator_queries,
+    log_fetch_plans,
+    plan_fetches,
+)
+from opendigger_pycli.results.views import FilteredView, LazyMapping
+from opendigger_pycli.config.utils import (
+    get_fetch_concurrency,
+    get_github_pat,
+    get_user_info,
+    has_github_pat,
+)
 
 if t.TYPE_CHECKING:
+    from rich.progress import Progress
+
     from opendigger_pycli.datatypes import (
         BaseData,
         DataloaderProto,
         DataloaderResult,
+        IndicatorQuery,
         NonTrivalNetworkInciatorData,
         NonTrivialIndicatorData,
+        TimeDurationRelatedIndicatorDict,
         TrivialIndicatorData,
         TrivialNetworkIndicatorData,
     )
@@ -38,16 +54,28 @@ if t.TYPE_CHECKING:
 
 
 @t.overload
-def run_dataloader(result: "RepoQueryResult") -> None:
+def run_dataloader(
+    result: "RepoQueryResult",
+    max_workers: t.Optional[int] = None,
+    progress: t.Optional["Progress"] = None,
+) -> None:
     ...
 
 
 @t.overload
-def run_dataloader(result: "UserQueryResult") -> None:
+def run_dataloader(
+    result: "UserQueryResult",
+    max_workers: t.Optional[int] = None,
+    progress: t.Optional["Progress"] = None,
+) -> None:
     ...
 
 
-def run_dataloader(result) -> None:
+def run_dataloader(
+    result,
+    max_workers: t.Optional[int] = None,
+    progress: t.Optional["Progress"] = None,
+) -> None:
     if not isinstance(result, RepoQueryResult) and not isinstance(
         result, UserQueryResult
     ):
@@ -58,110 +86,97 @@ def run_dataloader(result) -> None:
         if isinstance(result, UserQueryResult)
         else f"Fetching data for {result.type}: [green]{result.org_name}/{result.repo_name}"
     )
-    for dataloader in track(result.dataloaders, description=process_desc):
-        if not dataloader.pass_date:
-            result.data[dataloader.name] = (
-                dataloader.load(
-                    result.org_name,
-                    result.repo_name,
-                )
-                if isinstance(result, RepoQueryResult)
-                else dataloader.load(result.username)
-            )
-            continue
-        current_indicator_queries = [
-            indicator_query[1]
-            for indicator_query in result.indicator_queries
-            if indicator_query[0] == dataloader.name and indicator_query[1] is not None
-        ]
-        # For indicators that do not specify a query and need to pass in a date query, ignore it directly
-        if not current_indicator_queries:
-            continue
-
-        current_year = datetime.date.today().year
-        dates = set()
-        for query in current_indicator_queries:
-            for month in query.months:
-                dates.add((current_year, month))
-            for year in query.years:
-                for month in range(1, 13):
-                    dates.add((year, month))
-            for year_month in query.year_months:
-                dates.add(year_month)
-
-        result.data[dataloader.name] = (
-            dataloader.load(result.org_name, result.repo_name, list(dates))
-            if isinstance(result, RepoQueryResult)
-            else dataloader.load(result.username, list(dates))
-        )
-
+    if max_workers is None:
+        max_workers = get_fetch_concurrency()
 
-def merge_indicator_queries(
-    indicator_queries: t.List["IndicatorQuery"],
-) -> "IndicatorQuery":
-    need_years_list = [{year for year in query.years} for query in indicator_queries]
-    need_years = set.union(*need_years_list) if need_years_list else set()
-    need_months_list = [
-        {month for month in query.months} for query in indicator_queries
-    ]
-    need_months = set.union(*need_months_list) if need_months_list else set()
-    need_year_months_list = [
-        {year_month for year_month in query.year_months} for query in indicator_queries
-    ]
-    need_year_months = (
-        set.union(*need_year_months_list) if need_year_months_list else set()
+    target = (
+        (result.org_name, result.repo_name)
+        if isinstance(result, RepoQueryResult)
+        else (result.username,)
     )
-    return IndicatorQuery(
-        years=frozenset(need_years),
-        months=frozenset(need_months),
-        year_months=frozenset(need_year_months),
+    fetch_plans = plan_fetches(
+        target,
+        result.dataloaders,
+        result.grouped_indicator_queries,
+        result.uniform_query,
     )
+    log_fetch_plans(f"{result.type} {'/'.join(target)}", fetch_plans)
+    load_tasks = [
+        (fetch_plan.dataloader, fetch_plan.load_args)
+        for fetch_plan in fetch_plans
+        if fetch_plan.load_args is not None
+    ]
+
+    # Dataloaders are independent of each other, so they are fetched
+    # concurrently and the results are stored in the original order.
+    def load(current_progress: "Progress") -> t.List["DataloaderResult"]:
+        task_id = current_progress.add_task(process_desc, total=len(load_tasks))
+        load_results = run_dataloaders(
+            load_tasks,
+            max_workers,
+            lambda *_: current_progress.advance(task_id),
+        )
+        # A shared progress (e.g. from the query scheduler) only gets
+        # a temporary task which is removed when this result is loaded.
+        if current_progress is progress:
+            current_progress.remove_task(task_id)
+        return load_results
+
+    if progress is not None:
+        load_results = load(progress)
+    else:
+        from rich.progress import Progress
+
+        with Progress() as own_progress:
+            load_results = load(own_progress)
+
+    for (dataloader, _), load_result in zip(load_tasks, load_results):
+        result.data[dataloader.name] = load_result
 
 
 def query_base_data(
     base_data_list: t.List["BaseData"],
     indicator_queries: t.List["IndicatorQuery"],
+    owner: t.Optional[t.Any] = None,
+    key: str = "value",
 ):
-    merged_indicator_query = merge_indicator_queries(indicator_queries)
-    success_year_query = set()
-    success_month_query = set()
-    success_year_month_query = set()
-
-    queried_data = []
-    for base_data in base_data_list:
-        is_add = False
-        if base_data.value is None:
-            continue
-        if base_data.year in merged_indicator_query.years:
-            success_year_query.add(base_data.year)
-            is_add = True
-        if base_data.month in merged_indicator_query.months:
-            success_month_query.add(base_data.month)
-            is_add = True
-        if (
-            base_data.year,
-            base_data.month,
-        ) in merged_indicator_query.year_months:
-            success_year_month_query.add((base_data.year, base_data.month))
-            is_add = True
-        if not indicator_queries:
-            is_add = True
-
-        if not is_add:
-            continue
-        queried_data.append(base_data)
+    """
+    Filter the items matching any of the queries, the month index of the list
+    is kept with the indicator data ``owner`` it belongs to. A ``ColumnarSeries``
+    is filtered on its arrays instead.
+    """
+    is_columnar = isinstance(base_data_list, ColumnarSeries)
+    if not indicator_queries:
+        if is_columnar:
+            # Columnar values are numbers, there are no items without a value
+            return FilteredView.of(base_data_list), None
+        positions = [
+            position
+            for position, base_data in enumerate(base_data_list)
+            if base_data.value is not None
+        ]
+        if len(positions) == len(base_data_list):
+            return FilteredView.of(base_data_list), None
+        return FilteredView(base_data_list, positions), None
+
+    merged_indicator_query = CompiledQuery.merge(indicator_queries)
+    if is_columnar:
+        queried_series, success_query = t.cast(
+            ColumnarSeries, base_data_list
+        ).query_compiled(merged_indicator_query)
+        queried_data = FilteredView.of(queried_series)
+    else:
+        month_index = get_month_index(base_data_list, owner, key)
+        positions, success_query = month_index.query_compiled(merged_indicator_query)
+        queried_data = FilteredView(base_data_list, positions)
 
     faild_query = None
-    if (
-        merged_indicator_query.years - success_year_query
-        or merged_indicator_query.months - success_month_query
-        or merged_indicator_query.year_months - success_year_month_query
-    ):
-        faild_query = IndicatorQuery(
-            years=merged_indicator_query.years - success_year_query,
-            months=merged_indicator_query.months - success_month_query,
+    if merged_indicator_query - success_query:
+        # The failed query keeps all year-months of the query
+        faild_query = replace(
+            merged_indicator_query - success_query,
             year_months=merged_indicator_query.year_months,
-        )
+        ).to_query()
 
     return queried_data, faild_query
 
@@ -170,16 +185,26 @@ def query_non_trivial_indicator(
     indicator_data: "NonTrivialIndicatorData",
     indicator_queries: t.List["IndicatorQuery"],
 ) -> t.Tuple["NonTrivialIndicatorData", t.Dict[str, t.Optional["IndicatorQuery"]]]:
-    queried_indicator_data = copy.deepcopy(indicator_data)
+    # The queried lists are views of the loaded lists, nothing is copied
+    queried_value = dict(indicator_data.value)
     failed_queries = {}
     for key, base_data_list in indicator_data.value.items():
         base_data_list = t.cast(t.List["BaseData"], base_data_list)
         queried_base_data, failed_query = query_base_data(
-            base_data_list, indicator_queries
+            base_data_list,
+            indicator_queries,
+            owner=indicator_data,
+            key=key,
         )
-        queried_indicator_data.value[key] = queried_base_data  # type: ignore
+        queried_value[key] = queried_base_data
         failed_queries[key] = failed_query
-    return queried_indicator_data, failed_queries
+    return (
+        replace(
+            indicator_data,
+            value=t.cast("TimeDurationRelatedIndicatorDict", queried_value),
+        ),
+        failed_queries,
+    )
 
 
 def query_trival_indicator(
@@ -187,7 +212,9 @@ def query_trival_indicator(
     indicator_queries: t.List["IndicatorQuery"],
 ) -> t.Tuple["TrivialIndicatorData", t.Optional["IndicatorQuery"]]:
     queried_base_data_list, failed_query = query_base_data(
-        indicator_data.value, indicator_queries
+        indicator_data.value,
+        indicator_queries,
+        owner=indicator_data,
     )
     return replace(indicator_data, value=queried_base_data_list), failed_query
 
@@ -197,7 +224,9 @@ def query_non_trivial_network_indciator(
     indicator_queries: t.List["IndicatorQuery"],
 ) -> t.Tuple["NonTrivalNetworkInciatorData", t.Optional["IndicatorQuery"]]:
     queried_base_data_list, failed_query = query_base_data(
-        indicator_data.value, indicator_queries
+        indicator_data.value,
+        indicator_queries,
+        owner=indicator_data,
     )
     return replace(indicator_data, value=queried_base_data_list), failed_query
 
@@ -298,80 +327,90 @@ class NodataIssueCreator:
             return
 
 
-def run_query(query_result: "BaseQueryResult") -> None:
-    indicator_queries = query_result.indicator_queries
-    indicators_data = query_result.data
-
-    nodata_indicator_names = []
-    for (
+def _query_indicator(
+    query_result: "BaseQueryResult", indicator_name: str
+) -> t.Tuple[
+    "DataloaderResult",
+    t.Union[t.Optional["IndicatorQuery"], t.Dict[str, t.Optional["IndicatorQuery"]]],
+]:
+    indicator_dataloder_result = query_result.data[indicator_name]
+    current_indicator_queries = get_indicator_queries(
         indicator_name,
-        indicator_dataloder_result,
-    ) in indicators_data.items():
-        query_result.failed_query[indicator_name] = None
-        current_indicator_queries = (
-            [
-                indicator_query[1]
-                for indicator_query in indicator_queries
-                if indicator_query[0] == indicator_name
-                and indicator_query[1] is not None
-            ]
-            if query_result.uniform_query is None
-            else [query_result.uniform_query]
+        query_result.grouped_indicator_queries,
+        query_result.uniform_query,
+    )
+
+    indicator_data = indicator_dataloder_result.data
+    if indicator_data is None:
+        raise ValueError(f"No data to query for indicator {indicator_name}")
+
+    indicator_data_class = indicator_data.data_class
+    queried_indciator_data: t.Any
+    failed_query: t.Any
+    if indicator_data_class == TRIVIAL_NETWORK_INDICATOR_DATA:
+        queried_indciator_data, failed_query = query_trivial_network_indicator(
+            indicator_data, current_indicator_queries
         )
-        if (
-            not indicator_dataloder_result.is_success
-            or not indicator_dataloder_result.data
-        ):
-            nodata_indicator_names.append(indicator_name)
-            continue
-
-        indicator_data_class = indicator_dataloder_result.data.data_class
-        queried_indciator_data: t.Any
-        if indicator_data_class == TRIVIAL_NETWORK_INDICATOR_DATA:
-            (
-                queried_indciator_data,
-                failed_query,
-            ) = query_trivial_network_indicator(
-                indicator_dataloder_result.data, current_indicator_queries
-            )
-        elif indicator_data_class == NON_TRIVAL_NETWORK_INDICATOR_DATA:
-            (
-                queried_indciator_data,
-                failed_query,
-            ) = query_non_trivial_network_indciator(
-                indicator_dataloder_result.data, current_indicator_queries
-            )
-        elif indicator_data_class == TRIVIAL_INDICATOR_DATA:
-            (
-                queried_indciator_data,
-                failed_query,
-            ) = query_trival_indicator(
-                indicator_dataloder_result.data, current_indicator_queries
-            )
-        elif indicator_data_class == NON_TRIVIAL_INDICATOR_DATA:
-            (
-                queried_indciator_data,
-                failed_queries,
-            ) = query_non_trivial_indicator(
-                indicator_dataloder_result.data, current_indicator_queries
-            )
-            failed_query_dict = {}
-            for key, failed_query in failed_queries.items():
-                failed_query_dict[key] = failed_query
-            query_result.failed_query[indicator_name] = failed_query_dict
-            query_result.queried_data[indicator_name] = replace(
-                indicator_dataloder_result, data=queried_indciator_data
-            )
-            continue
-        else:
-            raise ValueError(
-                f"Unknown indicator data class: {indicator_dataloder_result}"
-            )
-        query_result.failed_query[indicator_name] = failed_query
-        query_result.queried_data[indicator_name] = replace(
-            indicator_dataloder_result, data=queried_indciator_data
+    elif indicator_data_class == NON_TRIVAL_NETWORK_INDICATOR_DATA:
+        queried_indciator_data, failed_query = query_non_trivial_network_indciator(
+            indicator_data, current_indicator_queries
+        )
+    elif indicator_data_class == TRIVIAL_INDICATOR_DATA:
+        queried_indciator_data, failed_query = query_trival_indicator(
+            indicator_data, current_indicator_queries
+        )
+    elif indicator_data_class == NON_TRIVIAL_INDICATOR_DATA:
+        queried_indciator_data, failed_queries = query_non_trivial_indicator(
+            indicator_data, current_indicator_queries
         )
+        failed_query = dict(failed_queries)
+    else:
+        raise ValueError(f"Unknown indicator data class: {indicator_dataloder_result}")
+    return (
+        replace(indicator_dataloder_result, data=queried_indciator_data),
+        failed_query,
+    )
+
 
+def run_query(query_result: "BaseQueryResult") -> None:
+    """
+    Set up the queried data and failed queries of the query result. Indicators
+    are queried lazily, the first time ``display``/``export`` accesses them.
+    """
+    success_indicator_names = []
+    nodata_indicator_names = []
+    for indicator_name, indicator_dataloder_result in query_result.data.items():
+        if indicator_dataloder_result.is_success and indicator_dataloder_result.data:
+            success_indicator_names.append(indicator_name)
+        else:
+            nodata_indicator_names.append(indicator_name)
+
+    indicator_query_results = LazyMapping(
+        success_indicator_names,
+        lambda indicator_name: _query_indicator(query_result, indicator_name),
+    )
+    query_result.queried_data = LazyMapping(
+        success_indicator_names,
+        lambda indicator_name: indicator_query_results[indicator_name][0],
+    )
+    query_result.failed_query = LazyMapping(
+        query_result.data,
+        lambda indicator_name: indicator_query_results[indicator_name][1]
+        if indicator_name in indicator_query_results
+        else None,
+    )
+
+    query_result.nodata_indicator_names = nodata_indicator_names
+
+
+def report_nodata_indicators(query_result: "BaseQueryResult") -> None:
+    """
+    Print the indicators of the query result without data and report them to
+    OpenDigger. Query results are built in worker threads under the progress
+    display, so this is called by the consumer of the query results, one
+    result at a time.
+    """
+    nodata_indicator_names = query_result.nodata_indicator_names
     if not nodata_indicator_names:
         return
 
@@ -385,13 +424,17 @@ def run_query(query_result: "BaseQueryResult") -> None:
         print_str = f"{title}, Indicator Names: {str(nodata_indicator_names)}, No Data"
 
     CONSOLE.print(f"[red]{print_str}[/red]")
+    # Queries against a local mirror do not access the network
+    if get_data_source().is_local:
+        return
     if not has_github_pat():
         CONSOLE.print(
             "[yellow]You can config github personal access token to create issues automatically[/yellow]"
         )
         return
-    with CONSOLE.status("Issues being returned to OpenDigger..."):
-        NodataIssueCreator(title, nodata_indicator_names).run()
+    # A status would be a second live display next to the progress of the query
+    CONSOLE.print("[yellow]Issues being returned to OpenDigger...[/yellow]")
+    NodataIssueCreator(title, nodata_indicator_names).run()
 
 
 @dataclass
@@ -401,16 +444,21 @@ class BaseQueryResult:
     indicator_queries: t.List[t.Tuple[str, t.Optional["IndicatorQuery"]]]
     uniform_query: t.Optional["IndicatorQuery"]
     data: t.Dict[str, "DataloaderResult"] = field(default_factory=dict, init=False)
-    queried_data: t.Dict[str, "DataloaderResult"] = field(
+    queried_data: t.Mapping[str, "DataloaderResult"] = field(
         default_factory=dict, init=False
     )
-    failed_query: t.Dict[
+    failed_query: t.Mapping[
         str,
         t.Union[
             t.Optional["IndicatorQuery"],
             t.Dict[str, t.Optional["IndicatorQuery"]],
         ],
     ] = field(default_factory=dict, init=False)
+    nodata_indicator_names: t.List[str] = field(default_factory=list, init=False)
+
+    @functools.cached_property
+    def grouped_indicator_queries(self) -> t.Dict[str, t.List["IndicatorQuery"]]:
+        return group_indicator_queries(self.indicator_queries)
 
 
 @dataclass
@@ -419,10 +467,11 @@ class RepoQueryResult(BaseQueryResult):
     repo: t.Tuple[str, str]
     org_name: str = field(init=False)
     repo_name: str = field(init=False)
+    progress: InitVar[t.Optional["Progress"]] = None
 
-    def __post_init__(self) -> None:
+    def __post_init__(self, progress: t.Optional["Progress"]) -> None:
         self.org_name, self.repo_name = self.repo
-        run_dataloader(self)
+        run_dataloader(self, progress=progress)
         run_query(self)
 
 
@@ -430,10 +479,11 @@ class RepoQueryResult(BaseQueryResult):
 class UserQueryResult(BaseQueryResult):
     type: t.ClassVar[t.Literal["user"]] = "user"
     username: str
+    progress: InitVar[t.Optional["Progress"]] = None
 
-    def __post_init__(self) -> None:
-        run_dataloader(self)
+    def __post_init__(self, progress: t.Optional["Progress"]) -> None:
+        run_dataloader(self, progress=progress)
         run_query(self)
 
 
-QueryResults = t.Union[t.List["RepoQueryResult"], t.List["UserQueryResult"]]
+QueryResults = t.Union[t.Iterable["RepoQueryResult"], t.Iterable["UserQueryResult"]]
@@ -0,0 +1,62 @@
+import itertools
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+if t.TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from .query import BaseQueryResult
+
+TargetType = t.TypeVar("TargetType")
+QueryResultType = t.TypeVar("QueryResultType", bound="BaseQueryResult")
+
+
+def schedule_query_results(
+    targets: t.Sequence[TargetType],
+    build_query_result: t.Callable[[TargetType, "Progress"], QueryResultType],
+    max_workers: int,
+    description: str = "Querying indicators",
+) -> t.Generator[QueryResultType, None, None]:
+    """
+    Build query results for many repos/users in parallel and yield them
+    as soon as they are finished, so that chained processors can handle
+    a result while the others are still being fetched.
+
+    At most ``2 * max_workers`` targets are submitted at a time, and a result
+    is only referenced here until it is yielded. Targets which were not
+    started yet are cancelled when the generator is closed early.
+
+    The number of in-flight requests is limited by the request limiter
+    of the data layer, not by ``max_workers``.
+    """
+    if not targets:
+        return
+
+    from rich.progress import Progress
+
+    remaining_targets = iter(targets)
+    pending: t.Set["Future[QueryResultType]"] = set()
+    with Progress() as progress:
+        task_id = progress.add_task(description, total=len(targets))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(count: int) -> None:
+            for target in itertools.islice(remaining_targets, count):
+                pending.add(executor.submit(build_query_result, target, progress))
+
+        try:
+            submit(2 * max_workers)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+                # Keep the workers busy while the finished results are consumed
+                submit(len(done))
+                for future in done:
+                    progress.advance(task_id)
+                    yield future.result()
+                del done
+        finally:
+            # Like shutdown(cancel_futures=True), which needs Python 3.9
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
@@ -0,0 +1,149 @@
+import gzip
+import json
+import typing as t
+
+from pyecharts.charts import Bar
+
+from opendigger_pycli.datatypes import BaseData, DataloaderResult, StarData
+from opendigger_pycli.exporters.chart_exporter import (
+    BaseChartExporter,
+    ChartReportExporter,
+    ExportData,
+)
+from opendigger_pycli.results.export import ExportResult
+from opendigger_pycli.results.query import RepoQueryResult
+
+
+class FakeStarDataloader:
+    name = "star"
+    pass_date = False
+    indicator_type = "metric"
+    introducer = "X-lab"
+    type = "repo"
+    demo_url = ""
+
+    def load(self, org: str, repo: str) -> DataloaderResult:
+        return DataloaderResult(
+            is_success=True,
+            dataloader=t.cast(t.Any, self),
+            data=StarData(value=[BaseData(year=2023, month=1, value=len(repo))]),
+            desc="",
+        )
+
+
+def make_query_results(count: int) -> t.List[RepoQueryResult]:
+    return [
+        RepoQueryResult(
+            repo=("org", f"repo-{index}"),
+            dataloaders=t.cast(t.Any, [FakeStarDataloader()]),
+            indicator_queries=[],
+            uniform_query=None,
+        )
+        for index in range(count)
+    ]
+
+
+class CustomStarExporter(BaseChartExporter):
+    exporter_name = "custom_star_exporter"
+    accepted_indicator_dataclass = [StarData]
+
+    def export(self) -> t.List[ExportData]:
+        return [ExportData(name="Custom Star Chart", chart=Bar())]
+
+
+def disable_ai_analysis(tmp_path, monkeypatch) -> None:
+    # The workers read this config, without an OpenAI key the AI analysis is skipped
+    config_dir = tmp_path / "config" / "opendigger-pycli"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.ini").write_text("[app_keys]\nopenai_key = None\n")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+
+
+def test_export_reports_in_processes(tmp_path, monkeypatch):
+    disable_ai_analysis(tmp_path, monkeypatch)
+    query_results = make_query_results(5)
+
+    exported = list(
+        ExportResult(
+            iter(query_results), "report", tmp_path / "out", False, jobs=2
+        ).iter_export()
+    )
+
+    assert exported == query_results
+    for index in range(5):
+        (report,) = (tmp_path / "out" / f"repo-org-repo-{index}").glob("*.html")
+        assert f"Repo org/repo-{index} Indicator Report" in report.read_text(
+            encoding="utf-8"
+        )
+
+
+def test_export_reports_in_processes_with_custom_exporters(tmp_path, monkeypatch):
+    disable_ai_analysis(tmp_path, monkeypatch)
+    monkeypatch.setitem(
+        ChartReportExporter.custom_exporters,
+        CustomStarExporter.exporter_name,
+        CustomStarExporter,
+    )
+
+    list(
+        ExportResult(
+            make_query_results(2), "report", tmp_path / "out", False, jobs=2
+        ).iter_export()
+    )
+
+    for index in range(2):
+        (report,) = (tmp_path / "out" / f"repo-org-repo-{index}").glob("*.html")
+        assert "Custom Star Chart" in report.read_text(encoding="utf-8")
+
+
+def test_export_reports_with_local_custom_exporters(tmp_path, monkeypatch):
+    disable_ai_analysis(tmp_path, monkeypatch)
+
+    # A local class can not be pickled, the reports are rendered in this process
+    class LocalStarExporter(CustomStarExporter):
+        exporter_name = "local_star_exporter"
+
+    monkeypatch.setitem(
+        ChartReportExporter.custom_exporters,
+        LocalStarExporter.exporter_name,
+        LocalStarExporter,
+    )
+    query_results = make_query_results(2)
+
+    exported = list(
+        ExportResult(
+            query_results, "report", tmp_path / "out", False, jobs=2
+        ).iter_export()
+    )
+
+    assert exported == query_results
+    for index in range(2):
+        (report,) = (tmp_path / "out" / f"repo-org-repo-{index}").glob("*.html")
+        assert "Custom Star Chart" in report.read_text(encoding="utf-8")
+
+
+def test_export_json_and_ndjson(tmp_path):
+    (query_result,) = make_query_results(1)
+
+    list(ExportResult([query_result], "json", tmp_path / "json", False).iter_export())
+    (json_file,) = (tmp_path / "json" / "repo-org-repo-0").glob("*.json")
+    assert json_file.read_text() == json.dumps(
+        {"star": {"2023-01": 6}}, indent=2, sort_keys=True
+    )
+
+    list(
+        ExportResult(
+            [query_result], "ndjson", tmp_path / "ndjson", False, compression="gzip"
+        ).iter_export()
+    )
+    (ndjson_file,) = (tmp_path / "ndjson" / "repo-org-repo-0").glob("*.ndjson.gz")
+    with gzip.open(ndjson_file, "rt", encoding="utf-8") as file:
+        assert [json.loads(line) for line in file] == [
+            {
+                "repo": "org/repo-0",
+                "indicator": "star",
+                "month": "2023-01",
+                "is_raw": False,
+                "value": 6,
+            }
+        ]
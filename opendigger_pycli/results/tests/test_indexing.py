@@ -0,0 +1,81 @@
+import random
+import typing as t
+
+from opendigger_pycli.datatypes import BaseData, IndicatorQuery, StarData
+from opendigger_pycli.results.indexing import get_month_index, iter_year_ranges
+from opendigger_pycli.results.query import query_base_data, query_trival_indicator
+
+
+def linear_query_base_data(
+    base_data_list: t.List[BaseData], indicator_queries: t.List[IndicatorQuery]
+):
+    years = {year for query in indicator_queries for year in query.years}
+    months = {month for query in indicator_queries for month in query.months}
+    year_months = {ym for query in indicator_queries for ym in query.year_months}
+    queried_data = [
+        base_data
+        for base_data in base_data_list
+        if base_data.value is not None
+        and (
+            not indicator_queries
+            or base_data.year in years
+            or base_data.month in months
+            or (base_data.year, base_data.month) in year_months
+        )
+    ]
+    success = [base_data for base_data in base_data_list if base_data.value is not None]
+    failed_years = years - {base_data.year for base_data in success}
+    failed_months = months - {base_data.month for base_data in success}
+    failed_year_months = year_months - {(d.year, d.month) for d in success}
+    if failed_years or failed_months or failed_year_months:
+        return queried_data, IndicatorQuery(
+            years=frozenset(failed_years),
+            months=frozenset(failed_months),
+            year_months=frozenset(year_months),
+        )
+    return queried_data, None
+
+
+def test_iter_year_ranges():
+    assert list(iter_year_ranges({2023, 2019, 2020, 2021, 2015})) == [
+        (2015, 2015),
+        (2019, 2021),
+        (2023, 2023),
+    ]
+
+
+def test_query_base_data_matches_linear_scan():
+    rng = random.Random(0)
+    base_data_list = [
+        BaseData(year=year, month=month, value=rng.choice([None, 1, 2]))
+        for year in range(2015, 2024)
+        for month in range(1, 13)
+        if rng.random() < 0.7
+    ]
+    for _ in range(200):
+        indicator_queries = [
+            IndicatorQuery(
+                years=frozenset(rng.sample(range(2013, 2026), rng.randint(0, 4))),
+                months=frozenset(rng.sample(range(1, 13), rng.randint(0, 2))),
+                year_months=frozenset(
+                    (rng.randint(2014, 2024), rng.randint(1, 12))
+                    for _ in range(rng.randint(0, 3))
+                ),
+            )
+            for _ in range(rng.randint(0, 2))
+        ]
+        assert query_base_data(
+            base_data_list, indicator_queries
+        ) == linear_query_base_data(base_data_list, indicator_queries)
+
+
+def test_month_index_is_kept_with_indicator_data():
+    star_data = StarData(value=[BaseData(year=2023, month=1, value=1)])
+    month_index = get_month_index(star_data.value, star_data)
+    assert get_month_index(star_data.value, star_data) is month_index
+
+    queried_star_data, failed_query = query_trival_indicator(
+        star_data, [IndicatorQuery(years=frozenset({2022, 2023}))]
+    )
+    assert queried_star_data.value == star_data.value
+    assert failed_query == IndicatorQuery(years=frozenset({2022}))
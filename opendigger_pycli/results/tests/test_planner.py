@@ -0,0 +1,94 @@
+import datetime
+import typing as t
+
+from opendigger_pycli.datatypes import IndicatorQuery
+from opendigger_pycli.results.planner import (
+    get_query_dates,
+    group_indicator_queries,
+    plan_fetches,
+)
+
+
+class FakeDataloader:
+    def __init__(self, name: str, pass_date: bool = False):
+        self.name = name
+        self.pass_date = pass_date
+
+
+TODAY = datetime.date(2023, 3, 15)
+
+
+def test_get_query_dates_skips_months_without_data():
+    queries = [
+        IndicatorQuery(months=frozenset({2})),
+        IndicatorQuery(years=frozenset({2014, 2023})),
+        IndicatorQuery(year_months=frozenset({(2022, 7), (2024, 1)})),
+    ]
+    dates = get_query_dates(queries, TODAY)
+    assert dates == sorted(
+        {(year, 2) for year in range(2015, 2024)}
+        | {(2023, 1), (2023, 2), (2023, 3), (2022, 7)}
+    )
+
+
+def test_plan_fetches():
+    stars = FakeDataloader("stars")
+    openrank = FakeDataloader("openrank")
+    network = FakeDataloader("project_openrank_detail", pass_date=True)
+    dataloaders = t.cast(t.Any, [stars, openrank, network])
+
+    fetch_plans = plan_fetches(
+        ("org", "repo"),
+        dataloaders,
+        group_indicator_queries(
+            [
+                ("stars", IndicatorQuery(years=frozenset({2030}))),
+                ("openrank", None),
+                ("project_openrank_detail", IndicatorQuery(years=frozenset({2023}))),
+            ]
+        ),
+        None,
+        today=TODAY,
+    )
+    assert [fetch_plan.is_skipped for fetch_plan in fetch_plans] == [
+        False,
+        False,
+        False,
+    ]
+    assert fetch_plans[0].load_args == ("org", "repo")
+    assert fetch_plans[1].load_args == ("org", "repo")
+    assert fetch_plans[2].load_args == (
+        "org",
+        "repo",
+        [(2023, 1), (2023, 2), (2023, 3)],
+    )
+
+    fetch_plans = plan_fetches(
+        ("org", "repo"),
+        dataloaders,
+        {},
+        IndicatorQuery(year_months=frozenset({(2022, 12)})),
+        today=TODAY,
+    )
+    assert [fetch_plan.load_args for fetch_plan in fetch_plans] == [
+        ("org", "repo"),
+        ("org", "repo"),
+        ("org", "repo", [(2022, 12)]),
+    ]
+    assert plan_fetches(("org", "repo"), [network], {}, None)[0].is_skipped
+
+
+def test_plan_fetches_without_matching_dates():
+    stars = FakeDataloader("stars")
+    network = FakeDataloader("project_openrank_detail", pass_date=True)
+    fetch_plans = plan_fetches(
+        ("org", "repo"),
+        t.cast(t.Any, [stars, network]),
+        {},
+        IndicatorQuery(years=frozenset({2010, 2030})),
+        today=TODAY,
+    )
+    # The full series is still fetched to report the query as failed
+    assert fetch_plans[0].load_args == ("org", "repo")
+    assert fetch_plans[1].is_skipped
+    assert fetch_plans[1].skip_reason is not None
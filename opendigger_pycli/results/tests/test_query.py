@@ -0,0 +1,121 @@
+import threading
+import typing as t
+
+import pytest
+
+from opendigger_pycli.dataloaders.metrics import StarRepoDataloader
+from opendigger_pycli.dataloaders.sources import MemoryDataSource, configure_data_source
+from opendigger_pycli.dataloaders.utils import configure_columnar_series
+from opendigger_pycli.datatypes import (
+    BaseData,
+    ColumnarSeries,
+    DataloaderResult,
+    IndicatorQuery,
+    StarData,
+)
+from opendigger_pycli.results.query import RepoQueryResult, run_dataloader
+
+
+class FakeRepoDataloader:
+    pass_date = False
+    indicator_type = "metric"
+    introducer = "X-lab"
+    type = "repo"
+    demo_url = ""
+
+    def __init__(self, name: str, barrier: t.Optional[threading.Barrier] = None):
+        self.name = name
+        self.barrier = barrier
+
+    def load(self, org: str, repo: str) -> DataloaderResult:
+        if self.barrier is not None:
+            # Every dataloader waits for the others,
+            # which only succeeds if they run concurrently.
+            self.barrier.wait(timeout=5)
+        return DataloaderResult(
+            is_success=True,
+            dataloader=t.cast(t.Any, self),
+            data=StarData(value=[BaseData(year=2023, month=1, value=1)]),
+            desc="",
+        )
+
+
+def test_run_dataloader_concurrently():
+    barrier = threading.Barrier(3)
+    dataloaders = [FakeRepoDataloader(f"fake_{i}", barrier) for i in range(3)]
+    result = RepoQueryResult(
+        repo=("X-lab2017", "open-digger"),
+        dataloaders=t.cast(t.Any, dataloaders),
+        indicator_queries=[],
+        uniform_query=None,
+    )
+    assert list(result.data) == ["fake_0", "fake_1", "fake_2"]
+    assert all(data.is_success for data in result.data.values())
+
+
+def test_run_dataloader_keeps_order_with_one_worker():
+    dataloaders = [FakeRepoDataloader(f"fake_{i}") for i in range(5)]
+    result = RepoQueryResult(
+        repo=("X-lab2017", "open-digger"),
+        dataloaders=t.cast(t.Any, dataloaders),
+        indicator_queries=[],
+        uniform_query=None,
+    )
+    result.data.clear()
+    run_dataloader(result, max_workers=1)
+    assert list(result.data) == [f"fake_{i}" for i in range(5)]
+
+
+def test_query_without_matching_dates_is_failed():
+    configure_data_source(
+        MemoryDataSource({"org/repo/stars.json": {"2023-01": 1, "2023-02": 2}})
+    )
+    try:
+        result = RepoQueryResult(
+            repo=("org", "repo"),
+            dataloaders=[StarRepoDataloader()],
+            indicator_queries=[
+                ("star", IndicatorQuery(years=frozenset({2030}))),
+                ("star", IndicatorQuery(years=frozenset({2010}))),
+            ],
+            uniform_query=None,
+        )
+    finally:
+        configure_data_source(None)
+
+    assert result.data["star"].is_success
+    assert list(result.queried_data["star"].data.value) == []
+    failed_query = result.failed_query["star"]
+    assert failed_query is not None
+    assert failed_query.years == frozenset({2010, 2030})
+
+
+def test_query_columnar_series():
+    pytest.importorskip("numpy")
+    stars = {"2022-12": 3, "2023-01": 1, "2023-02": 2, "2023-02-raw": 5}
+    configure_data_source(MemoryDataSource({"org/repo/stars.json": stars}))
+    configure_columnar_series(True)
+    try:
+        result = RepoQueryResult(
+            repo=("org", "repo"),
+            dataloaders=[StarRepoDataloader()],
+            indicator_queries=[
+                ("star", IndicatorQuery(years=frozenset({2023, 2030}))),
+            ],
+            uniform_query=None,
+        )
+    finally:
+        configure_data_source(None)
+        configure_columnar_series(None)
+
+    star_data = result.data["star"].data
+    assert star_data is not None
+    assert isinstance(star_data.value, ColumnarSeries)
+    assert list(result.queried_data["star"].data.value) == [
+        BaseData(year=2023, month=1, value=1),
+        BaseData(year=2023, month=2, value=5, is_raw=True),
+        BaseData(year=2023, month=2, value=2),
+    ]
+    failed_query = result.failed_query["star"]
+    assert failed_query is not None
+    assert failed_query.years == frozenset({2030})
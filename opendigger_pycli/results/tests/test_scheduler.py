@@ -0,0 +1,43 @@
+import threading
+import time
+import typing as t
+
+from opendigger_pycli.results.scheduler import schedule_query_results
+
+
+def test_schedule_query_results_streams_finished_results():
+    first_finished = threading.Event()
+
+    def build_query_result(target, progress):
+        if target == "slow":
+            # The slow target can only finish after the fast one was consumed
+            assert first_finished.wait(timeout=5)
+        time.sleep(0.01)
+        return target
+
+    results = schedule_query_results(["slow", "fast"], build_query_result, 2)
+    assert next(results) == "fast"
+    first_finished.set()
+    assert list(results) == ["slow"]
+
+
+def test_schedule_query_results_without_targets():
+    assert list(schedule_query_results([], lambda target, progress: target, 2)) == []
+
+
+def test_schedule_query_results_bounds_and_cancels_targets():
+    started: t.List[int] = []
+    lock = threading.Lock()
+
+    def build_query_result(target, progress):
+        with lock:
+            started.append(target)
+        return target
+
+    results = schedule_query_results(list(range(100)), build_query_result, 2)
+    next(results)
+    # At most two windows of targets were submitted ahead of the consumer
+    assert len(started) <= 2 * 2 * 2
+    results.close()
+    # The queued targets were cancelled instead of being queried
+    assert len(started) <= 2 * 2 * 2
@@ -0,0 +1,70 @@
+import copy
+import pickle
+
+from opendigger_pycli.datatypes import (
+    BaseData,
+    IndicatorQuery,
+    IssueResponseTimeData,
+    TimeDurationRelatedIndicatorDict,
+)
+from opendigger_pycli.exporters.json_exporter import export_indicator_to_json
+from opendigger_pycli.results.query import query_non_trivial_indicator
+from opendigger_pycli.results.views import FilteredView, LazyMapping
+
+
+def test_filtered_view_copy_on_write():
+    source = [BaseData(year=2023, month=month, value=month) for month in range(1, 7)]
+    view = FilteredView(source, [1, 3, 5])
+    assert view == [source[1], source[3], source[5]]
+    assert view[-1] is source[5]
+    assert view[1:] == [source[3], source[5]]
+
+    view.append(BaseData(year=2023, month=12, value=12))
+    del view[0]
+    view.sort(key=lambda base_data: -base_data.month)
+    assert [base_data.month for base_data in view] == [12, 6, 4]
+    assert len(source) == 6
+
+    assert pickle.loads(pickle.dumps(view)) == view
+    assert type(copy.deepcopy(view)) is list
+
+
+def test_query_non_trivial_indicator_does_not_copy():
+    base_data_lists = {
+        key: [BaseData(year=2023, month=month, value=1.0) for month in range(1, 4)]
+        for key in ("avg", "quantile0", "quantile1", "quantile2")
+        + ("quantile3", "quantile4")
+    }
+    base_data_lists["levels"] = [BaseData(year=2023, month=1, value=[1, 2])]
+    indicator_data = IssueResponseTimeData(
+        value=TimeDurationRelatedIndicatorDict(**base_data_lists)  # type: ignore
+    )
+
+    queried_data, failed_queries = query_non_trivial_indicator(
+        indicator_data, [IndicatorQuery(year_months=frozenset({(2023, 2)}))]
+    )
+    assert queried_data.value["avg"][0] is indicator_data.value["avg"][1]
+    assert failed_queries["avg"] is None
+    assert failed_queries["levels"] is not None
+    assert len(indicator_data.value["avg"]) == 3
+
+    assert export_indicator_to_json(queried_data)["avg"] == {"2023-02": 1.0}
+
+
+def test_lazy_mapping_computes_values_once_on_access():
+    computed = []
+
+    def compute(key):
+        computed.append(key)
+        return key * 2
+
+    mapping = LazyMapping(["a", "b"], compute)
+    assert list(mapping) == ["a", "b"] and "b" in mapping and "c" not in mapping
+    assert not computed
+
+    assert mapping["a"] == "aa" and mapping["a"] == "aa"
+    assert computed == ["a"]
+    assert mapping.get("c") is None
+
+    assert pickle.loads(pickle.dumps(mapping)) == {"a": "aa", "b": "bb"}
+    assert computed == ["a", "b"]
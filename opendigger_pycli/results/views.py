@@ -0,0 +1,143 @@
+import threading
+import typing as t
+
+T = t.TypeVar("T")
+
+
+class FilteredView(t.MutableSequence[T]):
+    """
+    A list-like view of the items of ``source`` at ``positions``.
+
+    Query results are views of the loaded data, so that querying does not
+    copy any items. The view is copied into its own list the first time it
+    is changed (copy-on-write), the source list is never changed. Pickling
+    or deep copying a view gives a plain list.
+    """
+
+    __slots__ = ("_source", "_positions", "_items")
+
+    def __init__(self, source: t.Sequence[T], positions: t.Sequence[int]) -> None:
+        self._source = source
+        self._positions = positions
+        self._items: t.Optional[t.List[T]] = None
+
+    @classmethod
+    def of(cls, source: t.Sequence[T]) -> "FilteredView[T]":
+        """A view of all items of ``source``"""
+        return cls(source, range(len(source)))
+
+    def _materialize(self) -> t.List[T]:
+        if self._items is None:
+            self._items = [self._source[position] for position in self._positions]
+        return self._items
+
+    @t.overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "FilteredView[T]":
+        ...
+
+    def __getitem__(self, index):
+        if self._items is not None:
+            if isinstance(index, slice):
+                return FilteredView(self._items, range(len(self._items))[index])
+            return self._items[index]
+        if isinstance(index, slice):
+            return FilteredView(self._source, self._positions[index])
+        return self._source[self._positions[index]]
+
+    def __setitem__(self, index, value) -> None:
+        self._materialize()[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: T) -> None:
+        self._materialize().insert(index, value)
+
+    def sort(self, *args: t.Any, **kwargs: t.Any) -> None:
+        self._materialize().sort(*args, **kwargs)
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return len(self._positions)
+
+    def __iter__(self) -> t.Iterator[T]:
+        if self._items is not None:
+            return iter(self._items)
+        source = self._source
+        return (source[position] for position in self._positions)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (FilteredView, list)):
+            return len(self) == len(other) and all(
+                item == other_item for item, other_item in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+K = t.TypeVar("K")
+V = t.TypeVar("V")
+
+
+class LazyMapping(t.Mapping[K, V]):
+    """
+    A read-only mapping whose keys are known up front and whose values are
+    computed by ``compute(key)`` the first time they are accessed.
+    Computed values are kept, pickling gives a plain dict.
+    """
+
+    __slots__ = ("_keys", "_compute", "_values", "_lock")
+
+    def __init__(self, keys: t.Iterable[K], compute: t.Callable[[K], V]) -> None:
+        self._keys = dict.fromkeys(keys)
+        self._compute = compute
+        self._values: t.Dict[K, V] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: K) -> V:
+        if key not in self._keys:
+            raise KeyError(key)
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self._compute(key)
+            return self._values[key]
+
+    def is_computed(self, key: K) -> bool:
+        return key in self._values
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> t.Iterator[K]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{key!r}: {self._values[key]!r}"
+            if key in self._values
+            else f"{key!r}: ..."
+            for key in self._keys
+        )
+        return f"{{{items}}}"
@@ -1,4 +1,4 @@
-import requests
+from .http import http_get
 
 
 def exist_gh_repo(org_name: str, repo_name: str) -> bool:
@@ -6,7 +6,7 @@ def exist_gh_repo(org_name: str, repo_name: str) -> bool:
     Check if a repo exists on GitHub
     """
     url = f"https://github.com/{org_name}/{repo_name}"
-    resp = requests.get(url)
+    resp = http_get(url)
     return resp.status_code == 200
 
 
@@ -15,5 +15,5 @@ def exist_gh_user(username: str) -> bool:
     Check if a user exists on GitHub
     """
     url = f"https://github.com/{username}"
-    resp = requests.get(url)
+    resp = http_get(url)
     return resp.status_code == 200
@@ -1,6 +1,6 @@
 import typing as t
 
-import requests
+from .http import http_get, http_post
 
 _GITHUB_API_BASE_URL = "https://api.github.com"
 
@@ -46,12 +46,12 @@ def get_repo_info(
     url = f"{_GITHUB_API_BASE_URL}/repos/{org_name}/{repo_name}"
 
     if github_pat is not None:
-        response = requests.get(
+        response = http_get(
             url,
             headers={"Authorization": f"token {github_pat}"},
         )
     else:
-        response = requests.get(url)
+        response = http_get(url)
 
     if response.status_code != 200:
         return False, RepoInfoType(
@@ -80,9 +80,9 @@ def get_user_info(
     url = f"{_GITHUB_API_BASE_URL}/users/{username}"
 
     if github_pat is not None:
-        response = requests.get(url, headers={"Authorization": f"token {github_pat}"})
+        response = http_get(url, headers={"Authorization": f"token {github_pat}"})
     else:
-        response = requests.get(url)
+        response = http_get(url)
 
     if response.status_code != 200:
         return False, UserInfoType(
@@ -127,7 +127,7 @@ def create_issue(
     if body:
         data["body"] = body
 
-    response = requests.post(
+    response = http_post(
         url=url,
         headers={"Authorization": f"token {github_pat}"},
         json=data,
@@ -148,7 +148,7 @@ def create_issue(
 
 
 def create_issue_comment(issue_api_url: str, body: str, github_pat: str) -> bool:
-    response = requests.post(
+    response = http_post(
         url=f"{issue_api_url}/comments",
         json={"body": body},
         headers={"Authorization": f"token {github_pat}"},
@@ -166,7 +166,7 @@ def create_issue_comment_reactions(
 ) -> bool:
     url = f"{issue_cooment_api_url}/reactions"
 
-    response = requests.post(
+    response = http_post(
         url=url,
         json={"content": content},
         headers={"Authorization": f"token {github_pat}"},
@@ -178,7 +178,7 @@ def create_issue_comment_reactions(
 def get_issue_comments(
     issue_api_url: str, github_pat: str
 ) -> t.Tuple[bool, t.List[IssueCommentInfoType]]:
-    response = requests.get(
+    response = http_get(
         f"{issue_api_url}/comments", headers={"Authorization": f"token {github_pat}"}
     )
 
@@ -220,7 +220,7 @@ def search_issue_title(
     for label in labels:
         query_str += f" label:{label}"
 
-    response = requests.get(
+    response = http_get(
         url=url,
         params={"q": query_str},
         headers={"Authorization": f"token {github_pat}"},
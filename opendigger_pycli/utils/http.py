@@ -0,0 +1,79 @@
+import threading
+import typing as t
+
+from opendigger_pycli.config.utils import (
+    get_fetch_concurrency,
+    get_http_timeouts,
+    get_max_in_flight_requests,
+    get_retry_settings,
+)
+
+from .limiter import get_request_limiter
+
+if t.TYPE_CHECKING:
+    import requests
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_http_session: t.Optional["requests.Session"] = None
+_http_timeouts: t.Tuple[float, float] = (5.0, 30.0)
+_http_session_lock = threading.Lock()
+
+
+def _build_http_session() -> "requests.Session":
+    # requests is imported with the first request, not at startup
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    max_retries, backoff_factor = get_retry_settings()
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        # Only idempotent requests are retried, POST requests create GitHub issues
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # Every thread may hold a connection, so the pool is sized to the fetch concurrency
+    pool_size = max(get_fetch_concurrency(), get_max_in_flight_requests())
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> "requests.Session":
+    """
+    Return the process-wide HTTP session, connections are kept alive
+    and reused by all requests to the same host.
+    """
+    global _http_session, _http_timeouts
+
+    with _http_session_lock:
+        if _http_session is None:
+            _http_timeouts = get_http_timeouts()
+            _http_session = _build_http_session()
+        return _http_session
+
+
+def request(method: str, url: str, **kwargs: t.Any) -> "requests.Response":
+    session = get_http_session()
+    kwargs.setdefault("timeout", _http_timeouts)
+    with get_request_limiter().limit(url):
+        return session.request(method, url, **kwargs)
+
+
+def http_get(url: str, **kwargs: t.Any) -> "requests.Response":
+    return request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs: t.Any) -> "requests.Response":
+    return request("POST", url, **kwargs)
@@ -0,0 +1,82 @@
+import json
+import threading
+import typing as t
+
+JsonDecoder = t.Callable[[bytes], t.Any]
+
+
+def _load_stdlib(body: bytes) -> t.Any:
+    # json.loads detects the encoding of bytes itself
+    return json.loads(body)
+
+
+def _import_orjson() -> JsonDecoder:
+    import orjson
+
+    # orjson parses the bytes buffer directly, without decoding it to a str
+    return orjson.loads
+
+
+# Decoders by name, the first importable one is the default
+JSON_DECODERS: t.Dict[str, t.Callable[[], JsonDecoder]] = {
+    "orjson": _import_orjson,
+    "json": lambda: _load_stdlib,
+}
+
+_json_decoder: t.Optional[t.Tuple[str, JsonDecoder]] = None
+_json_decoder_lock = threading.Lock()
+
+
+def register_json_decoder(
+    name: str, import_decoder: t.Callable[[], JsonDecoder], prefer: bool = False
+) -> None:
+    """
+    Register a decoder, ``import_decoder`` returns a function which parses
+    a JSON document from bytes, or raises ImportError if it is not installed.
+    """
+    global JSON_DECODERS
+
+    if prefer:
+        JSON_DECODERS = {name: import_decoder, **JSON_DECODERS}
+    else:
+        JSON_DECODERS[name] = import_decoder
+    configure_json_decoder(None)
+
+
+def import_json_decoder(name: str) -> JsonDecoder:
+    if name not in JSON_DECODERS:
+        raise ValueError(
+            f"Unknown JSON decoder {name}, available: {list(JSON_DECODERS)}"
+        )
+    return JSON_DECODERS[name]()
+
+
+def configure_json_decoder(name: t.Optional[str]) -> None:
+    """Use the decoder ``name``, or the fastest installed one if it is None"""
+    global _json_decoder
+
+    decoder = None if name is None else (name, import_json_decoder(name))
+    with _json_decoder_lock:
+        _json_decoder = decoder
+
+
+def get_json_decoder() -> t.Tuple[str, JsonDecoder]:
+    """The name and the function of the decoder in use"""
+    global _json_decoder
+
+    with _json_decoder_lock:
+        if _json_decoder is None:
+            for name, import_decoder in JSON_DECODERS.items():
+                try:
+                    _json_decoder = (name, import_decoder())
+                    break
+                except ImportError:
+                    continue
+            else:
+                _json_decoder = ("json", _load_stdlib)
+        return _json_decoder
+
+
+def loads(body: bytes) -> t.Any:
+    """Parse a JSON document from the bytes of a response or a file"""
+    return get_json_decoder()[1](body)
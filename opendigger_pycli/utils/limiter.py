@@ -0,0 +1,52 @@
+import threading
+import typing as t
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from opendigger_pycli.config.utils import (
+    get_max_in_flight_requests,
+    get_max_requests_per_host,
+)
+
+
+class RequestLimiter:
+    """
+    Limit the number of in-flight requests,
+    both for the whole process and for every single host.
+    """
+
+    def __init__(self, max_in_flight: int, max_per_host: int) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_per_host = max_per_host
+        self._global_semaphore = threading.BoundedSemaphore(max_in_flight)
+        self._host_semaphores: t.DefaultDict[
+            str, threading.BoundedSemaphore
+        ] = defaultdict(lambda: threading.BoundedSemaphore(max_per_host))
+        self._lock = threading.Lock()
+
+    def _get_host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            return self._host_semaphores[host]
+
+    @contextmanager
+    def limit(self, url: str) -> t.Iterator[None]:
+        host_semaphore = self._get_host_semaphore(url)
+        with self._global_semaphore, host_semaphore:
+            yield
+
+
+_REQUEST_LIMITER: t.Optional[RequestLimiter] = None
+_REQUEST_LIMITER_LOCK = threading.Lock()
+
+
+def get_request_limiter() -> RequestLimiter:
+    global _REQUEST_LIMITER
+
+    with _REQUEST_LIMITER_LOCK:
+        if _REQUEST_LIMITER is None:
+            _REQUEST_LIMITER = RequestLimiter(
+                get_max_in_flight_requests(), get_max_requests_per_host()
+            )
+        return _REQUEST_LIMITER
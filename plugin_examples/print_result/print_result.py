@@ -13,6 +13,7 @@ if t.TYPE_CHECKING:
 @click.command("print-result", help="[Plugin Demo] Print query result to terminal")
 @processor
 def print_result(results: QueryResults):
-    # 输出结果
-    CONSOLE.print(results)
-    yield from results
+    # 输出结果（查询结果以流的形式逐个传入）
+    for result in results:
+        CONSOLE.print(result)
+        yield result